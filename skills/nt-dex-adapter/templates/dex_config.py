@@ -34,12 +34,23 @@ class MyDEXInstrumentProviderConfig(InstrumentProviderConfig, frozen=True):
         Specific pool contract addresses to load. If empty, loads all known pools.
     sandbox_mode : bool
         If True, uses testnet RPC and skips chain calls in tests.
+    factory_deploy_block : int
+        Block the pool factory was deployed at. Pool discovery scans
+        PoolCreated logs from here instead of from genesis.
+    log_range_blocks : int
+        Block span per eth_getLogs request. Keep below your provider's limit
+        (commonly 10k blocks or 10k results).
+    max_concurrent_log_requests : int
+        Upper bound on in-flight eth_getLogs requests during discovery.
     """
 
     rpc_url: str = "https://mainnet.infura.io/v3/YOUR_PROJECT_ID"
     chain_id: int = 1
     pools: list[str] = []      # Empty → load all known pools
     sandbox_mode: bool = False
+    factory_deploy_block: int = 0
+    log_range_blocks: int = 10_000
+    max_concurrent_log_requests: int = 8
 
 
 # =============================================================================
@@ -66,6 +77,16 @@ class MyDEXDataClientConfig(LiveDataClientConfig, frozen=True):
     poll_interval_secs : float
         Seconds between RPC polls (if WS not available). Reduce for fresher data,
         but watch RPC rate limits.
+    multicall3_address : str
+        Multicall3 contract used to read every subscribed pool in one eth_call.
+        The canonical deployment shares this address on most EVM chains.
+    batch_size : int
+        Maximum pools read per RPC request. Larger polls are split into
+        chunks of this size which are sent concurrently.
+    use_rpc_batch : bool
+        If True, send JSON-RPC array batches of eth_call instead of a
+        Multicall3 aggregate. Some providers bill and serialise each
+        sub-call of an array batch, so Multicall3 is the default.
     sandbox_mode : bool
         If True, uses mock/testnet data instead of mainnet.
     """
@@ -75,6 +96,9 @@ class MyDEXDataClientConfig(LiveDataClientConfig, frozen=True):
     chain_id: int = 1
     pool_addresses: list[str] = []
     poll_interval_secs: float = 2.0     # Poll every 2 seconds (rate-limit friendly)
+    multicall3_address: str = "0xcA11bde05977b3631167028862bE2a173976CA11"
+    batch_size: int = 50                # Pools per eth_call
+    use_rpc_batch: bool = False         # JSON-RPC array batch instead of Multicall3
     sandbox_mode: bool = False
 
 
@@ -7,7 +7,7 @@ Converts pool state (AMM reserves, on-chain events) into Nautilus data objects.
 Phase 3 of the 7-phase DEX adapter implementation sequence.
 
 Key differences from CeFi data clients:
-- No WebSocket streams (usually) → polling-based data updates
+- Pool events via eth_subscribe when a WS RPC is configured, batched polling otherwise
 - Pool state → QuoteTick (AMM price synthesis)
 - On-chain swap events → TradeTick
 - AMM state deltas → OrderBookDelta (optional, for CLOB DEX)
@@ -25,6 +25,7 @@ if str(_TEMPLATE_DIR) not in sys.path:
 
 from nautilus_trader.cache.cache import Cache
 from nautilus_trader.common.component import LiveClock, MessageBus
+from nautilus_trader.core.nautilus_pyo3 import HttpClient
 from nautilus_trader.core.uuid import UUID4
 from nautilus_trader.live.data_client import LiveMarketDataClient
 from nautilus_trader.model.data import (
@@ -39,12 +40,17 @@ from nautilus_trader.model.enums import AggressorSide
 from nautilus_trader.model.identifiers import ClientId, InstrumentId, TradeId, Venue
 from nautilus_trader.model.objects import Price, Quantity
 
+# keccak256("Sync(uint112,uint112)") — emitted by V2-style pools on every reserve change
+SYNC_TOPIC = "0x1c411e9a96e071241c2f21f7726b17ae89e3cab4c78be50e062b03a9fffbbad1"
+
 try:
     from .dex_config import MyDEXDataClientConfig
     from .dex_instrument_provider import MyDEXInstrumentProvider
+    from .dex_order_book_builder import PriceLevelCache
 except ImportError:
     from dex_config import MyDEXDataClientConfig
     from dex_instrument_provider import MyDEXInstrumentProvider
+    from dex_order_book_builder import PriceLevelCache
 
 
 class MyDEXDataClient(LiveMarketDataClient):
@@ -72,6 +78,9 @@ class MyDEXDataClient(LiveMarketDataClient):
         Loaded instrument definitions.
     config : MyDEXDataClientConfig
         Client configuration.
+    http_client : HttpClient, optional
+        Keep-alive RPC client shared with the execution client. If None, a
+        private one is created.
     """
 
     def __init__(
@@ -83,6 +92,7 @@ class MyDEXDataClient(LiveMarketDataClient):
         clock: LiveClock,
         instrument_provider: MyDEXInstrumentProvider,
         config: MyDEXDataClientConfig,
+        http_client: HttpClient | None = None,
     ) -> None:
         super().__init__(
             client_id=client_id,
@@ -93,13 +103,26 @@ class MyDEXDataClient(LiveMarketDataClient):
         )
         self._instrument_provider = instrument_provider
         self._config = config
-
-        # Pool subscriptions: instrument_id → polling task
-        self._poll_tasks: dict[InstrumentId, asyncio.Task] = {}
-        # NOTE: Wrap your RPC client in a MyDEXHttpClient that uses
+        self._http_client = http_client or HttpClient(timeout_secs=10)
+
+        # Pool subscriptions, all served by one batched polling task
+        self._polled_pools: dict[InstrumentId, None] = {}
+        self._poll_task: asyncio.Task | None = None
+
+        # Priced book levels per pool; pass as level_cache to build_order_book_snapshot()
+        self._level_cache = PriceLevelCache()
+
+        # Pool event stream: pool address → instrument_id for decoding logs, and
+        # instrument_id → eth_subscribe id (None while the request is in flight)
+        self._ws_task: asyncio.Task | None = None
+        self._ws_connected = False  # Socket open, new pools subscribe directly
+        self._ws_live = False  # Every pool subscribed, polling stays idle
+        self._pools_by_address: dict[str, InstrumentId] = {}
+        self._ws_subscriptions: dict[InstrumentId, str | None] = {}
+        # NOTE: Send RPC requests through self._http_client, the
         # nautilus_network::http::HttpClient (via PyO3), NOT reqwest::Client directly.
         # This gives you built-in rate limiting, retry logic, and consistent error handling.
-        # self._http_client = MyDEXHttpClient(rpc_url=config.rpc_url)
+        # Use config.chain_id rather than an eth_chainId preflight per request.
         # self._ws_client: MyDEXWebSocketClient | None = None
 
     # ─── LIFECYCLE ─────────────────────────────────────────────────────────────
@@ -119,19 +142,22 @@ class MyDEXDataClient(LiveMarketDataClient):
             f"Loaded {len(self._instrument_provider.get_all())} instruments from MyDEX"
         )
 
-        # Optional: connect to WS RPC for event subscriptions
-        # if self._config.ws_rpc_url:
-        #     self._ws_client = MyDEXWebSocketClient(self._config.ws_rpc_url)
-        #     await self._ws_client.connect()
+        # Prefer pushed pool events over polling when a WS RPC is configured
+        if self._config.ws_rpc_url:
+            self._ws_task = asyncio.ensure_future(self._stream_pool_events())
 
     async def _disconnect(self) -> None:
-        """Disconnect and cancel all polling tasks."""
-        for task in self._poll_tasks.values():
-            task.cancel()
-        self._poll_tasks.clear()
-
-        # if self._ws_client:
-        #     await self._ws_client.disconnect()
+        """Disconnect and cancel the polling and event stream tasks."""
+        self._polled_pools.clear()
+        if self._poll_task:
+            self._poll_task.cancel()
+            self._poll_task = None
+        if self._ws_task:
+            self._ws_task.cancel()
+            self._ws_task = None
+        self._ws_connected = False
+        self._ws_live = False
+        self._ws_subscriptions.clear()
 
     # ─── SUBSCRIPTIONS ─────────────────────────────────────────────────────────
 
@@ -139,17 +165,21 @@ class MyDEXDataClient(LiveMarketDataClient):
         """
         Subscribe to quote ticks for a pool.
 
-        Starts a polling loop that fetches pool reserves at the configured
-        interval and synthesises QuoteTick objects.
+        Adds the pool to the batched polling loop, which fetches the reserves
+        of every subscribed pool at the configured interval and synthesises
+        QuoteTick objects.
         """
         instrument_id = command.instrument_id
-        if instrument_id in self._poll_tasks:
+        if instrument_id in self._polled_pools:
             return  # Already subscribed
 
         self.log.info(f"Subscribing to quote ticks: {instrument_id}")
 
-        task = asyncio.ensure_future(self._poll_pool_state(instrument_id))
-        self._poll_tasks[instrument_id] = task
+        self._polled_pools[instrument_id] = None
+        if self._ws_connected:
+            await self._ws_subscribe_pool(instrument_id)
+        if self._poll_task is None:
+            self._poll_task = asyncio.ensure_future(self._poll_pool_states())
 
     async def _subscribe_trade_ticks(self, command) -> None:
         """
@@ -180,9 +210,12 @@ class MyDEXDataClient(LiveMarketDataClient):
 
     async def _unsubscribe_quote_ticks(self, command) -> None:
         instrument_id = command.instrument_id
-        task = self._poll_tasks.pop(instrument_id, None)
-        if task:
-            task.cancel()
+        self._polled_pools.pop(instrument_id, None)
+        if self._ws_connected:
+            await self._ws_unsubscribe_pool(instrument_id)
+        if not self._polled_pools and self._poll_task:
+            self._poll_task.cancel()
+            self._poll_task = None
 
     async def _unsubscribe_trade_ticks(self, command) -> None:
         instrument_id = command.instrument_id
@@ -211,33 +244,189 @@ class MyDEXDataClient(LiveMarketDataClient):
 
     # ─── POLLING LOOP ──────────────────────────────────────────────────────────
 
-    async def _poll_pool_state(self, instrument_id: InstrumentId) -> None:
+    async def _poll_pool_states(self) -> None:
         """
-        Continuously poll pool state and emit QuoteTick objects.
+        Continuously poll every subscribed pool and emit QuoteTick objects.
 
-        Runs until the task is cancelled (on unsubscribe or disconnect).
+        Runs until the task is cancelled (on last unsubscribe or disconnect).
+        While the pool event stream is live the loop stays idle, so polling
+        only serves as the fallback when the WebSocket is down.
 
-        Each poll:
-        1. Fetches pool reserves from RPC
-        2. Synthesises bid/ask from AMM formula
-        3. Emits QuoteTick via self._handle_quote_tick()
+        Each poll reads all pools with one RPC request per ``batch_size``
+        chunk instead of one eth_call per pool, so a tick costs a single
+        round-trip however many pools are subscribed. Chunks are sent
+        concurrently so one slow chunk does not hold up the rest.
         """
+        batch_size = self._config.batch_size
         while True:
             try:
                 await asyncio.sleep(self._config.poll_interval_secs)
-
-                # Fetch pool reserves (implement with your RPC client)
-                # reserves = await self._http_client.fetch_pool_reserves(pool_address)
-                # quote_tick = self._reserves_to_quote_tick(instrument_id, reserves)
-                # self._handle_quote_tick(quote_tick)
+                if self._ws_live:
+                    continue
+
+                instrument_ids = list(self._polled_pools)
+                chunks = [
+                    instrument_ids[i : i + batch_size]
+                    for i in range(0, len(instrument_ids), batch_size)
+                ]
+                results = await asyncio.gather(
+                    *(self._fetch_pool_reserves(chunk) for chunk in chunks),
+                )
+
+                # Results come back in call order — decode positionally
+                for chunk, reserves in zip(chunks, results):
+                    for instrument_id, (reserve0, reserve1) in zip(chunk, reserves):
+                        self._on_pool_update(instrument_id, reserve0, reserve1)
 
             except asyncio.CancelledError:
                 break
+            except NotImplementedError as e:
+                # Template stub left in place — retrying would only repeat this error
+                self.log.error(f"Pool polling stopped: {e}")
+                break
             except Exception as e:
-                self.log.error(f"Error polling pool {instrument_id}: {e}")
+                self.log.error(f"Error polling pools: {e}")
                 # Backoff and retry
                 await asyncio.sleep(self._config.poll_interval_secs * 2)
 
+    def _on_pool_update(self, instrument_id: InstrumentId, reserve0: int, reserve1: int) -> None:
+        """Emit a QuoteTick for freshly read pool reserves."""
+        quote_tick = self._reserves_to_quote_tick(instrument_id, reserve0, reserve1)
+        self._handle_quote_tick(quote_tick)
+
+    async def _fetch_pool_reserves(
+        self,
+        instrument_ids: list[InstrumentId],
+    ) -> list[tuple[int, int]]:
+        """
+        Fetch raw ``(reserve0, reserve1)`` for each pool in one RPC request.
+
+        Implement using your RPC client. By default, ABI-encode one
+        ``getReserves()`` call per pool into ``Multicall3.aggregate3(calls)``
+        on ``config.multicall3_address`` and submit a single eth_call. With
+        ``config.use_rpc_batch``, POST a JSON-RPC array of eth_call objects
+        instead. Either way, return results in the order of ``instrument_ids``.
+        """
+        raise NotImplementedError("Implement _fetch_pool_reserves()")
+
+    # ─── EVENT STREAM ──────────────────────────────────────────────────────────
+
+    async def _stream_pool_events(self) -> None:
+        """
+        Stream Sync logs for every subscribed pool over the WS RPC.
+
+        Sync logs carry the pool's full post-trade reserves, so each one is
+        turned into a QuoteTick directly, with no eth_call and no wait for
+        the next poll. When the socket drops, polling takes over and the
+        stream reconnects with exponential backoff.
+        """
+        backoff = self._config.poll_interval_secs
+        while True:
+            try:
+                await self._ws_connect()
+                # Subscriptions die with the old socket
+                self._pools_by_address.clear()
+                self._ws_subscriptions.clear()
+                # Pools added while the snapshot below is re-subscribed are
+                # subscribed by _subscribe_quote_ticks once this is set
+                self._ws_connected = True
+                for instrument_id in list(self._polled_pools):
+                    await self._ws_subscribe_pool(instrument_id)
+                self._ws_live = True
+                backoff = self._config.poll_interval_secs
+
+                while True:
+                    self._on_ws_message(await self._ws_recv())
+
+            except asyncio.CancelledError:
+                break
+            except NotImplementedError as e:
+                # Hand the pools back to polling rather than retrying a stub
+                self.log.error(f"Pool event stream stopped: {e}")
+                self._ws_connected = False
+                self._ws_live = False
+                break
+            except Exception as e:
+                self.log.warning(f"Pool event stream dropped, polling until reconnected: {e}")
+
+            self._ws_connected = False
+            self._ws_live = False
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, 60.0)
+
+    async def _ws_subscribe_pool(self, instrument_id: InstrumentId) -> None:
+        """Subscribe to the pool's Sync logs, unless already subscribed on this socket."""
+        if instrument_id in self._ws_subscriptions:
+            return  # A second log subscription would emit every Sync twice
+
+        address = self._instrument_provider._symbol_to_address(instrument_id.symbol.value)
+        if address is None:
+            self.log.error(f"No pool address for {instrument_id}")
+            return
+
+        # Claim the slot before awaiting so a concurrent call sees it
+        self._ws_subscriptions[instrument_id] = None
+        self._pools_by_address[address.lower()] = instrument_id
+        try:
+            subscription_id = await self._ws_subscribe(
+                ["logs", {"address": address, "topics": [SYNC_TOPIC]}],
+            )
+        except BaseException:
+            self._ws_subscriptions.pop(instrument_id, None)
+            raise
+
+        if instrument_id in self._ws_subscriptions:
+            self._ws_subscriptions[instrument_id] = subscription_id
+        else:
+            # Unsubscribed while the request was in flight
+            await self._ws_unsubscribe(subscription_id)
+
+    async def _ws_unsubscribe_pool(self, instrument_id: InstrumentId) -> None:
+        """Close the pool's log subscription, if it has one on this socket."""
+        if instrument_id not in self._ws_subscriptions:
+            return
+
+        subscription_id = self._ws_subscriptions.pop(instrument_id)
+        for address, pool_id in list(self._pools_by_address.items()):
+            if pool_id == instrument_id:
+                del self._pools_by_address[address]
+
+        # An in-flight subscribe (None) is closed by _ws_subscribe_pool on completion
+        if subscription_id is not None:
+            await self._ws_unsubscribe(subscription_id)
+
+    def _on_ws_message(self, message: dict) -> None:
+        """Decode an eth_subscription notification and emit its data."""
+        log = message["params"]["result"]
+        instrument_id = self._pools_by_address.get(log["address"].lower())
+        if instrument_id is None or instrument_id not in self._polled_pools:
+            return  # Unsubscribed since the log subscription was opened
+
+        # Sync data: two ABI-encoded uint112 words (reserve0, reserve1)
+        data = log["data"]
+        self._on_pool_update(instrument_id, int(data[2:66], 16), int(data[66:130], 16))
+
+    async def _ws_connect(self) -> None:
+        """
+        Open the WebSocket connection to ``config.ws_rpc_url``.
+
+        Implement using your WS client. Keep one connection per client so a
+        slow consumer elsewhere cannot block this stream.
+        """
+        raise NotImplementedError("Implement _ws_connect()")
+
+    async def _ws_subscribe(self, params: list) -> str:
+        """Send ``eth_subscribe`` with ``params`` and return the subscription id."""
+        raise NotImplementedError("Implement _ws_subscribe()")
+
+    async def _ws_unsubscribe(self, subscription_id: str) -> None:
+        """Send ``eth_unsubscribe`` for ``subscription_id``."""
+        raise NotImplementedError("Implement _ws_unsubscribe()")
+
+    async def _ws_recv(self) -> dict:
+        """Return the next decoded ``eth_subscription`` notification."""
+        raise NotImplementedError("Implement _ws_recv()")
+
     # ─── DATA CONVERSION HELPERS ───────────────────────────────────────────────
 
     def _reserves_to_quote_tick(
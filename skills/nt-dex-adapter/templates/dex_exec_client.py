@@ -26,6 +26,7 @@ if str(_TEMPLATE_DIR) not in sys.path:
 
 from nautilus_trader.cache.cache import Cache
 from nautilus_trader.common.component import LiveClock, MessageBus
+from nautilus_trader.core.nautilus_pyo3 import HttpClient
 from nautilus_trader.core.uuid import UUID4
 from nautilus_trader.live.execution_client import LiveExecutionClient
 from nautilus_trader.model.currencies import USDT
@@ -82,6 +83,9 @@ class MyDEXExecutionClient(LiveExecutionClient):
         Loaded instrument definitions.
     config : MyDEXExecClientConfig
         Client configuration (includes private key as SecretStr).
+    http_client : HttpClient, optional
+        Keep-alive RPC client shared with the data client. If None, a
+        private one is created.
     """
 
     def __init__(
@@ -94,6 +98,7 @@ class MyDEXExecutionClient(LiveExecutionClient):
         clock: LiveClock,
         instrument_provider: MyDEXInstrumentProvider,
         config: MyDEXExecClientConfig,
+        http_client: HttpClient | None = None,
     ) -> None:
         super().__init__(
             client_id=client_id,
@@ -108,12 +113,17 @@ class MyDEXExecutionClient(LiveExecutionClient):
         self._instrument_provider = instrument_provider
         self._config = config
         self._account_id = account_id
+        self._http_client = http_client or HttpClient(timeout_secs=10)
+
+        # Slippage cap as a rate, built once from the integer bps (exact, no str round-trip)
+        self._slippage_rate = Decimal(config.max_slippage_bps).scaleb(-4)
 
         # DEX execution state
         self._pending_txs: dict[ClientOrderId, str] = {}  # order_id → tx_hash
 
         # Private key is accessed via SecretStr.get_secret_value() in the Rust client
         # self._signing_client = MyDEXSigningClient(
+        #     http_client=self._http_client,
         #     rpc_url=config.rpc_url,
         #     private_key=config.private_key.get_secret_value(),
         #     chain_id=config.chain_id,
@@ -170,7 +180,7 @@ class MyDEXExecutionClient(LiveExecutionClient):
             return
 
         # Calculate minimum output (slippage protection)
-        slippage_rate = Decimal(str(self._config.max_slippage_bps)) / Decimal("10000")
+        slippage_rate = self._slippage_rate
         # min_amount_out = order.quantity * (1 - slippage_rate)
 
         try:
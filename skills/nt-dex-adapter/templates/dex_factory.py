@@ -22,6 +22,7 @@ if str(_TEMPLATE_DIR) not in sys.path:
 
 from nautilus_trader.cache.cache import Cache
 from nautilus_trader.common.component import LiveClock, MessageBus
+from nautilus_trader.core.nautilus_pyo3 import HttpClient
 from nautilus_trader.live.factories import LiveDataClientFactory, LiveExecClientFactory
 from nautilus_trader.model.identifiers import AccountId, ClientId, Venue
 
@@ -98,6 +99,7 @@ class MyDEXLiveDataClientFactory(LiveDataClientFactory):
             clock=clock,
             instrument_provider=provider,
             config=config,
+            http_client=_get_or_create_http_client(config),
         )
 
 
@@ -155,6 +157,7 @@ class MyDEXLiveExecClientFactory(LiveExecClientFactory):
             clock=clock,
             instrument_provider=provider,
             config=config,
+            http_client=_get_or_create_http_client(config),
         )
 
 
@@ -186,3 +189,27 @@ def _get_or_create_instrument_provider(config) -> MyDEXInstrumentProvider:
         _instrument_providers[key] = MyDEXInstrumentProvider(config=provider_config)
 
     return _instrument_providers[key]
+
+
+# =============================================================================
+# Shared RPC HTTP Client Cache
+# =============================================================================
+
+_http_clients: dict[str, HttpClient] = {}
+
+
+def _get_or_create_http_client(config) -> HttpClient:
+    """
+    Get or create a shared RPC HTTP client for the given RPC URL.
+
+    The client keeps its connections alive between requests, so sharing
+    one between the data and execution clients lets eth_call polls and
+    nonce/gas queries reuse warm sockets instead of paying a TCP+TLS
+    handshake each.
+    """
+    key = getattr(config, "rpc_url", "default")
+
+    if key not in _http_clients:
+        _http_clients[key] = HttpClient(timeout_secs=10)
+
+    return _http_clients[key]
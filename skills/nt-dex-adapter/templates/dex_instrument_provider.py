@@ -8,7 +8,10 @@ Phase 2 of the 7-phase DEX adapter implementation sequence.
 Replace 'MyDEX' with your actual DEX name and fill in the RPC client calls.
 """
 
+import asyncio
+import sys
 from decimal import Decimal
+from functools import lru_cache
 
 from nautilus_trader.cache.cache import Cache
 from nautilus_trader.common.component import LiveClock
@@ -31,6 +34,74 @@ except ImportError:
     MyDEXInstrumentProviderConfig = _mod.MyDEXInstrumentProviderConfig
 
 
+_FEE_DIVISOR = Decimal(1_000_000)  # Uniswap-style fee tiers are in millionths
+
+# Standard Uniswap V3 fee tiers → fee rate, so common pools skip the division
+_FEE_TABLE: dict[int, Decimal] = {
+    100: Decimal("0.0001"),    # 0.01%
+    500: Decimal("0.0005"),    # 0.05%
+    3000: Decimal("0.003"),    # 0.30%
+    10000: Decimal("0.01"),    # 1.00%
+}
+
+
+@lru_cache(maxsize=1024)
+def _currency_from_str(code: str) -> Currency:
+    """Memoized Currency.from_str — token symbols repeat across many pools."""
+    return Currency.from_str(code)
+
+
+@lru_cache(maxsize=4096)
+def _build_currency_pair(
+    venue: Venue,
+    token0_symbol: str,
+    token1_symbol: str,
+    fee_tier: int,
+    min_trade_size: str | int,
+) -> CurrencyPair:
+    """Build (and memoize) the CurrencyPair for a pool; instruments are immutable."""
+    # Build symbol: e.g. WETH-USDC
+    pool_symbol = f"{token0_symbol}-{token1_symbol}"
+
+    # Map fee tier to decimal rate (Decimal from int skips the string lexer)
+    fee_rate = _FEE_TABLE.get(fee_tier)
+    if fee_rate is None:
+        fee_rate = Decimal(int(fee_tier)) / _FEE_DIVISOR
+
+    # Minimum size may arrive as str (JSON/config) or int (whole tokens)
+    if isinstance(min_trade_size, int):
+        min_quantity = Quantity.from_int(min_trade_size)
+    else:
+        min_quantity = Quantity.from_str(str(min_trade_size))
+
+    symbol = Symbol(pool_symbol)
+    instrument_id = InstrumentId(symbol, venue)
+
+    return CurrencyPair(
+        instrument_id=instrument_id,
+        raw_symbol=symbol,
+        base_currency=_currency_from_str(token0_symbol),
+        quote_currency=_currency_from_str(token1_symbol),
+        price_precision=6,
+        size_precision=8,
+        price_increment=Price.from_str("0.000001"),
+        size_increment=Quantity.from_str("0.00000001"),
+        lot_size=None,
+        max_quantity=None,
+        min_quantity=min_quantity,
+        max_notional=None,
+        min_notional=None,
+        max_price=None,
+        min_price=None,
+        margin_init=Decimal("0"),
+        margin_maint=Decimal("0"),
+        maker_fee=fee_rate,
+        taker_fee=fee_rate,
+        ts_event=0,
+        ts_init=0,
+    )
+
+
 class MyDEXInstrumentProvider:
     """
     Instrument provider for MyDEX.
@@ -50,8 +121,20 @@ class MyDEXInstrumentProvider:
     VENUE = Venue("MYDEX")
 
     def __init__(self, config: MyDEXInstrumentProviderConfig) -> None:
+        # Zero would crash range() and deadlock the semaphore in pool discovery
+        if config.log_range_blocks <= 0:
+            raise ValueError(
+                f"log_range_blocks must be positive, was {config.log_range_blocks}"
+            )
+        if config.max_concurrent_log_requests <= 0:
+            raise ValueError(
+                "max_concurrent_log_requests must be positive, "
+                f"was {config.max_concurrent_log_requests}"
+            )
         self._config = config
         self._instruments: dict[InstrumentId, CurrencyPair] = {}
+        # Highest block already scanned for PoolCreated logs (incremental rescans)
+        self._last_scanned_block: int | None = None
         # self._http_client = MyDEXHttpClient(rpc_url=config.rpc_url)
 
     # ─── PUBLIC API (required by NautilusTrader adapter framework) ─────────────
@@ -112,12 +195,34 @@ class MyDEXInstrumentProvider:
         """Find an instrument by ID."""
         return self._instruments.get(instrument_id)
 
+    def remove(self, instrument_id: InstrumentId) -> CurrencyPair | None:
+        """
+        Drop a deregistered pool so long-running nodes don't accumulate dead pools.
+
+        Instruments are Cython objects that cannot be weakly referenced, so
+        the provider releases them explicitly instead.
+
+        Parameters
+        ----------
+        instrument_id : InstrumentId
+            The instrument to remove.
+
+        Returns
+        -------
+        CurrencyPair or None
+            The removed instrument, or None if it was not loaded.
+        """
+        return self._instruments.pop(instrument_id, None)
+
     # ─── PARSING HELPERS ───────────────────────────────────────────────────────
 
     def _parse_pool_to_instrument(self, pool_metadata: dict) -> CurrencyPair:
         """
         Convert on-chain pool metadata to a NautilusTrader CurrencyPair.
 
+        Results are memoized on (venue, tokens, fee, min size), so re-parsing
+        the same pools on reconnect returns the already-built instruments.
+
         Parameters
         ----------
         pool_metadata : dict
@@ -128,63 +233,76 @@ class MyDEXInstrumentProvider:
         CurrencyPair
             A fully-specified instrument ready for use in the framework.
         """
-        token0_symbol = pool_metadata["token0_symbol"]
-        token1_symbol = pool_metadata["token1_symbol"]
-        fee_tier = pool_metadata["fee"]  # e.g. 3000 for 0.3%
-
-        # Build symbol: e.g. WETH-USDC
-        pool_symbol = f"{token0_symbol}-{token1_symbol}"
-
-        # Map fee tier to decimal rate
-        fee_rate = Decimal(str(fee_tier)) / Decimal("1000000")
-
-        instrument_id = InstrumentId(Symbol(pool_symbol), self.VENUE)
-
-        return CurrencyPair(
-            instrument_id=instrument_id,
-            raw_symbol=Symbol(pool_symbol),
-            base_currency=Currency.from_str(token0_symbol),
-            quote_currency=Currency.from_str(token1_symbol),
-            price_precision=6,
-            size_precision=8,
-            price_increment=Price.from_str("0.000001"),
-            size_increment=Quantity.from_str("0.00000001"),
-            lot_size=None,
-            max_quantity=None,
-            min_quantity=Quantity.from_str(
-                str(pool_metadata.get("min_trade_size", "0.001"))
-            ),
-            max_notional=None,
-            min_notional=None,
-            max_price=None,
-            min_price=None,
-            margin_init=Decimal("0"),
-            margin_maint=Decimal("0"),
-            maker_fee=fee_rate,
-            taker_fee=fee_rate,
-            ts_event=0,
-            ts_init=0,
+        # A few dozen symbols recur across thousands of pools; interning shares
+        # one string each and makes the memo-key comparisons identity checks
+        return _build_currency_pair(
+            self.VENUE,
+            sys.intern(pool_metadata["token0_symbol"]),
+            sys.intern(pool_metadata["token1_symbol"]),
+            pool_metadata["fee"],  # e.g. 3000 for 0.3%
+            pool_metadata.get("min_trade_size", "0.001"),
         )
 
     # ─── RPC CALLS (implement with your actual client) ─────────────────────────
 
     async def _fetch_all_pool_addresses(self) -> list[str]:
         """
-        Fetch all pool addresses from on-chain registry.
+        Fetch all pool addresses from the factory's PoolCreated event logs.
+
+        A single eth_getLogs from the deploy block usually exceeds provider
+        limits, so the range is split into ``log_range_blocks`` shards that
+        are requested concurrently and merged in block order. The highest
+        scanned block is remembered so later calls only scan new blocks.
+
+        For registries without creation events (Curve Address Provider,
+        Hyperliquid REST), replace this with the relevant listing call.
+        """
+        head = await self._fetch_block_number()
+        if self._last_scanned_block is None:
+            start = self._config.factory_deploy_block
+        else:
+            start = self._last_scanned_block + 1
+        if start > head:
+            return []
+
+        step = self._config.log_range_blocks
+        ranges = [(b, min(b + step - 1, head)) for b in range(start, head + 1, step)]
+        semaphore = asyncio.Semaphore(self._config.max_concurrent_log_requests)
+
+        async def fetch_range(from_block: int, to_block: int) -> list[str]:
+            async with semaphore:
+                return await self._get_pool_created_logs(from_block, to_block)
+
+        shards = await asyncio.gather(*(fetch_range(fb, tb) for fb, tb in ranges))
+        self._last_scanned_block = head
+
+        # Shards never overlap, so flattening them keeps block order without duplicates
+        return [address for shard in shards for address in shard]
+
+    async def _fetch_block_number(self) -> int:
+        """
+        Fetch the current chain head block number.
+
+        Implement using your RPC client (eth_blockNumber).
+        """
+        raise NotImplementedError("Implement _fetch_block_number()")
+
+    async def _get_pool_created_logs(self, from_block: int, to_block: int) -> list[str]:
+        """
+        Fetch pool addresses created in ``[from_block, to_block]``.
 
-        Implement using your RPC client:
-        - Uniswap V3: query Factory contract event logs
-        - Curve: query Address Provider contract
-        - Hyperliquid: fetch from REST API
+        Implement using your RPC client: eth_getLogs on the factory address
+        filtered by the PoolCreated topic, decoding the pool address from
+        each log.
         """
-        raise NotImplementedError("Implement _fetch_all_pool_addresses()")
+        raise NotImplementedError("Implement _get_pool_created_logs()")
 
     async def _fetch_pool_metadata(self, address: str) -> dict:
         """
         Fetch pool metadata from chain.
 
         Should return a dict with at minimum:
-          token0_symbol, token1_symbol, fee (int), min_trade_size (str)
+          token0_symbol, token1_symbol, fee (int), min_trade_size (str or int)
 
         Implement using your RPC client (eth_call to pool contract).
         """
@@ -16,8 +16,11 @@ This helper is called by the data client to generate OrderBookDelta snapshots.
 """
 
 from decimal import Decimal
+from functools import lru_cache
 
-from nautilus_trader.model.data import OrderBookDelta, OrderBookDeltas
+import numpy as np
+
+from nautilus_trader.model.data import BookOrder, OrderBookDelta, OrderBookDeltas
 from nautilus_trader.model.enums import BookAction, OrderSide as BookSide
 from nautilus_trader.model.identifiers import InstrumentId
 from nautilus_trader.model.objects import Price, Quantity
@@ -27,20 +30,42 @@ from nautilus_trader.model.objects import Price, Quantity
 # AMM Price Level Calculator
 # =============================================================================
 
-def calculate_amm_price_levels(
+_EMPTY = np.empty(0, dtype=np.float64)
+_EMPTY.flags.writeable = False
+
+
+@lru_cache(maxsize=16)
+def _level_schedule(num_levels: int, size_step: float) -> np.ndarray:
+    """
+    Trade sizes per level as fractions of reserve0, specialised per config.
+
+    num_levels/size_step are fixed per deployment, so the schedule is built
+    once and each snapshot only scales it by the current reserve. The array
+    is shared between calls, so it is made read-only.
+    """
+    schedule = size_step * np.arange(1, num_levels + 1, dtype=np.float64)
+    schedule.flags.writeable = False
+    return schedule
+
+
+def calculate_amm_price_level_arrays(
     reserve0: float,
     reserve1: float,
     fee_rate: float,
     num_levels: int = 10,
     size_step: float = 0.1,
-) -> tuple[list[tuple[float, float]], list[tuple[float, float]]]:
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
     """
     Derive synthetic bid/ask price levels from AMM pool reserves.
 
     Uses the constant product formula (x * y = k) to calculate the effective
-    execution price for each simulated trade size.
+    execution price for each simulated trade size. All levels are computed
+    in one vectorised pass.
 
-    This approximates the AMM's price curve as a discrete order book.
+    This approximates the AMM's price curve as a discrete order book. Levels
+    are returned as flat float64 arrays rather than per-level tuples, and
+    come out best-first by construction: larger trades always get a worse
+    average price, so bids descend and asks ascend.
 
     Parameters
     ----------
@@ -55,49 +80,175 @@ def calculate_amm_price_levels(
     size_step : float
         Step size between levels (fraction of reserve0).
 
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+        (bid_prices, bid_sizes, ask_prices, ask_sizes) as float64 arrays.
+
+        bid_*: prices at which the pool will buy token0 (sells from pool).
+        ask_*: prices at which the pool will sell token0 (buys from pool).
+    """
+    if reserve0 <= 0 or reserve1 <= 0:
+        return _EMPTY, _EMPTY, _EMPTY, _EMPTY
+
+    trade_sizes = reserve0 * _level_schedule(num_levels, size_step)
+
+    # Buying trade_size would drain the pool — stop at the first such level
+    drained = trade_sizes >= reserve0
+    if drained.any():
+        trade_sizes = trade_sizes[: int(drained.argmax())]
+
+    # Closed forms of the x * y = k swap, which avoid cancelling k / x - y:
+    # ── Ask: token1 paid per token0 bought, grossed up for the fee ───────────
+    #    (k / (x - dx) - y) / (1 - fee) / dx  ==  y / ((x - dx) * (1 - fee))
+    # ── Bid: token1 received per token0 sold, net of the fee ─────────────────
+    #    (y - k / (x + dx_net)) / dx  ==  y * (1 - fee) / (x + dx_net)
+    # Each side is evaluated in a single buffer with in-place ufuncs (no
+    # intermediate arrays per operator)
+    one_minus_fee = 1.0 - fee_rate
+
+    ask_prices = reserve0 - trade_sizes
+    ask_prices *= one_minus_fee
+    np.divide(reserve1, ask_prices, out=ask_prices)
+
+    bid_prices = trade_sizes * one_minus_fee
+    bid_prices += reserve0
+    np.divide(reserve1 * one_minus_fee, bid_prices, out=bid_prices)
+
+    return bid_prices, trade_sizes, ask_prices, trade_sizes
+
+
+def calculate_amm_price_levels(
+    reserve0: float,
+    reserve1: float,
+    fee_rate: float,
+    num_levels: int = 10,
+    size_step: float = 0.1,
+) -> tuple[list[tuple[float, float]], list[tuple[float, float]]]:
+    """
+    Derive synthetic bid/ask price levels as (price, size) tuples.
+
+    Convenience wrapper over calculate_amm_price_level_arrays() for callers
+    that want per-level tuples; hot paths should use the arrays directly.
+
     Returns
     -------
     tuple[list[tuple[float, float]], list[tuple[float, float]]]
         (bid_levels, ask_levels) where each level is (price, size).
+    """
+    bid_prices, bid_sizes, ask_prices, ask_sizes = calculate_amm_price_level_arrays(
+        reserve0=reserve0,
+        reserve1=reserve1,
+        fee_rate=fee_rate,
+        num_levels=num_levels,
+        size_step=size_step,
+    )
+    return (
+        list(zip(bid_prices.tolist(), bid_sizes.tolist())),
+        list(zip(ask_prices.tolist(), ask_sizes.tolist())),
+    )
+
 
-        bid_levels: prices at which the pool will buy token0 (sells from pool).
-        ask_levels: prices at which the pool will sell token0 (buys from pool).
+# =============================================================================
+# Fixed-Point AMM Price Level Calculator
+# =============================================================================
+
+RESERVE_SCALE = 10**18   # Reserves/sizes carried as 18-decimal fixed-point ints
+PRICE_SCALE = 10**12     # Prices carried as 12-decimal fixed-point ints
+FEE_SCALE = 1_000_000    # Fees in pips (hundredths of a bip): 3000 = 0.3%
+
+
+def scale_reserve(raw_reserve: int, decimals: int) -> int:
     """
-    if reserve0 <= 0 or reserve1 <= 0:
+    Rescale a raw on-chain reserve to RESERVE_SCALE fixed-point.
+
+    Parameters
+    ----------
+    raw_reserve : int
+        The reserve as returned by the pool contract (uint256).
+    decimals : int
+        The token's ERC-20 decimals (e.g. 18 for WETH, 6 for USDC).
+
+    Returns
+    -------
+    int
+        The reserve scaled to 18 decimals, without passing through float.
+    """
+    if decimals <= 18:
+        return raw_reserve * 10 ** (18 - decimals)
+    return raw_reserve // 10 ** (decimals - 18)
+
+
+def calculate_amm_price_levels_scaled(
+    reserve0_scaled: int,
+    reserve1_scaled: int,
+    fee_pips: int,
+    num_levels: int = 10,
+    size_step_pips: int = 100_000,
+) -> tuple[list[tuple[int, int]], list[tuple[int, int]]]:
+    """
+    Derive synthetic bid/ask price levels using integer fixed-point math.
+
+    Same constant product model as calculate_amm_price_level_arrays(), but every
+    step is an integer mul/floor-div so no precision is lost between the
+    on-chain uint256 reserves and the book. Asks round up and bids round down,
+    so rounding can never cross the book near the pool edges.
+
+    Convert to Price/Quantity only at the API boundary:
+    ``price_scaled / PRICE_SCALE`` and ``size_scaled / RESERVE_SCALE``.
+
+    Parameters
+    ----------
+    reserve0_scaled : int
+        Token0 reserve at RESERVE_SCALE (see scale_reserve()).
+    reserve1_scaled : int
+        Token1 reserve at RESERVE_SCALE (see scale_reserve()).
+    fee_pips : int
+        Pool fee in FEE_SCALE units (e.g. 3000 for 0.3%, as Uniswap V3 fee tiers).
+    num_levels : int
+        Number of price levels to generate per side.
+    size_step_pips : int
+        Step size between levels as a fraction of reserve0, in FEE_SCALE units
+        (100_000 = 0.1).
+
+    Returns
+    -------
+    tuple[list[tuple[int, int]], list[tuple[int, int]]]
+        (bid_levels, ask_levels) where each level is (price_scaled, size_scaled).
+    """
+    if reserve0_scaled <= 0 or reserve1_scaled <= 0:
         return [], []
 
-    k = reserve0 * reserve1  # Constant product
+    # Loop invariants, hoisted (and module constants bound to locals)
+    fee_scale = FEE_SCALE
+    price_scale = PRICE_SCALE
+    k = reserve0_scaled * reserve1_scaled  # Constant product (arbitrary precision)
+    fee_complement = fee_scale - fee_pips
+    ask_price_scale = fee_scale * price_scale
+    level_step = reserve0_scaled * size_step_pips
 
     bid_levels = []
     ask_levels = []
 
     for i in range(1, num_levels + 1):
-        trade_size = reserve0 * size_step * i
-
-        # ── Ask levels: cost to BUY trade_size of token0 ──────────────────────
-        # After swap: pool has (reserve0 - trade_size) token0
-        # To maintain k: new_reserve1 = k / (reserve0 - trade_size)
-        # Amount in = new_reserve1 - reserve1 (how much token1 you pay)
-        if reserve0 - trade_size <= 0:
+        trade_size = level_step * i // fee_scale
+        if trade_size <= 0:
+            continue
+        if reserve0_scaled - trade_size <= 0:
             break
 
-        new_reserve1_ask = k / (reserve0 - trade_size)
-        amount_in_token1 = new_reserve1_ask - reserve1
-        amount_in_with_fee = amount_in_token1 / (1 - fee_rate)
-
-        if trade_size > 0:
-            ask_price = amount_in_with_fee / trade_size
-            ask_levels.append((ask_price, trade_size))
+        # Ask: token1 paid (grossed up for fee) per token0 bought, rounded up
+        new_reserve1_ask = -(-k // (reserve0_scaled - trade_size))
+        amount_in_token1 = new_reserve1_ask - reserve1_scaled
+        ask_price = -(-amount_in_token1 * ask_price_scale // (fee_complement * trade_size))
+        ask_levels.append((ask_price, trade_size))
 
-        # ── Bid levels: revenue from SELLING trade_size of token0 ─────────────
-        # After swap: pool has (reserve0 + trade_size * (1-fee)) token0
-        amount_in_adjusted = trade_size * (1 - fee_rate)
-        new_reserve1_bid = k / (reserve0 + amount_in_adjusted)
-        amount_out_token1 = reserve1 - new_reserve1_bid
-
-        if trade_size > 0:
-            bid_price = amount_out_token1 / trade_size
-            bid_levels.append((bid_price, trade_size))
+        # Bid: token1 received per token0 sold (net of fee), rounded down
+        amount_in_adjusted = trade_size * fee_complement // fee_scale
+        new_reserve1_bid = -(-k // (reserve0_scaled + amount_in_adjusted))
+        amount_out_token1 = reserve1_scaled - new_reserve1_bid
+        bid_price = amount_out_token1 * price_scale // trade_size
+        bid_levels.append((bid_price, trade_size))
 
     return bid_levels, ask_levels
 
@@ -106,6 +257,69 @@ def calculate_amm_price_levels(
 # OrderBookDelta Builder
 # =============================================================================
 
+class PriceLevelCache:
+    """
+    Last priced levels per pool, owned by one data client.
+
+    AMM reserves only move on swaps, so repeated snapshots between blocks
+    reuse the levels. The reserves are part of each entry's key, so a swap
+    misses the cache on its own and needs no explicit invalidation.
+
+    Parameters
+    ----------
+    max_pools : int
+        Maximum pools held; the oldest pool is evicted beyond this.
+    """
+
+    def __init__(self, max_pools: int = 1024) -> None:
+        if max_pools <= 0:
+            raise ValueError(f"max_pools must be positive, was {max_pools}")
+        self._max_pools = max_pools
+        # instrument_id → (inputs, level arrays)
+        self._entries: dict[InstrumentId, tuple[tuple, tuple[np.ndarray, ...]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def levels(
+        self,
+        instrument_id: InstrumentId,
+        reserve0: float,
+        reserve1: float,
+        fee_rate: float,
+        num_levels: int,
+        size_step: float,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Return the pool's level arrays, pricing them only if the inputs changed.
+
+        The arrays are shared with later calls, so they are made read-only.
+        """
+        key = (reserve0, reserve1, fee_rate, num_levels, size_step)
+        cached = self._entries.get(instrument_id)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        levels = calculate_amm_price_level_arrays(
+            reserve0=reserve0,
+            reserve1=reserve1,
+            fee_rate=fee_rate,
+            num_levels=num_levels,
+            size_step=size_step,
+        )
+        for array in levels:
+            array.flags.writeable = False
+
+        if cached is None and len(self._entries) >= self._max_pools:
+            del self._entries[next(iter(self._entries))]  # Evict the oldest pool
+        self._entries[instrument_id] = (key, levels)
+        return levels
+
+    def clear(self) -> None:
+        """Drop every cached pool."""
+        self._entries.clear()
+
+
 def build_order_book_snapshot(
     instrument_id: InstrumentId,
     reserve0: float,
@@ -115,6 +329,7 @@ def build_order_book_snapshot(
     ts_init: int,
     num_levels: int = 5,
     size_step: float = 0.05,
+    level_cache: PriceLevelCache | None = None,
 ) -> OrderBookDeltas:
     """
     Build an OrderBookDeltas snapshot from AMM pool reserves.
@@ -122,6 +337,10 @@ def build_order_book_snapshot(
     Creates a synthetic L2 snapshot representing the AMM's effective price curve.
     Each call should be preceded by a CLEAR delta if replacing a previous snapshot.
 
+    With a ``level_cache``, price levels are reused while the reserves, fee
+    and level parameters are unchanged; only the deltas (which carry the new
+    timestamps) are rebuilt.
+
     Parameters
     ----------
     instrument_id : InstrumentId
@@ -140,19 +359,27 @@ def build_order_book_snapshot(
         Number of price levels per side.
     size_step : float
         Step size as fraction of reserve0.
+    level_cache : PriceLevelCache, optional
+        The calling client's level cache. If None, levels are always priced.
 
     Returns
     -------
     OrderBookDeltas
         A sequence of OrderBookDelta events representing the current snapshot.
     """
-    bid_levels, ask_levels = calculate_amm_price_levels(
-        reserve0=reserve0,
-        reserve1=reserve1,
-        fee_rate=fee_rate,
-        num_levels=num_levels,
-        size_step=size_step,
-    )
+    if level_cache is not None:
+        levels = level_cache.levels(
+            instrument_id, reserve0, reserve1, fee_rate, num_levels, size_step
+        )
+    else:
+        levels = calculate_amm_price_level_arrays(
+            reserve0=reserve0,
+            reserve1=reserve1,
+            fee_rate=fee_rate,
+            num_levels=num_levels,
+            size_step=size_step,
+        )
+    bid_prices, bid_sizes, ask_prices, ask_sizes = levels
 
     deltas = []
     sequence = 0
@@ -167,12 +394,17 @@ def build_order_book_snapshot(
     deltas.append(clear_delta)
     sequence += 1
 
-    # Add bid levels (sorted descending by price — best bid first)
-    for price, size in sorted(bid_levels, key=lambda x: -x[0]):
+    # Add bid levels (best bid first)
+    for price, size in zip(bid_prices.tolist(), bid_sizes.tolist()):
         delta = OrderBookDelta(
             instrument_id=instrument_id,
             action=BookAction.ADD,
-            order=None,  # TODO: BookOrder(BookSide.BUY, Price.from_str(f"{price:.6f}"), Quantity.from_str(f"{size:.8f}"), 0)
+            order=BookOrder(
+                BookSide.BUY,
+                Price.from_str(f"{price:.6f}"),
+                Quantity.from_str(f"{size:.8f}"),
+                sequence,  # Levels are synthetic, so the sequence doubles as order id
+            ),
             flags=0,
             sequence=sequence,
             ts_event=ts_event,
@@ -181,12 +413,17 @@ def build_order_book_snapshot(
         deltas.append(delta)
         sequence += 1
 
-    # Add ask levels (sorted ascending by price — best ask first)
-    for price, size in sorted(ask_levels, key=lambda x: x[0]):
+    # Add ask levels (best ask first)
+    for price, size in zip(ask_prices.tolist(), ask_sizes.tolist()):
         delta = OrderBookDelta(
             instrument_id=instrument_id,
             action=BookAction.ADD,
-            order=None,  # TODO: BookOrder(BookSide.SELL, Price.from_str(f"{price:.6f}"), Quantity.from_str(f"{size:.8f}"), 0)
+            order=BookOrder(
+                BookSide.SELL,
+                Price.from_str(f"{price:.6f}"),
+                Quantity.from_str(f"{size:.8f}"),
+                sequence,
+            ),
             flags=0,
             sequence=sequence,
             ts_event=ts_event,
@@ -207,7 +444,7 @@ def amm_spot_price(reserve0: float, reserve1: float) -> float:
     Calculate AMM spot price (no fee, no slippage).
 
     This is the instantaneous price at the current pool state.
-    For execution price with slippage, use calculate_amm_price_levels().
+    For execution price with slippage, use calculate_amm_price_level_arrays().
 
     Parameters
     ----------
@@ -257,19 +494,19 @@ def amm_execution_price(
     float
         Effective execution price (token1 per token0).
     """
-    k = reserve0 * reserve1
+    # Closed forms of the x * y = k swap — exact, and cheaper than simulating
+    # the new reserves. Expanding for small amount_in gives the familiar
+    # first-order slippage spot * (1 ± (fee_rate + amount_in / reserve_in)).
+    one_minus_fee = 1.0 - fee_rate
+    amount_in_adjusted = amount_in * one_minus_fee
 
     if is_buy:
         # Paying token1 to receive token0
-        amount_in_adjusted = amount_in * (1 - fee_rate)
-        new_reserve1 = reserve1 + amount_in_adjusted
-        new_reserve0 = k / new_reserve1
-        amount_out = reserve0 - new_reserve0
-        return amount_in / amount_out if amount_out > 0 else float("inf")
+        if amount_in <= 0 or reserve0 <= 0:
+            return float("inf")
+        return (reserve1 + amount_in_adjusted) / (reserve0 * one_minus_fee)
     else:
         # Paying token0 to receive token1
-        amount_in_adjusted = amount_in * (1 - fee_rate)
-        new_reserve0 = reserve0 + amount_in_adjusted
-        new_reserve1 = k / new_reserve0
-        amount_out = reserve1 - new_reserve1
-        return amount_out / amount_in if amount_in > 0 else 0.0
+        if amount_in <= 0:
+            return 0.0
+        return reserve1 * one_minus_fee / (reserve0 + amount_in_adjusted)
@@ -0,0 +1,53 @@
+"""
+DEX Adapter Tests: Conftest
+
+Shared fixtures for the DEX adapter template tests.
+"""
+
+import importlib.util
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+
+# Template modules are loaded from disk — they are not installed as a package
+_templates = Path(__file__).parent.parent / "templates"
+
+
+def _load_module(name: str):
+    # Reuse a template another test file already loaded
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.spec_from_file_location(name, _templates / f"{name}.py")
+    mod = importlib.util.module_from_spec(spec)
+    sys.modules[name] = mod
+    try:
+        spec.loader.exec_module(mod)
+    except BaseException:
+        del sys.modules[name]
+        raise
+    return mod
+
+
+# ─── TEMPLATE FIXTURES ─────────────────────────────────────────────────────────
+
+
+@pytest.fixture(scope="session")
+def dex_templates():
+    """The adapter template modules, loaded once per session."""
+    return SimpleNamespace(
+        dex_config=_load_module("dex_config"),
+        dex_instrument_provider=_load_module("dex_instrument_provider"),
+        dex_order_book_builder=_load_module("dex_order_book_builder"),
+        dex_data_client=_load_module("dex_data_client"),
+        dex_exec_client=_load_module("dex_exec_client"),
+        dex_factory=_load_module("dex_factory"),
+    )
+
+
+@pytest.fixture(scope="session")
+def ob_mod(dex_templates):
+    """The order book builder template module."""
+    return dex_templates.dex_order_book_builder
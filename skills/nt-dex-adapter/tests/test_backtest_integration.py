@@ -14,10 +14,6 @@ No live chain connection required — all data is in-memory.
 import pytest
 from decimal import Decimal
 
-import sys
-import importlib.util
-from pathlib import Path
-
 from nautilus_trader.backtest.engine import BacktestEngine
 from nautilus_trader.backtest.models import FillModel
 from nautilus_trader.model.currencies import USDT
@@ -27,30 +23,12 @@ from nautilus_trader.model.identifiers import InstrumentId, Symbol, Venue
 from nautilus_trader.model.instruments import CurrencyPair
 from nautilus_trader.model.objects import Money, Price, Quantity
 
-_templates = Path(__file__).parent.parent / "templates"
-
-
-def _load_module(name: str):
-    spec = importlib.util.spec_from_file_location(name, _templates / f"{name}.py")
-    mod = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(mod)
-    return mod
-
-
-_config_mod = _load_module("dex_config")
-_provider_mod = _load_module("dex_instrument_provider")
-_ob_mod = _load_module("dex_order_book_builder")
-
-MyDEXInstrumentProviderConfig = _config_mod.MyDEXInstrumentProviderConfig
-MyDEXInstrumentProvider = _provider_mod.MyDEXInstrumentProvider
-amm_spot_price = _ob_mod.amm_spot_price
-
 
 @pytest.fixture
-def dex_instrument():
+def dex_instrument(dex_templates):
     """Synthetic DEX instrument from sandbox provider."""
-    config = MyDEXInstrumentProviderConfig(sandbox_mode=True)
-    provider = MyDEXInstrumentProvider(config=config)
+    config = dex_templates.dex_config.MyDEXInstrumentProviderConfig(sandbox_mode=True)
+    provider = dex_templates.dex_instrument_provider.MyDEXInstrumentProvider(config=config)
     provider._load_sandbox_instruments()
     instruments = provider.get_all()
     return next(iter(instruments.values()))
@@ -111,10 +89,10 @@ class TestDEXBacktestEngineIntegration:
         assert dex_instrument.maker_fee > Decimal("0")
         assert dex_instrument.min_quantity > Quantity.from_str("0")
 
-    def test_amm_price_rounds_to_instrument_precision(self, dex_instrument):
+    def test_amm_price_rounds_to_instrument_precision(self, ob_mod, dex_instrument):
         """Verify AMM price can be expressed at instrument's price precision."""
         reserve0, reserve1 = 1000.0, 3_000_000.0
-        spot = amm_spot_price(reserve0, reserve1)
+        spot = ob_mod.amm_spot_price(reserve0, reserve1)
 
         # Price should be expressible at the configured precision
         price_str = f"{spot:.{dex_instrument.price_precision}f}"
@@ -12,64 +12,78 @@ NOTE: These tests check method PRESENCE only. Functional correctness is
 tested in `test_instrument_parsing.py` and `test_order_book_events.py`.
 """
 
-import sys
-import importlib.util
 from inspect import iscoroutinefunction
 from inspect import signature
-from pathlib import Path
 
 import pytest
 
-_templates = Path(__file__).parent.parent / "templates"
 
+# ─── TEMPLATE CLASS FIXTURES ───────────────────────────────────────────────────
 
-def _load_module(name: str):
-    spec = importlib.util.spec_from_file_location(name, _templates / f"{name}.py")
-    mod = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(mod)
-    return mod
 
+@pytest.fixture(scope="session")
+def provider_config_cls(dex_templates):
+    return dex_templates.dex_config.MyDEXInstrumentProviderConfig
 
-# Load all template modules
-_config_mod = _load_module("dex_config")
-_provider_mod = _load_module("dex_instrument_provider")
-_data_mod = _load_module("dex_data_client")
-_exec_mod = _load_module("dex_exec_client")
-_factory_mod = _load_module("dex_factory")
 
-MyDEXInstrumentProviderConfig = _config_mod.MyDEXInstrumentProviderConfig
-MyDEXDataClientConfig = _config_mod.MyDEXDataClientConfig
-MyDEXExecClientConfig = _config_mod.MyDEXExecClientConfig
-MyDEXInstrumentProvider = _provider_mod.MyDEXInstrumentProvider
-MyDEXDataClient = _data_mod.MyDEXDataClient
-MyDEXExecutionClient = _exec_mod.MyDEXExecutionClient
-MyDEXLiveDataClientFactory = _factory_mod.MyDEXLiveDataClientFactory
-MyDEXLiveExecClientFactory = _factory_mod.MyDEXLiveExecClientFactory
+@pytest.fixture(scope="session")
+def data_config_cls(dex_templates):
+    return dex_templates.dex_config.MyDEXDataClientConfig
+
+
+@pytest.fixture(scope="session")
+def exec_config_cls(dex_templates):
+    return dex_templates.dex_config.MyDEXExecClientConfig
+
+
+@pytest.fixture(scope="session")
+def provider_cls(dex_templates):
+    return dex_templates.dex_instrument_provider.MyDEXInstrumentProvider
+
+
+@pytest.fixture(scope="session")
+def data_client_cls(dex_templates):
+    return dex_templates.dex_data_client.MyDEXDataClient
+
+
+@pytest.fixture(scope="session")
+def exec_client_cls(dex_templates):
+    return dex_templates.dex_exec_client.MyDEXExecutionClient
+
+
+@pytest.fixture(scope="session")
+def data_factory_cls(dex_templates):
+    return dex_templates.dex_factory.MyDEXLiveDataClientFactory
+
+
+@pytest.fixture(scope="session")
+def exec_factory_cls(dex_templates):
+    return dex_templates.dex_factory.MyDEXLiveExecClientFactory
 
 
 class TestInstrumentProviderInterface:
     """Checks all required InstrumentProvider methods are present and async."""
 
-    def test_load_all_async_exists(self):
-        assert hasattr(MyDEXInstrumentProvider, "load_all_async")
+    def test_load_all_async_exists(self, provider_cls):
+        assert hasattr(provider_cls, "load_all_async")
 
-    def test_load_all_async_is_coroutine(self):
-        assert iscoroutinefunction(MyDEXInstrumentProvider.load_all_async)
+    def test_load_all_async_is_coroutine(self, provider_cls):
+        assert iscoroutinefunction(provider_cls.load_all_async)
 
-    def test_load_ids_async_exists(self):
-        assert hasattr(MyDEXInstrumentProvider, "load_ids_async")
+    def test_load_ids_async_exists(self, provider_cls):
+        assert hasattr(provider_cls, "load_ids_async")
 
-    def test_load_ids_async_is_coroutine(self):
-        assert iscoroutinefunction(MyDEXInstrumentProvider.load_ids_async)
+    def test_load_ids_async_is_coroutine(self, provider_cls):
+        assert iscoroutinefunction(provider_cls.load_ids_async)
 
-    def test_get_all_exists(self):
-        assert hasattr(MyDEXInstrumentProvider, "get_all")
+    def test_get_all_exists(self, provider_cls):
+        assert hasattr(provider_cls, "get_all")
 
-    def test_find_exists(self):
-        assert hasattr(MyDEXInstrumentProvider, "find")
+    def test_find_exists(self, provider_cls):
+        assert hasattr(provider_cls, "find")
 
-    def test_parse_pool_to_instrument_exists(self):
-        assert hasattr(MyDEXInstrumentProvider, "_parse_pool_to_instrument")
+    def test_parse_pool_to_instrument_exists(self, provider_cls):
+        assert hasattr(provider_cls, "_parse_pool_to_instrument")
 
 
 class TestDataClientInterface:
@@ -88,17 +102,17 @@ class TestDataClientInterface:
     ]
 
     @pytest.mark.parametrize("method", REQUIRED_ASYNC_METHODS)
-    def test_method_exists_and_is_async(self, method):
-        assert hasattr(MyDEXDataClient, method), f"Missing: {method}"
-        assert iscoroutinefunction(getattr(MyDEXDataClient, method)), (
+    def test_method_exists_and_is_async(self, data_client_cls, method):
+        assert hasattr(data_client_cls, method), f"Missing: {method}"
+        assert iscoroutinefunction(getattr(data_client_cls, method)), (
             f"Not async: {method}"
         )
 
-    def test_reserves_to_quote_tick_exists(self):
-        assert hasattr(MyDEXDataClient, "_reserves_to_quote_tick")
+    def test_reserves_to_quote_tick_exists(self, data_client_cls):
+        assert hasattr(data_client_cls, "_reserves_to_quote_tick")
 
-    def test_swap_event_to_trade_tick_exists(self):
-        assert hasattr(MyDEXDataClient, "_swap_event_to_trade_tick")
+    def test_swap_event_to_trade_tick_exists(self, data_client_cls):
+        assert hasattr(data_client_cls, "_swap_event_to_trade_tick")
 
 
 class TestExecutionClientInterface:
@@ -116,19 +130,19 @@ class TestExecutionClientInterface:
     ]
 
     @pytest.mark.parametrize("method", REQUIRED_ASYNC_METHODS)
-    def test_method_exists_and_is_async(self, method):
-        assert hasattr(MyDEXExecutionClient, method), f"Missing: {method}"
-        assert iscoroutinefunction(getattr(MyDEXExecutionClient, method)), (
+    def test_method_exists_and_is_async(self, exec_client_cls, method):
+        assert hasattr(exec_client_cls, method), f"Missing: {method}"
+        assert iscoroutinefunction(getattr(exec_client_cls, method)), (
             f"Not async: {method}"
         )
 
-    def test_update_account_state_exists(self):
-        assert hasattr(MyDEXExecutionClient, "_update_account_state")
-        assert iscoroutinefunction(MyDEXExecutionClient._update_account_state)
+    def test_update_account_state_exists(self, exec_client_cls):
+        assert hasattr(exec_client_cls, "_update_account_state")
+        assert iscoroutinefunction(exec_client_cls._update_account_state)
 
-    def test_wait_for_receipt_exists(self):
-        assert hasattr(MyDEXExecutionClient, "_wait_for_receipt")
-        assert iscoroutinefunction(MyDEXExecutionClient._wait_for_receipt)
+    def test_wait_for_receipt_exists(self, exec_client_cls):
+        assert hasattr(exec_client_cls, "_wait_for_receipt")
+        assert iscoroutinefunction(exec_client_cls._wait_for_receipt)
 
 
 class TestOfficialAdapterContractNames:
@@ -153,13 +167,15 @@ class TestOfficialAdapterContractNames:
     }
 
     @pytest.mark.parametrize(("method", "expected_param"), DATA_COMMAND_METHODS.items())
-    def test_data_client_uses_command_or_request_parameter(self, method, expected_param):
-        params = signature(getattr(MyDEXDataClient, method)).parameters
+    def test_data_client_uses_command_or_request_parameter(
+        self, data_client_cls, method, expected_param
+    ):
+        params = signature(getattr(data_client_cls, method)).parameters
         assert expected_param in params, f"{method} should accept {expected_param}"
 
     @pytest.mark.parametrize(("method", "expected_param"), EXEC_COMMAND_METHODS.items())
-    def test_exec_client_uses_command_parameter(self, method, expected_param):
-        params = signature(getattr(MyDEXExecutionClient, method)).parameters
+    def test_exec_client_uses_command_parameter(self, exec_client_cls, method, expected_param):
+        params = signature(getattr(exec_client_cls, method)).parameters
         assert expected_param in params, f"{method} should accept {expected_param}"
 
     @pytest.mark.parametrize(
@@ -172,9 +188,9 @@ class TestOfficialAdapterContractNames:
             "generate_mass_status",
         ],
     )
-    def test_full_execution_reconciliation_method_set_exists(self, method):
-        assert hasattr(MyDEXExecutionClient, method), f"Missing: {method}"
-        assert iscoroutinefunction(getattr(MyDEXExecutionClient, method)), f"Not async: {method}"
+    def test_full_execution_reconciliation_method_set_exists(self, exec_client_cls, method):
+        assert hasattr(exec_client_cls, method), f"Missing: {method}"
+        assert iscoroutinefunction(getattr(exec_client_cls, method)), f"Not async: {method}"
 
 
 class TestConfigInterface:
@@ -190,11 +206,11 @@ class TestConfigInterface:
             return name in legacy_fields
         return hasattr(config_cls, name)
 
-    def test_exec_config_has_secret_str_private_key(self):
+    def test_exec_config_has_secret_str_private_key(self, exec_config_cls):
         """Private key must be SecretStr, not plain str."""
         from pydantic import SecretStr
 
-        config = MyDEXExecClientConfig()
+        config = exec_config_cls()
         assert hasattr(config, "private_key"), (
             "private_key field missing from ExecClientConfig"
         )
@@ -203,24 +219,36 @@ class TestConfigInterface:
             "Plain str leaks keys in logs and repr()!"
         )
 
-    def test_exec_config_has_sandbox_mode(self):
-        assert self._has_field(MyDEXExecClientConfig, "sandbox_mode")
+    def test_exec_config_has_sandbox_mode(self, exec_config_cls):
+        assert self._has_field(exec_config_cls, "sandbox_mode")
+
+    def test_exec_config_has_max_slippage_bps(self, exec_config_cls):
+        assert self._has_field(exec_config_cls, "max_slippage_bps")
 
-    def test_exec_config_has_max_slippage_bps(self):
-        assert self._has_field(MyDEXExecClientConfig, "max_slippage_bps")
+    def test_data_config_has_poll_interval(self, data_config_cls):
+        assert self._has_field(data_config_cls, "poll_interval_secs")
 
-    def test_data_config_has_poll_interval(self):
-        assert self._has_field(MyDEXDataClientConfig, "poll_interval_secs")
+    def test_data_config_has_batch_size(self, data_config_cls):
+        assert self._has_field(data_config_cls, "batch_size")
 
-    def test_provider_config_has_sandbox_mode(self):
-        assert self._has_field(MyDEXInstrumentProviderConfig, "sandbox_mode")
+    def test_provider_config_has_sandbox_mode(self, provider_config_cls):
+        assert self._has_field(provider_config_cls, "sandbox_mode")
 
 
 class TestFactoryInterface:
     """Checks that factory classes expose static create() methods."""
 
-    def test_data_factory_has_create(self):
-        assert hasattr(MyDEXLiveDataClientFactory, "create")
+    def test_data_factory_has_create(self, data_factory_cls):
+        assert hasattr(data_factory_cls, "create")
+
+    def test_exec_factory_has_create(self, exec_factory_cls):
+        assert hasattr(exec_factory_cls, "create")
 
-    def test_exec_factory_has_create(self):
-        assert hasattr(MyDEXLiveExecClientFactory, "create")
+    def test_data_and_exec_clients_share_http_client(
+        self, dex_templates, data_config_cls, exec_config_cls
+    ):
+        data_config = data_config_cls(rpc_url="https://rpc.example")
+        exec_config = exec_config_cls(rpc_url="https://rpc.example")
+        assert dex_templates.dex_factory._get_or_create_http_client(
+            data_config
+        ) is dex_templates.dex_factory._get_or_create_http_client(exec_config)
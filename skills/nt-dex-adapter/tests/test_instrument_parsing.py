@@ -7,6 +7,8 @@ metadata into valid NautilusTrader instrument objects.
 All tests run offline — no RPC connections required.
 """
 
+import asyncio
+
 import pytest
 from decimal import Decimal
 
@@ -14,36 +16,14 @@ from nautilus_trader.model.identifiers import InstrumentId, Symbol, Venue
 from nautilus_trader.model.instruments import CurrencyPair
 from nautilus_trader.model.objects import Price, Quantity
 
-import sys
-import importlib.util
-from pathlib import Path
-
-# Load template modules without installing as a package
-_templates = Path(__file__).parent.parent / "templates"
-
-
-def _load_module(name: str):
-    spec = importlib.util.spec_from_file_location(name, _templates / f"{name}.py")
-    mod = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(mod)
-    return mod
-
-
-# Load provider template
-_config_mod = _load_module("dex_config")
-_provider_mod = _load_module("dex_instrument_provider")
-
-MyDEXInstrumentProviderConfig = _config_mod.MyDEXInstrumentProviderConfig
-MyDEXInstrumentProvider = _provider_mod.MyDEXInstrumentProvider
-
 
 # ─── FIXTURES ──────────────────────────────────────────────────────────────────
 
 @pytest.fixture
-def sandbox_provider():
+def sandbox_provider(dex_templates):
     """Instrument provider in sandbox mode (no chain connection)."""
-    config = MyDEXInstrumentProviderConfig(sandbox_mode=True)
-    return MyDEXInstrumentProvider(config=config)
+    config = dex_templates.dex_config.MyDEXInstrumentProviderConfig(sandbox_mode=True)
+    return dex_templates.dex_instrument_provider.MyDEXInstrumentProvider(config=config)
 
 
 @pytest.fixture
@@ -129,6 +109,12 @@ class TestInstrumentParsing:
         instrument = sandbox_provider._parse_pool_to_instrument(wbtc_usdc_metadata)
         assert instrument.raw_symbol == Symbol("WBTC-USDC")
 
+    def test_reparse_returns_cached_instrument(self, sandbox_provider, weth_usdc_metadata):
+        """Re-parsing identical pool metadata (e.g. on reconnect) reuses the instrument."""
+        first = sandbox_provider._parse_pool_to_instrument(weth_usdc_metadata)
+        second = sandbox_provider._parse_pool_to_instrument(dict(weth_usdc_metadata))
+        assert first is second
+
 
 class TestSandboxProvider:
     """Verify sandbox mode loads synthetic instruments without chain connection."""
@@ -151,7 +137,67 @@ class TestSandboxProvider:
         all2 = sandbox_provider.get_all()
         assert all1 is not all2
 
+    def test_remove_drops_instrument(self, sandbox_provider):
+        sandbox_provider._load_sandbox_instruments()
+        iid = InstrumentId.from_str("WETH-USDC.MYDEX")
+        assert sandbox_provider.remove(iid) is not None
+        assert sandbox_provider.find(iid) is None
+        assert sandbox_provider.remove(iid) is None
+
     def test_find_returns_none_for_missing(self, sandbox_provider):
         iid = InstrumentId.from_str("UNKNOWN-TOKEN.MYDEX")
         result = sandbox_provider.find(iid)
         assert result is None
+
+
+class TestPoolDiscovery:
+    """Verify PoolCreated log scanning is sharded and incremental."""
+
+    @pytest.fixture
+    def make_scanning_provider(self, dex_templates):
+        """Factory for a provider whose chain head and log RPCs are stubbed."""
+        provider_cls = dex_templates.dex_instrument_provider.MyDEXInstrumentProvider
+
+        class ScanningProvider(provider_cls):
+            def __init__(self, config, head):
+                super().__init__(config)
+                self.head = head
+                self.ranges = []
+
+            async def _fetch_block_number(self):
+                return self.head
+
+            async def _get_pool_created_logs(self, from_block, to_block):
+                self.ranges.append((from_block, to_block))
+                return [f"0x{from_block:x}", f"0x{to_block:x}"]
+
+        def _make(head, **config_kwargs):
+            config = dex_templates.dex_config.MyDEXInstrumentProviderConfig(**config_kwargs)
+            return ScanningProvider(config, head)
+
+        return _make
+
+    def test_range_split_into_shards_in_block_order(self, make_scanning_provider):
+        provider = make_scanning_provider(head=25, factory_deploy_block=3, log_range_blocks=10)
+
+        addresses = asyncio.run(provider._fetch_all_pool_addresses())
+
+        assert sorted(provider.ranges) == [(3, 12), (13, 22), (23, 25)]
+        assert addresses == ["0x3", "0xc", "0xd", "0x16", "0x17", "0x19"]
+
+    def test_rescan_only_covers_new_blocks(self, make_scanning_provider):
+        provider = make_scanning_provider(head=25, factory_deploy_block=3, log_range_blocks=10)
+        asyncio.run(provider._fetch_all_pool_addresses())
+        provider.ranges.clear()
+
+        assert asyncio.run(provider._fetch_all_pool_addresses()) == []
+        assert provider.ranges == []
+
+        provider.head = 30
+        assert asyncio.run(provider._fetch_all_pool_addresses()) == ["0x1a", "0x1e"]
+        assert provider.ranges == [(26, 30)]
+
+    @pytest.mark.parametrize("field", ["log_range_blocks", "max_concurrent_log_requests"])
+    def test_non_positive_scan_settings_rejected(self, make_scanning_provider, field):
+        with pytest.raises(ValueError, match=field):
+            make_scanning_provider(head=25, **{field: 0})
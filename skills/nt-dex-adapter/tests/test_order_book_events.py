@@ -6,48 +6,34 @@ Verifies:
 - QuoteTick synthesis from pool reserves
 - Order book level generation (bid/ask price curve)
 - Slippage model correctness
+- Snapshot deltas and the price level cache
 """
 
 import pytest
 
-import sys
-import importlib.util
-from pathlib import Path
-
-_templates = Path(__file__).parent.parent / "templates"
-
-def _load_module(name: str):
-    spec = importlib.util.spec_from_file_location(name, _templates / f"{name}.py")
-    mod = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(mod)
-    return mod
-
-_ob_mod = _load_module("dex_order_book_builder")
-
-amm_spot_price = _ob_mod.amm_spot_price
-amm_execution_price = _ob_mod.amm_execution_price
-calculate_amm_price_levels = _ob_mod.calculate_amm_price_levels
+from nautilus_trader.model.enums import BookAction, OrderSide
+from nautilus_trader.model.identifiers import InstrumentId
 
 
 class TestAMMSpotPrice:
     """Verify constant-product AMM spot price formula."""
 
-    def test_basic_spot_price(self):
+    def test_basic_spot_price(self, ob_mod):
         """reserve1/reserve0 gives spot price."""
         reserve0 = 1000.0   # 1000 WETH
         reserve1 = 3_000_000.0  # 3,000,000 USDC
-        price = amm_spot_price(reserve0, reserve1)
+        price = ob_mod.amm_spot_price(reserve0, reserve1)
         assert abs(price - 3000.0) < 0.001  # ~$3000/ETH
 
-    def test_spot_price_zero_reserve_raises(self):
+    def test_spot_price_zero_reserve_raises(self, ob_mod):
         with pytest.raises(ValueError, match="reserve0 is zero"):
-            amm_spot_price(0, 1_000_000)
+            ob_mod.amm_spot_price(0, 1_000_000)
 
-    def test_spot_price_is_inverse_of_flipped_reserves(self):
+    def test_spot_price_is_inverse_of_flipped_reserves(self, ob_mod):
         """Price of A in B == 1 / Price of B in A."""
         r0, r1 = 100.0, 300_000.0
-        price_a_in_b = amm_spot_price(r0, r1)      # WETH price in USDC
-        price_b_in_a = amm_spot_price(r1, r0)      # USDC price in WETH
+        price_a_in_b = ob_mod.amm_spot_price(r0, r1)      # WETH price in USDC
+        price_b_in_a = ob_mod.amm_spot_price(r1, r0)      # USDC price in WETH
         assert abs(price_a_in_b * price_b_in_a - 1.0) < 1e-9
 
 
@@ -59,10 +45,10 @@ class TestAMMExecutionPrice:
         """Standard test pool: 1000 ETH, $3M USDC."""
         return {"reserve0": 1000.0, "reserve1": 3_000_000.0, "fee_rate": 0.003}
 
-    def test_small_buy_near_spot(self, pool):
+    def test_small_buy_near_spot(self, ob_mod, pool):
         """Small buy should be close to spot price."""
-        spot = amm_spot_price(pool["reserve0"], pool["reserve1"])
-        exec_price = amm_execution_price(
+        spot = ob_mod.amm_spot_price(pool["reserve0"], pool["reserve1"])
+        exec_price = ob_mod.amm_execution_price(
             pool["reserve0"], pool["reserve1"],
             amount_in=1.0,  # Buy 1 WETH worth of USDC
             fee_rate=pool["fee_rate"],
@@ -71,15 +57,15 @@ class TestAMMExecutionPrice:
         # Should be within 0.5% of spot for a tiny trade
         assert abs(exec_price - spot) / spot < 0.005
 
-    def test_large_buy_has_more_slippage(self, pool):
+    def test_large_buy_has_more_slippage(self, ob_mod, pool):
         """Larger trade has more slippage than smaller trade."""
-        small_price = amm_execution_price(
+        small_price = ob_mod.amm_execution_price(
             pool["reserve0"], pool["reserve1"],
             amount_in=100.0,   # Pay 100 USDC
             fee_rate=pool["fee_rate"],
             is_buy=True,
         )
-        large_price = amm_execution_price(
+        large_price = ob_mod.amm_execution_price(
             pool["reserve0"], pool["reserve1"],
             amount_in=100_000.0,  # Pay 100k USDC
             fee_rate=pool["fee_rate"],
@@ -88,10 +74,10 @@ class TestAMMExecutionPrice:
         # Larger trade → higher price paid (more slippage on buy)
         assert large_price > small_price
 
-    def test_sell_price_below_spot(self, pool):
+    def test_sell_price_below_spot(self, ob_mod, pool):
         """Selling token0 should give a price below spot (bid < ask)."""
-        spot = amm_spot_price(pool["reserve0"], pool["reserve1"])
-        sell_price = amm_execution_price(
+        spot = ob_mod.amm_spot_price(pool["reserve0"], pool["reserve1"])
+        sell_price = ob_mod.amm_execution_price(
             pool["reserve0"], pool["reserve1"],
             amount_in=1.0,
             fee_rate=pool["fee_rate"],
@@ -99,10 +85,10 @@ class TestAMMExecutionPrice:
         )
         assert sell_price < spot
 
-    def test_buy_price_above_spot(self, pool):
+    def test_buy_price_above_spot(self, ob_mod, pool):
         """Buying token0 should cost more than spot (ask > spot)."""
-        spot = amm_spot_price(pool["reserve0"], pool["reserve1"])
-        buy_price = amm_execution_price(
+        spot = ob_mod.amm_spot_price(pool["reserve0"], pool["reserve1"])
+        buy_price = ob_mod.amm_execution_price(
             pool["reserve0"], pool["reserve1"],
             amount_in=100.0,
             fee_rate=pool["fee_rate"],
@@ -110,12 +96,35 @@ class TestAMMExecutionPrice:
         )
         assert buy_price > spot
 
+    def test_small_trade_matches_linear_approx(self, ob_mod, pool):
+        """Tiny trades follow spot * (1 ± (fee + size / reserve_in)) to first order."""
+        spot = ob_mod.amm_spot_price(pool["reserve0"], pool["reserve1"])
+        fee = pool["fee_rate"]
+        amount_in = 1e-4 * pool["reserve1"]
+        buy_price = ob_mod.amm_execution_price(
+            pool["reserve0"], pool["reserve1"],
+            amount_in=amount_in,
+            fee_rate=fee,
+            is_buy=True,
+        )
+        linear = spot * (1 + fee + amount_in / pool["reserve1"])
+        assert abs(buy_price - linear) / spot < 2 * fee * fee
+
+    def test_matches_reserve_simulation(self, ob_mod, pool):
+        """Closed form agrees with simulating the post-swap reserves."""
+        r0, r1, fee = pool["reserve0"], pool["reserve1"], pool["fee_rate"]
+        amount_in = 50_000.0
+        new_r1 = r1 + amount_in * (1 - fee)
+        amount_out = r0 - r0 * r1 / new_r1
+        buy_price = ob_mod.amm_execution_price(r0, r1, amount_in=amount_in, fee_rate=fee, is_buy=True)
+        assert abs(buy_price - amount_in / amount_out) / buy_price < 1e-12
+
 
 class TestAMMPriceLevels:
     """Verify synthetic order book level generation from pool reserves."""
 
-    def test_returns_bid_and_ask_levels(self):
-        bids, asks = calculate_amm_price_levels(
+    def test_returns_bid_and_ask_levels(self, ob_mod):
+        bids, asks = ob_mod.calculate_amm_price_levels(
             reserve0=1000.0,
             reserve1=3_000_000.0,
             fee_rate=0.003,
@@ -124,8 +133,8 @@ class TestAMMPriceLevels:
         assert len(bids) > 0
         assert len(asks) > 0
 
-    def test_num_levels_respected(self):
-        bids, asks = calculate_amm_price_levels(
+    def test_num_levels_respected(self, ob_mod):
+        bids, asks = ob_mod.calculate_amm_price_levels(
             reserve0=1000.0,
             reserve1=3_000_000.0,
             fee_rate=0.003,
@@ -134,9 +143,9 @@ class TestAMMPriceLevels:
         assert len(bids) <= 3
         assert len(asks) <= 3
 
-    def test_bid_prices_below_ask_prices(self):
+    def test_bid_prices_below_ask_prices(self, ob_mod):
         """Best bid must be less than best ask (no crossed book)."""
-        bids, asks = calculate_amm_price_levels(
+        bids, asks = ob_mod.calculate_amm_price_levels(
             reserve0=1000.0,
             reserve1=3_000_000.0,
             fee_rate=0.003,
@@ -147,9 +156,9 @@ class TestAMMPriceLevels:
             best_ask = min(p for p, _ in asks)
             assert best_bid < best_ask
 
-    def test_empty_pool_returns_empty_levels(self):
+    def test_empty_pool_returns_empty_levels(self, ob_mod):
         """Empty pool (reserve0=0) returns empty levels."""
-        bids, asks = calculate_amm_price_levels(
+        bids, asks = ob_mod.calculate_amm_price_levels(
             reserve0=0.0,
             reserve1=3_000_000.0,
             fee_rate=0.003,
@@ -157,12 +166,12 @@ class TestAMMPriceLevels:
         assert bids == []
         assert asks == []
 
-    def test_higher_fee_widens_spread(self):
+    def test_higher_fee_widens_spread(self, ob_mod):
         """Higher fee pool should have wider bid/ask spread."""
-        bids_low, asks_low = calculate_amm_price_levels(
+        bids_low, asks_low = ob_mod.calculate_amm_price_levels(
             reserve0=1000.0, reserve1=3_000_000.0, fee_rate=0.0005
         )
-        bids_high, asks_high = calculate_amm_price_levels(
+        bids_high, asks_high = ob_mod.calculate_amm_price_levels(
             reserve0=1000.0, reserve1=3_000_000.0, fee_rate=0.01
         )
 
@@ -170,3 +179,134 @@ class TestAMMPriceLevels:
             spread_low = min(p for p, _ in asks_low) - max(p for p, _ in bids_low)
             spread_high = min(p for p, _ in asks_high) - max(p for p, _ in bids_high)
             assert spread_high > spread_low
+
+    def test_arrays_are_best_first(self, ob_mod):
+        """Bid prices descend and ask prices ascend without sorting."""
+        bid_prices, bid_sizes, ask_prices, ask_sizes = ob_mod.calculate_amm_price_level_arrays(
+            reserve0=1000.0, reserve1=3_000_000.0, fee_rate=0.003, num_levels=5
+        )
+        assert len(bid_prices) == len(bid_sizes) == 5
+        assert len(ask_prices) == len(ask_sizes) == 5
+        assert list(bid_prices) == sorted(bid_prices, reverse=True)
+        assert list(ask_prices) == sorted(ask_prices)
+
+    def test_arrays_match_tuple_levels(self, ob_mod):
+        bid_prices, bid_sizes, ask_prices, ask_sizes = ob_mod.calculate_amm_price_level_arrays(
+            reserve0=1000.0, reserve1=3_000_000.0, fee_rate=0.003
+        )
+        bids, asks = ob_mod.calculate_amm_price_levels(
+            reserve0=1000.0, reserve1=3_000_000.0, fee_rate=0.003
+        )
+        assert bids == list(zip(bid_prices, bid_sizes))
+        assert asks == list(zip(ask_prices, ask_sizes))
+
+
+class TestAMMPriceLevelsScaled:
+    """Verify the integer fixed-point level generator matches the float model."""
+
+    @pytest.fixture
+    def pool(self, ob_mod):
+        """1000 WETH (18 decimals) / 3M USDC (6 decimals), raw on-chain units."""
+        return {
+            "reserve0_scaled": ob_mod.scale_reserve(1000 * 10**18, 18),
+            "reserve1_scaled": ob_mod.scale_reserve(3_000_000 * 10**6, 6),
+        }
+
+    def test_scale_reserve_normalises_decimals(self, ob_mod):
+        assert ob_mod.scale_reserve(1_000_000, 6) == ob_mod.RESERVE_SCALE
+        assert ob_mod.scale_reserve(10**18, 18) == ob_mod.RESERVE_SCALE
+        assert ob_mod.scale_reserve(10**24, 24) == ob_mod.RESERVE_SCALE
+
+    def test_levels_are_integers(self, ob_mod, pool):
+        bids, asks = ob_mod.calculate_amm_price_levels_scaled(**pool, fee_pips=3000, num_levels=5)
+        assert all(isinstance(p, int) and isinstance(s, int) for p, s in bids + asks)
+
+    def test_matches_float_levels(self, ob_mod, pool):
+        bids, asks = ob_mod.calculate_amm_price_levels_scaled(**pool, fee_pips=3000, num_levels=5)
+        bids_f, asks_f = ob_mod.calculate_amm_price_levels(
+            reserve0=1000.0, reserve1=3_000_000.0, fee_rate=0.003, num_levels=5
+        )
+        assert len(bids) == len(bids_f)
+        assert len(asks) == len(asks_f)
+        for (p, s), (pf, sf) in zip(bids + asks, bids_f + asks_f):
+            assert abs(p / ob_mod.PRICE_SCALE - pf) / pf < 1e-9
+            assert abs(s / ob_mod.RESERVE_SCALE - sf) < 1e-9
+
+    def test_bid_prices_below_ask_prices(self, ob_mod, pool):
+        bids, asks = ob_mod.calculate_amm_price_levels_scaled(**pool, fee_pips=3000, num_levels=5)
+        assert max(p for p, _ in bids) < min(p for p, _ in asks)
+
+    def test_empty_pool_returns_empty_levels(self, ob_mod):
+        bids, asks = ob_mod.calculate_amm_price_levels_scaled(0, 3_000_000 * ob_mod.RESERVE_SCALE, 3000)
+        assert bids == []
+        assert asks == []
+
+
+class TestOrderBookSnapshot:
+    """Verify snapshot deltas and the per-client price level cache."""
+
+    @pytest.fixture
+    def pool(self):
+        return {"reserve0": 1000.0, "reserve1": 3_000_000.0, "fee_rate": 0.003}
+
+    @pytest.fixture
+    def instrument_id(self):
+        return InstrumentId.from_str("WETH-USDC.MYDEX")
+
+    def test_snapshot_clears_then_adds_best_first(self, ob_mod, pool, instrument_id):
+        snapshot = ob_mod.build_order_book_snapshot(
+            instrument_id, **pool, ts_event=1, ts_init=2, num_levels=3
+        )
+
+        deltas = snapshot.deltas
+        assert len(deltas) == 1 + 2 * 3
+        assert deltas[0].action == BookAction.CLEAR
+        assert [d.sequence for d in deltas] == list(range(7))
+        bids = [d.order for d in deltas[1:4]]
+        asks = [d.order for d in deltas[4:]]
+        assert all(o.side == OrderSide.BUY for o in bids)
+        assert all(o.side == OrderSide.SELL for o in asks)
+        assert [o.price for o in bids] == sorted((o.price for o in bids), reverse=True)
+        assert [o.price for o in asks] == sorted(o.price for o in asks)
+        assert bids[0].price < asks[0].price
+
+    def test_cache_hit_reuses_levels_with_new_timestamps(self, ob_mod, pool, instrument_id):
+        cache = ob_mod.PriceLevelCache()
+        first = ob_mod.build_order_book_snapshot(
+            instrument_id, **pool, ts_event=1, ts_init=1, level_cache=cache
+        )
+        levels = cache.levels(instrument_id, *pool.values(), 5, 0.05)
+        second = ob_mod.build_order_book_snapshot(
+            instrument_id, **pool, ts_event=2, ts_init=2, level_cache=cache
+        )
+
+        assert cache.levels(instrument_id, *pool.values(), 5, 0.05) is levels
+        assert [d.order for d in second.deltas[1:]] == [d.order for d in first.deltas[1:]]
+        assert {d.ts_event for d in second.deltas} == {2}
+
+    def test_changed_reserves_reprice(self, ob_mod, pool, instrument_id):
+        cache = ob_mod.PriceLevelCache()
+        before = cache.levels(instrument_id, *pool.values(), 5, 0.05)
+        after = cache.levels(instrument_id, 1010.0, 2_970_000.0, pool["fee_rate"], 5, 0.05)
+
+        assert after is not before
+        assert after[2][0] < before[2][0]  # More token0 in the pool — cheaper asks
+        assert len(cache) == 1
+
+    def test_cached_levels_are_read_only(self, ob_mod, pool, instrument_id):
+        levels = ob_mod.PriceLevelCache().levels(instrument_id, *pool.values(), 5, 0.05)
+        with pytest.raises(ValueError):
+            levels[0][0] = 0.0
+
+    def test_cache_evicts_oldest_pool_at_capacity(self, ob_mod, pool):
+        cache = ob_mod.PriceLevelCache(max_pools=2)
+        ids = [InstrumentId.from_str(f"POOL{i}-USDC.MYDEX") for i in range(3)]
+        for instrument_id in ids:
+            cache.levels(instrument_id, *pool.values(), 5, 0.05)
+
+        assert len(cache) == 2
+        assert ids[0] not in cache._entries
+
+    def test_cache_rejects_non_positive_bound(self, ob_mod):
+        with pytest.raises(ValueError, match="max_pools"):
+            ob_mod.PriceLevelCache(max_pools=0)
@@ -0,0 +1,134 @@
+"""
+DEX Adapter Tests: Pool Event Stream
+
+Verifies the data client's WebSocket log subscriptions:
+- Sync logs decode to (reserve0, reserve1) for the subscribed pool
+- A pool is subscribed at most once per socket
+- Unsubscribing sends eth_unsubscribe and drops later logs
+- Pools subscribed while the stream re-subscribes are not missed
+
+The client's subscription methods run on a stub; the RPC calls are mocks.
+"""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from nautilus_trader.model.identifiers import InstrumentId
+
+
+WETH_USDC = InstrumentId.from_str("WETH-USDC.MYDEX")
+WBTC_USDC = InstrumentId.from_str("WBTC-USDC.MYDEX")
+ADDRESSES = {
+    "WETH-USDC": "0xB4e16d0168e52d35CaCD2c6185b44281Ec28C9Dc",
+    "WBTC-USDC": "0x004375Dff511095CC5A197A54140a24eFEF3A416",
+}
+
+
+def _sync_message(address: str, reserve0: int, reserve1: int) -> dict:
+    """An eth_subscription notification carrying one Sync log."""
+    return {
+        "params": {
+            "subscription": "0x1",
+            "result": {"address": address, "data": f"0x{reserve0:064x}{reserve1:064x}"},
+        },
+    }
+
+
+@pytest.fixture(scope="session")
+def stub_client_cls(dex_templates):
+    """A plain class carrying the data client's subscription and stream methods."""
+    client_cls = dex_templates.dex_data_client.MyDEXDataClient
+    names = (
+        "_subscribe_quote_ticks",
+        "_unsubscribe_quote_ticks",
+        "_stream_pool_events",
+        "_ws_subscribe_pool",
+        "_ws_unsubscribe_pool",
+        "_on_ws_message",
+    )
+    return type("StubDataClient", (), {name: vars(client_cls)[name] for name in names})
+
+
+@pytest.fixture
+def client(stub_client_cls):
+    """A connected stub client whose RPC calls are mocks."""
+    client = stub_client_cls()
+    client.log = MagicMock()
+    client._config = SimpleNamespace(poll_interval_secs=0.0)
+    client._instrument_provider = SimpleNamespace(_symbol_to_address=ADDRESSES.get)
+    client._polled_pools = {}
+    client._poll_task = MagicMock()  # Keeps subscribe from starting a real poll loop
+    client._ws_connected = True
+    client._ws_live = True
+    client._pools_by_address = {}
+    client._ws_subscriptions = {}
+    client._ws_subscribe = AsyncMock(side_effect=["0x1", "0x2", "0x3"])
+    client._ws_unsubscribe = AsyncMock()
+    client._on_pool_update = MagicMock()
+    return client
+
+
+def _subscribe(client, instrument_id: InstrumentId) -> None:
+    asyncio.run(client._subscribe_quote_ticks(SimpleNamespace(instrument_id=instrument_id)))
+
+
+def _unsubscribe(client, instrument_id: InstrumentId) -> None:
+    asyncio.run(client._unsubscribe_quote_ticks(SimpleNamespace(instrument_id=instrument_id)))
+
+
+class TestPoolEventStream:
+    def test_sync_log_decodes_reserves(self, client):
+        _subscribe(client, WETH_USDC)
+
+        # Node may return the address in any case
+        client._on_ws_message(_sync_message(ADDRESSES["WETH-USDC"].lower(), 10**21, 3 * 10**12))
+
+        client._on_pool_update.assert_called_once_with(WETH_USDC, 10**21, 3 * 10**12)
+
+    def test_unknown_pool_log_ignored(self, client):
+        _subscribe(client, WETH_USDC)
+
+        client._on_ws_message(_sync_message(ADDRESSES["WBTC-USDC"], 1, 1))
+
+        client._on_pool_update.assert_not_called()
+
+    def test_pool_subscribed_once_per_socket(self, client):
+        _subscribe(client, WETH_USDC)
+        asyncio.run(client._ws_subscribe_pool(WETH_USDC))  # e.g. a re-subscribe pass
+
+        client._ws_subscribe.assert_awaited_once()
+        client._on_ws_message(_sync_message(ADDRESSES["WETH-USDC"], 5, 7))
+        client._on_pool_update.assert_called_once()
+
+    def test_unsubscribe_sends_eth_unsubscribe(self, client):
+        _subscribe(client, WETH_USDC)
+        _subscribe(client, WBTC_USDC)
+        _unsubscribe(client, WETH_USDC)
+
+        client._ws_unsubscribe.assert_awaited_once_with("0x1")
+        assert client._ws_subscriptions == {WBTC_USDC: "0x2"}
+
+        client._on_ws_message(_sync_message(ADDRESSES["WETH-USDC"], 5, 7))
+        client._on_pool_update.assert_not_called()
+
+    def test_pool_added_during_resubscribe_is_streamed(self, client):
+        client._polled_pools[WETH_USDC] = None
+        client._ws_connected = False
+        client._ws_live = False
+        client._ws_connect = AsyncMock()
+        client._ws_recv = AsyncMock(side_effect=asyncio.CancelledError)  # Ends the stream
+
+        async def subscribe_and_add_pool(params):
+            # A strategy subscribes WBTC-USDC while WETH-USDC is being re-subscribed
+            if WBTC_USDC not in client._polled_pools:
+                await client._subscribe_quote_ticks(SimpleNamespace(instrument_id=WBTC_USDC))
+            return f"0x{len(client._ws_subscriptions)}"
+
+        client._ws_subscribe = AsyncMock(side_effect=subscribe_and_add_pool)
+        asyncio.run(client._stream_pool_events())
+
+        assert client._ws_subscriptions.keys() == {WETH_USDC, WBTC_USDC}
+        assert client._ws_subscribe.await_count == 2
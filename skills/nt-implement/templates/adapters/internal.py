@@ -12,6 +12,8 @@ This is simpler than exchange adapters since you control the API.
 
 import asyncio
 from collections.abc import Callable
+from datetime import timedelta
+from typing import NamedTuple
 
 from nautilus_trader.cache.cache import Cache
 from nautilus_trader.common.actor import Actor
@@ -20,6 +22,7 @@ from nautilus_trader.common.component import MessageBus
 from nautilus_trader.config import ActorConfig
 from nautilus_trader.core.data import Data
 from nautilus_trader.model.custom import customdataclass
+from nautilus_trader.model.data import DataType
 
 
 # =============================================================================
@@ -45,6 +48,10 @@ class InternalSignal(Data):
         Source model/system name.
     """
 
+    # No per-instance __dict__ on high-rate feeds; customdataclass stores the
+    # timestamps in _ts_event/_ts_init, so those need slots too
+    __slots__ = ("signal_id", "instrument", "direction", "strength", "source", "_ts_event", "_ts_init")
+
     signal_id: str
     instrument: str
     direction: int
@@ -52,21 +59,50 @@ class InternalSignal(Data):
     source: str
 
 
+class FeatureVec(NamedTuple):
+    """
+    Fixed feature schema, in feature store column order.
+
+    Attributes
+    ----------
+    ema_20 : float
+        20-period exponential moving average.
+    rsi_14 : float
+        14-period relative strength index.
+    """
+
+    ema_20: float
+    rsi_14: float
+
+
 @customdataclass
 class InternalFeatures(Data):
     """
     Precomputed features from internal feature store.
 
+    Feature values are plain float fields (one per ``FeatureVec`` field, same
+    order), so they serialize without a per-publish dict.
+
     Attributes
     ----------
     instrument : str
         Instrument symbol.
-    features : dict
-        Feature name to value mapping.
+    ema_20 : float
+        20-period exponential moving average.
+    rsi_14 : float
+        14-period relative strength index.
     """
 
+    __slots__ = ("instrument", "ema_20", "rsi_14", "_ts_event", "_ts_init")
+
     instrument: str
-    features: dict
+    ema_20: float
+    rsi_14: float
+
+    @property
+    def features(self) -> FeatureVec:
+        """The feature values as a ``FeatureVec``."""
+        return FeatureVec(self.ema_20, self.rsi_14)
 
 
 # =============================================================================
@@ -116,6 +152,7 @@ class InternalSignalAdapter(Actor):
 
         self._connected: bool = False
         self._ws_task: asyncio.Task | None = None
+        self._signal_data_type = DataType(InternalSignal)
 
     def on_start(self) -> None:
         """Start the adapter and connect to internal service."""
@@ -135,14 +172,12 @@ class InternalSignalAdapter(Actor):
 
     def _start_polling(self) -> None:
         """Start polling for signals."""
-        import pandas as pd
-
         self._connected = True
 
         # Set up timer for polling
         self.clock.set_timer(
             name="signal_poll",
-            interval=pd.Timedelta(milliseconds=self.config.poll_interval_ms),
+            interval=timedelta(milliseconds=self.config.poll_interval_ms),
             callback=self._on_poll_timer,
         )
 
@@ -155,8 +190,12 @@ class InternalSignalAdapter(Actor):
         # This would be async in real implementation
         signals = self._fetch_signals()
 
+        # Each publish is a separate bus dispatch (subscribers expect single
+        # Data objects), so hoist the bound method and DataType out of the loop
+        publish = self.publish_data
+        data_type = self._signal_data_type
         for signal in signals:
-            self.publish_data(InternalSignal, signal)
+            publish(data_type, signal)
 
     def _fetch_signals(self) -> list[InternalSignal]:
         """
@@ -204,10 +243,13 @@ class FeatureStoreAdapterConfig(ActorConfig):
         Connection string for the feature database.
     cache_ttl_seconds : int
         Time-to-live for cached features.
+    cache_max_entries : int
+        Upper bound on cached instruments; the oldest entries are evicted first.
     """
 
     database_url: str
     cache_ttl_seconds: int = 60
+    cache_max_entries: int = 10_000
 
 
 class FeatureStoreAdapter(Actor):
@@ -228,8 +270,16 @@ class FeatureStoreAdapter(Actor):
         """
         super().__init__(config)
 
-        self._feature_cache: dict[str, InternalFeatures] = {}
+        if config.cache_max_entries <= 0:
+            raise ValueError(
+                f"cache_max_entries must be positive, was {config.cache_max_entries}"
+            )
+
+        # instrument → (expiry ns, features), kept in refresh order for eviction.
+        # Expiry uses the actor clock so TTLs also hold under backtest time.
+        self._feature_cache: dict[str, tuple[int, InternalFeatures]] = {}
         self._subscriptions: set[str] = set()
+        self._features_data_type = DataType(InternalFeatures)
 
     def on_start(self) -> None:
         """Start the feature store connection."""
@@ -259,19 +309,40 @@ class FeatureStoreAdapter(Actor):
         # Query feature store
         # features = db.query(f"SELECT * FROM features WHERE instrument = '{instrument}'")
 
+        # Rows come back in FeatureVec column order, e.g. FeatureVec._make(row)
+        vec = FeatureVec(100.5, 55.3)
+
+        now_ns = self.clock.timestamp_ns()
         features = InternalFeatures(
             instrument=instrument,
-            features={"ema_20": 100.5, "rsi_14": 55.3},
-            ts_event=self.clock.timestamp_ns(),
-            ts_init=self.clock.timestamp_ns(),
+            **vec._asdict(),
+            ts_event=now_ns,
+            ts_init=now_ns,
         )
 
-        self._feature_cache[instrument] = features
-        self.publish_data(InternalFeatures, features)
+        self._cache_features(instrument, features)
+        self.publish_data(self._features_data_type, features)
+
+    def _cache_features(self, instrument: str, features: InternalFeatures) -> None:
+        """Store features with an expiry, evicting the oldest entries when full."""
+        self._feature_cache.pop(instrument, None)  # Re-insert at the end (newest)
+        while len(self._feature_cache) >= self.config.cache_max_entries:
+            del self._feature_cache[next(iter(self._feature_cache))]
+
+        expires_ns = self.clock.timestamp_ns() + self.config.cache_ttl_seconds * 1_000_000_000
+        self._feature_cache[instrument] = (expires_ns, features)
 
     def get_cached_features(self, instrument: str) -> InternalFeatures | None:
-        """Get cached features for instrument."""
-        return self._feature_cache.get(instrument)
+        """Get cached features for instrument, or None if missing or expired."""
+        entry = self._feature_cache.get(instrument)
+        if entry is None:
+            return None
+
+        expires_ns, features = entry
+        if self.clock.timestamp_ns() >= expires_ns:
+            del self._feature_cache[instrument]
+            return None
+        return features
 
 
 # =============================================================================
@@ -284,9 +355,20 @@ class FeatureStoreAdapter(Actor):
 #         self.subscribe_data(InternalSignal)
 #         self.subscribe_data(InternalFeatures)
 #
+#         # Exact-type handler table: one dict lookup per message, no isinstance chain
+#         self._data_handlers = {
+#             InternalSignal: self._on_signal,
+#             InternalFeatures: self._on_features,
+#         }
+#
 #     def on_data(self, data: Data) -> None:
-#         if isinstance(data, InternalSignal):
-#             if data.direction > 0 and data.strength > 0.7:
-#                 self._buy()
-#         elif isinstance(data, InternalFeatures):
-#             self._update_features(data)
+#         handler = self._data_handlers.get(type(data))
+#         if handler is not None:
+#             handler(data)
+#
+#     def _on_signal(self, signal: InternalSignal) -> None:
+#         if signal.direction > 0 and signal.strength > 0.7:
+#             self._buy()
+#
+#     def _on_features(self, features: InternalFeatures) -> None:
+#         self._update_features(features.features)  # FeatureVec
@@ -5,16 +5,15 @@ Execution algorithms manage how orders are executed, potentially splitting
 large orders into smaller child orders over time.
 """
 
-from decimal import Decimal
-
-import pandas as pd
+from datetime import timedelta
 
+from nautilus_trader.common.events import TimeEvent
 from nautilus_trader.config import ExecAlgorithmConfig
 from nautilus_trader.execution.algorithm import ExecAlgorithm
 from nautilus_trader.model import InstrumentId
-from nautilus_trader.model import OrderSide
 from nautilus_trader.model import Quantity
-from nautilus_trader.model import TimeInForce
+from nautilus_trader.model.enums import OrderSide
+from nautilus_trader.model.enums import TimeInForce
 from nautilus_trader.model.events import OrderFilled
 from nautilus_trader.model.instruments import Instrument
 from nautilus_trader.model.orders import Order
@@ -61,12 +60,18 @@ class MyExecAlgorithm(ExecAlgorithm):
         # Track active orders
         self._scheduled_sizes: dict[str, list[Quantity]] = {}
 
+        # Slicing timers: order_key → (parent order, next slice index)
+        self._slice_cursors: dict[str, tuple[Order, int]] = {}
+
     def on_start(self) -> None:
         """Handle algorithm start."""
         self.log.info("Execution algorithm started")
 
     def on_stop(self) -> None:
         """Handle algorithm stop."""
+        for order_key in self._slice_cursors:
+            self.clock.cancel_timer(order_key)
+        self._slice_cursors.clear()
         self._scheduled_sizes.clear()
 
     def on_order(self, order: Order) -> None:
@@ -98,7 +103,6 @@ class MyExecAlgorithm(ExecAlgorithm):
 
         # Split quantity into slices
         total_qty = float(order.quantity)
-        slice_qty = total_qty / num_slices
         sizes = self._calculate_slice_sizes(instrument, total_qty, num_slices)
 
         # Store scheduled sizes
@@ -108,13 +112,17 @@ class MyExecAlgorithm(ExecAlgorithm):
         # Submit first child immediately
         self._submit_child(order, sizes[0], 0, num_slices)
 
-        # Schedule remaining slices
-        for i in range(1, num_slices):
-            self.clock.set_time_alert(
-                name=f"{order_key}_slice_{i}",
-                alert_time=self.clock.utc_now() + pd.Timedelta(seconds=interval_secs * i),
-                callback=lambda event, idx=i: self._on_scheduled_slice(order, idx, num_slices),
-            )
+        if num_slices == 1:
+            self._scheduled_sizes.pop(order_key, None)
+            return
+
+        # One recurring timer drives the remaining slices (cancelled after the last)
+        self._slice_cursors[order_key] = (order, 1)
+        self.clock.set_timer(
+            name=order_key,
+            interval=timedelta(seconds=interval_secs),
+            callback=self._on_slice_timer,
+        )
 
     def on_order_filled(self, event: OrderFilled) -> None:
         """
@@ -150,19 +158,13 @@ class MyExecAlgorithm(ExecAlgorithm):
         list[Quantity]
             List of quantities for each slice.
         """
-        base_size = total_qty / num_slices
-        sizes: list[Quantity] = []
-        remaining = total_qty
-
-        for i in range(num_slices - 1):
-            size = instrument.make_qty(Decimal(str(base_size)))
-            sizes.append(size)
-            remaining -= float(size)
+        # All but the last slice are identical — round once and share the object
+        base_size = instrument.make_qty(total_qty / num_slices)
 
-        # Last slice gets remainder
-        sizes.append(instrument.make_qty(Decimal(str(remaining))))
+        # Last slice gets remainder (make_qty rounds away float error)
+        remainder = instrument.make_qty(total_qty - base_size.as_double() * (num_slices - 1))
 
-        return sizes
+        return [base_size] * (num_slices - 1) + [remainder]
 
     def _submit_child(
         self,
@@ -198,6 +200,32 @@ class MyExecAlgorithm(ExecAlgorithm):
         )
         self.submit_order(child)
 
+    def _on_slice_timer(self, event: TimeEvent) -> None:
+        """
+        Handle a tick of an order's slicing timer.
+
+        Parameters
+        ----------
+        event : TimeEvent
+            The timer event (named after the parent order key).
+        """
+        order_key = event.name
+        cursor = self._slice_cursors.get(order_key)
+        if cursor is None:
+            return
+
+        parent, slice_idx = cursor
+        total_slices = len(self._scheduled_sizes.get(order_key, ()))
+
+        self._on_scheduled_slice(parent, slice_idx, total_slices)
+
+        if slice_idx + 1 >= total_slices:
+            self.clock.cancel_timer(order_key)
+            del self._slice_cursors[order_key]
+            self._scheduled_sizes.pop(order_key, None)
+        else:
+            self._slice_cursors[order_key] = (parent, slice_idx + 1)
+
     def _on_scheduled_slice(
         self,
         parent: Order,
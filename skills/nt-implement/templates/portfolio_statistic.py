@@ -20,12 +20,20 @@ Usage:
     analyzer.register_statistic(WinStreakStatistic())
     analyzer.register_statistic(RiskAdjustedReturnStatistic(risk_free_rate=0.02))
 
+    # Or run the position statistics over one shared pass of the positions
+    analyzer.register_statistic(BatchedPortfolioStatistics())
+
     # After backtest
     results = engine.run()
     stats = analyzer.calculate_statistics(positions=results.positions)
+
+calculate_from_positions returns plain dicts, as the analyzer expects.
+calculate_from_arrays returns the typed NamedTuple results (each has to_dict()).
 """
 
+from operator import itemgetter
 from typing import Any
+from typing import NamedTuple
 
 import numpy as np
 
@@ -34,6 +42,80 @@ from nautilus_trader.model.orders import Order
 from nautilus_trader.model.position import Position
 
 
+# Closed-trade fields per position, owned by one statistic instance so the
+# cache lives and dies with its analyzer: id(position) →
+# (position, event_count, pnl, ts_opened, ts_closed). Keys are object
+# identities, not position ids: ids repeat when a backtest is re-run after
+# engine.reset(). Holding the Position keeps its id() from being reused; a
+# changed event count (e.g. a NETTING position reopened and closed again)
+# forces a refresh.
+TradeCache = dict[int, tuple[Position, int, float, int, int]]
+
+_TRADE_CACHE_MAX = 100_000
+
+_PNL = itemgetter(2)
+_TS_OPENED = itemgetter(3)
+_TS_CLOSED = itemgetter(4)
+
+
+def _extract_arrays(
+    positions: list[Position],
+    cache: TradeCache,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Walk the positions once and collect the closed-trade fields statistics need.
+
+    Positions seen in an earlier call with the same cache are served from it,
+    so re-analysing a growing position list only converts the new trades.
+
+    Parameters
+    ----------
+    positions : list[Position]
+        List of positions from the trading session.
+    cache : TradeCache
+        The calling statistic's cache; cleared by its ``reset()``.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray, np.ndarray]
+        (pnl, ts_opened, ts_closed) for closed positions with a realized PnL,
+        in position order, as float64, int64 and int64 arrays.
+    """
+    entries = []
+
+    for position in positions:
+        if not position.is_closed:
+            continue
+
+        key = id(position)
+        event_count = position.event_count
+        entry = cache.get(key)
+        if entry is None or entry[1] != event_count:
+            realized_pnl = position.realized_pnl
+            if realized_pnl is None:
+                continue
+            if entry is None and len(cache) >= _TRADE_CACHE_MAX:
+                del cache[next(iter(cache))]  # Evict the oldest entry
+            entry = (
+                position,
+                event_count,
+                float(realized_pnl),
+                position.ts_opened,
+                position.ts_closed,
+            )
+            cache[key] = entry
+
+        entries.append(entry)
+
+    # Arrays are sized up front and filled straight from the entries
+    n = len(entries)
+    return (
+        np.fromiter(map(_PNL, entries), dtype=np.float64, count=n),
+        np.fromiter(map(_TS_OPENED, entries), dtype=np.int64, count=n),
+        np.fromiter(map(_TS_CLOSED, entries), dtype=np.int64, count=n),
+    )
+
+
 class CustomPortfolioStatistic(PortfolioStatistic):
     """
     Template for custom portfolio statistic.
@@ -86,7 +168,51 @@ class CustomPortfolioStatistic(PortfolioStatistic):
         return None
 
 
-class WinStreakStatistic(PortfolioStatistic):
+class _ClosedTradeStatistic(PortfolioStatistic):
+    """
+    Base for statistics computed from the closed-trade arrays.
+
+    Each instance owns its trade cache. Call ``reset()`` alongside
+    ``engine.reset()`` when reusing the statistic for another run.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._trade_cache: TradeCache = {}
+
+    def reset(self) -> None:
+        """Drop the cached closed-trade fields."""
+        self._trade_cache.clear()
+
+
+class WinStreakResult(NamedTuple):
+    """
+    Win/loss streak counts from WinStreakStatistic.
+
+    Attributes
+    ----------
+    max_win_streak : int
+        Longest run of consecutive winning trades.
+    max_loss_streak : int
+        Longest run of consecutive losing trades.
+    current_streak : int
+        Length of the final run (positive = winning, negative = losing).
+    """
+
+    max_win_streak: int
+    max_loss_streak: int
+    current_streak: int
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the result as a plain dict (e.g. for serialization)."""
+        return self._asdict()
+
+
+# Shared result when there are no trades
+_ZERO_WIN_STREAK = WinStreakResult(max_win_streak=0, max_loss_streak=0, current_streak=0)
+
+
+class WinStreakStatistic(_ClosedTradeStatistic):
     """
     Calculate maximum consecutive winning and losing streaks.
 
@@ -110,53 +236,101 @@ class WinStreakStatistic(PortfolioStatistic):
         dict[str, int]
             Dictionary with max_win_streak, max_loss_streak, current_streak.
         """
-        if not positions:
-            return {"max_win_streak": 0, "max_loss_streak": 0, "current_streak": 0}
+        if not any(position.is_closed for position in positions):
+            return _ZERO_WIN_STREAK.to_dict()  # e.g. during warmup, skip array setup
 
-        max_win_streak = 0
-        max_loss_streak = 0
-        current_win_streak = 0
-        current_loss_streak = 0
+        return self.calculate_from_arrays(*_extract_arrays(positions, self._trade_cache)).to_dict()
 
-        for position in positions:
-            if not position.is_closed:
-                continue
+    def calculate_from_arrays(
+        self,
+        pnl: np.ndarray,
+        ts_opened: np.ndarray,
+        ts_closed: np.ndarray,
+    ) -> WinStreakResult:
+        """
+        Calculate streaks from closed-trade arrays.
 
-            realized_pnl = position.realized_pnl
-            if realized_pnl is None:
-                continue
+        Parameters
+        ----------
+        pnl : np.ndarray
+            Realized PnL per closed position, in position order.
+        ts_opened : np.ndarray
+            Open timestamps (Unix nanoseconds) per closed position.
+        ts_closed : np.ndarray
+            Close timestamps (Unix nanoseconds) per closed position.
+
+        Returns
+        -------
+        WinStreakResult
+            Named result with max_win_streak, max_loss_streak, current_streak.
+        """
+        if pnl.size == 0:
+            return _ZERO_WIN_STREAK
 
-            if float(realized_pnl) > 0:
-                current_win_streak += 1
-                current_loss_streak = 0
-                max_win_streak = max(max_win_streak, current_win_streak)
-            elif float(realized_pnl) < 0:
-                current_loss_streak += 1
-                current_win_streak = 0
-                max_loss_streak = max(max_loss_streak, current_loss_streak)
-            # Zero PnL resets both streaks
-            else:
-                current_win_streak = 0
-                current_loss_streak = 0
+        # Run-length encode the PnL signs: a new run starts wherever the sign
+        # changes. Zero PnL forms its own run, so it resets both streaks.
+        signs = np.sign(pnl).astype(np.int8)
+        starts = np.concatenate(([0], np.flatnonzero(np.diff(signs)) + 1))
+        lengths = np.diff(np.append(starts, signs.size))
+        run_signs = signs[starts]
+
+        max_win_streak = int(lengths[run_signs == 1].max(initial=0))
+        max_loss_streak = int(lengths[run_signs == -1].max(initial=0))
 
         # Current streak (positive = winning, negative = losing)
-        current = current_win_streak if current_win_streak > 0 else -current_loss_streak
+        current = int(lengths[-1]) * int(run_signs[-1])
 
-        return {
-            "max_win_streak": max_win_streak,
-            "max_loss_streak": max_loss_streak,
-            "current_streak": current,
-        }
+        return WinStreakResult(
+            max_win_streak=max_win_streak,
+            max_loss_streak=max_loss_streak,
+            current_streak=current,
+        )
+
+
+class RiskAdjustedReturnResult(NamedTuple):
+    """
+    Risk-adjusted return metrics from RiskAdjustedReturnStatistic.
+
+    Attributes
+    ----------
+    avg_return : float
+        Mean realized PnL per trade.
+    std_return : float
+        Sample standard deviation of realized PnL.
+    sharpe_ratio : float
+        Excess mean return over the standard deviation.
+    sortino_ratio : float
+        Excess mean return over the downside deviation.
+    """
 
+    avg_return: float
+    std_return: float
+    sharpe_ratio: float
+    sortino_ratio: float
 
-class RiskAdjustedReturnStatistic(PortfolioStatistic):
+    def to_dict(self) -> dict[str, Any]:
+        """Return the result as a plain dict (e.g. for serialization)."""
+        return self._asdict()
+
+
+# Shared result when there are no trades
+_ZERO_RISK_ADJUSTED_RETURN = RiskAdjustedReturnResult(
+    avg_return=0.0,
+    std_return=0.0,
+    sharpe_ratio=0.0,
+    sortino_ratio=0.0,
+)
+
+
+class RiskAdjustedReturnStatistic(_ClosedTradeStatistic):
     """
     Calculate risk-adjusted return metrics including Sharpe-like ratio.
 
     Parameters
     ----------
     risk_free_rate : float, default 0.0
-        Annualized risk-free rate for Sharpe calculation.
+        Annualized risk-free rate for Sharpe calculation, also used as the
+        Sortino target return.
     """
 
     def __init__(self, risk_free_rate: float = 0.0) -> None:
@@ -177,49 +351,106 @@ class RiskAdjustedReturnStatistic(PortfolioStatistic):
         dict[str, float]
             Dictionary with avg_return, std_return, sharpe_ratio, sortino_ratio.
         """
-        returns = []
-        for position in positions:
-            if position.is_closed and position.realized_pnl is not None:
-                returns.append(float(position.realized_pnl))
-
-        if len(returns) < 2:
-            return {
-                "avg_return": 0.0,
-                "std_return": 0.0,
-                "sharpe_ratio": 0.0,
-                "sortino_ratio": 0.0,
-            }
-
-        returns_array = np.array(returns)
-        avg_return = float(np.mean(returns_array))
-        std_return = float(np.std(returns_array))
-
-        # Sharpe ratio (using total std)
-        if std_return > 0:
-            sharpe_ratio = (avg_return - self._risk_free_rate) / std_return
-        else:
-            sharpe_ratio = 0.0
-
-        # Sortino ratio (using downside std only)
-        negative_returns = returns_array[returns_array < 0]
-        if len(negative_returns) > 0:
-            downside_std = float(np.std(negative_returns))
-            if downside_std > 0:
-                sortino_ratio = (avg_return - self._risk_free_rate) / downside_std
-            else:
-                sortino_ratio = 0.0
+        if not any(position.is_closed for position in positions):
+            return _ZERO_RISK_ADJUSTED_RETURN.to_dict()  # e.g. during warmup, skip array setup
+
+        return self.calculate_from_arrays(*_extract_arrays(positions, self._trade_cache)).to_dict()
+
+    def calculate_from_arrays(
+        self,
+        pnl: np.ndarray,
+        ts_opened: np.ndarray,
+        ts_closed: np.ndarray,
+    ) -> RiskAdjustedReturnResult:
+        """
+        Calculate risk metrics from closed-trade arrays.
+
+        Parameters
+        ----------
+        pnl : np.ndarray
+            Realized PnL per closed position, in position order.
+        ts_opened : np.ndarray
+            Open timestamps (Unix nanoseconds) per closed position.
+        ts_closed : np.ndarray
+            Close timestamps (Unix nanoseconds) per closed position.
+
+        Returns
+        -------
+        RiskAdjustedReturnResult
+            Named result with avg_return, std_return, sharpe_ratio, sortino_ratio.
+        """
+        if pnl.size < 2:
+            return _ZERO_RISK_ADJUSTED_RETURN
+
+        returns_array = pnl
+        n = returns_array.size
+        avg_return = float(returns_array.sum()) / n
+
+        # Sample standard deviation (n - 1). Squares deviations from the mean
+        # rather than using sum(r^2) - n*mean^2, which cancels badly when the
+        # mean PnL is large relative to its spread.
+        deviations = returns_array - avg_return
+        std_return = float(np.sqrt(np.dot(deviations, deviations) / (n - 1)))
+
+        risk_free_rate = self._risk_free_rate
+        excess_return = avg_return - risk_free_rate
+
+        # Sharpe ratio (using sample std)
+        sharpe_ratio = excess_return / std_return if std_return > 0 else 0.0
+
+        # Sortino ratio: downside deviation is the root mean square shortfall
+        # below the target (the risk-free rate), taken over all returns
+        shortfall = np.minimum(returns_array - risk_free_rate, 0.0)
+        downside_dev = float(np.sqrt(np.dot(shortfall, shortfall) / n))
+        if downside_dev > 0:
+            sortino_ratio = excess_return / downside_dev
         else:
-            sortino_ratio = float("inf") if avg_return > 0 else 0.0
+            sortino_ratio = float("inf") if excess_return > 0 else 0.0
 
-        return {
-            "avg_return": avg_return,
-            "std_return": std_return,
-            "sharpe_ratio": float(sharpe_ratio),
-            "sortino_ratio": float(sortino_ratio),
-        }
+        return RiskAdjustedReturnResult(
+            avg_return=avg_return,
+            std_return=std_return,
+            sharpe_ratio=sharpe_ratio,
+            sortino_ratio=sortino_ratio,
+        )
+
+
+class HoldingPeriodResult(NamedTuple):
+    """
+    Holding period summary (hours) from HoldingPeriodStatistic.
+
+    Attributes
+    ----------
+    avg_hours : float
+        Mean holding period.
+    min_hours : float
+        Shortest holding period.
+    max_hours : float
+        Longest holding period.
+    median_hours : float
+        Median holding period.
+    """
 
+    avg_hours: float
+    min_hours: float
+    max_hours: float
+    median_hours: float
 
-class HoldingPeriodStatistic(PortfolioStatistic):
+    def to_dict(self) -> dict[str, Any]:
+        """Return the result as a plain dict (e.g. for serialization)."""
+        return self._asdict()
+
+
+# Shared result when there are no trades
+_ZERO_HOLDING_PERIOD = HoldingPeriodResult(
+    avg_hours=0.0,
+    min_hours=0.0,
+    max_hours=0.0,
+    median_hours=0.0,
+)
+
+
+class HoldingPeriodStatistic(_ClosedTradeStatistic):
     """
     Analyze position holding periods.
 
@@ -243,36 +474,84 @@ class HoldingPeriodStatistic(PortfolioStatistic):
         dict[str, float]
             Dictionary with avg_hours, min_hours, max_hours, median_hours.
         """
-        holding_periods = []
+        if not any(position.is_closed for position in positions):
+            return _ZERO_HOLDING_PERIOD.to_dict()  # e.g. during warmup, skip array setup
 
-        for position in positions:
-            if not position.is_closed:
-                continue
+        return self.calculate_from_arrays(*_extract_arrays(positions, self._trade_cache)).to_dict()
 
-            # Calculate holding period in hours
-            if position.ts_closed and position.ts_opened:
-                duration_ns = position.ts_closed - position.ts_opened
-                duration_hours = duration_ns / (1e9 * 3600)  # ns to hours
-                holding_periods.append(duration_hours)
-
-        if not holding_periods:
-            return {
-                "avg_hours": 0.0,
-                "min_hours": 0.0,
-                "max_hours": 0.0,
-                "median_hours": 0.0,
-            }
-
-        periods = np.array(holding_periods)
-        return {
-            "avg_hours": float(np.mean(periods)),
-            "min_hours": float(np.min(periods)),
-            "max_hours": float(np.max(periods)),
-            "median_hours": float(np.median(periods)),
-        }
+    def calculate_from_arrays(
+        self,
+        pnl: np.ndarray,
+        ts_opened: np.ndarray,
+        ts_closed: np.ndarray,
+    ) -> HoldingPeriodResult:
+        """
+        Calculate holding period statistics from closed-trade arrays.
 
+        Parameters
+        ----------
+        pnl : np.ndarray
+            Realized PnL per closed position, in position order.
+        ts_opened : np.ndarray
+            Open timestamps (Unix nanoseconds) per closed position.
+        ts_closed : np.ndarray
+            Close timestamps (Unix nanoseconds) per closed position.
 
-class DrawdownStatistic(PortfolioStatistic):
+        Returns
+        -------
+        HoldingPeriodResult
+            Named result with avg_hours, min_hours, max_hours, median_hours.
+        """
+        # Holding period in hours, skipping positions without both timestamps
+        has_times = (ts_opened != 0) & (ts_closed != 0)
+        periods = (ts_closed[has_times] - ts_opened[has_times]) / (1e9 * 3600)  # ns to hours
+
+        if periods.size == 0:
+            return _ZERO_HOLDING_PERIOD
+
+        # One selection pass places min, max and the middle element(s) at their
+        # sorted positions, instead of separate min/max scans plus a median
+        n = periods.size
+        lower_mid = (n - 1) // 2
+        upper_mid = n // 2
+        part = np.partition(periods, (0, lower_mid, upper_mid, n - 1))
+
+        return HoldingPeriodResult(
+            avg_hours=float(periods.sum()) / n,
+            min_hours=float(part[0]),
+            max_hours=float(part[-1]),
+            median_hours=float(0.5 * (part[lower_mid] + part[upper_mid])),
+        )
+
+
+class DrawdownResult(NamedTuple):
+    """
+    Drawdown metrics from DrawdownStatistic.
+
+    Attributes
+    ----------
+    max_drawdown : float
+        Largest peak-to-trough decline in cumulative PnL.
+    avg_drawdown : float
+        Mean decline while below the running peak.
+    max_drawdown_duration_hours : float
+        Longest recovered drawdown, in hours.
+    """
+
+    max_drawdown: float
+    avg_drawdown: float
+    max_drawdown_duration_hours: float
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the result as a plain dict (e.g. for serialization)."""
+        return self._asdict()
+
+
+# Shared result when there are no trades
+_ZERO_DRAWDOWN = DrawdownResult(max_drawdown=0.0, avg_drawdown=0.0, max_drawdown_duration_hours=0.0)
+
+
+class DrawdownStatistic(_ClosedTradeStatistic):
     """
     Calculate drawdown metrics from cumulative PnL.
 
@@ -296,64 +575,110 @@ class DrawdownStatistic(PortfolioStatistic):
         dict[str, float]
             Dictionary with max_drawdown, avg_drawdown, max_drawdown_duration_hours.
         """
-        if not positions:
-            return {
-                "max_drawdown": 0.0,
-                "avg_drawdown": 0.0,
-                "max_drawdown_duration_hours": 0.0,
-            }
+        if not any(position.is_closed for position in positions):
+            return _ZERO_DRAWDOWN.to_dict()  # e.g. during warmup, skip array setup
 
-        # Build cumulative PnL series
-        cumulative_pnl = 0.0
-        pnl_series = [0.0]
-        timestamps = [0]
+        return self.calculate_from_arrays(*_extract_arrays(positions, self._trade_cache)).to_dict()
 
-        for position in positions:
-            if position.is_closed and position.realized_pnl is not None:
-                cumulative_pnl += float(position.realized_pnl)
-                pnl_series.append(cumulative_pnl)
-                if position.ts_closed:
-                    timestamps.append(position.ts_closed)
-
-        if len(pnl_series) < 2:
-            return {
-                "max_drawdown": 0.0,
-                "avg_drawdown": 0.0,
-                "max_drawdown_duration_hours": 0.0,
-            }
-
-        # Calculate drawdowns
-        pnl_array = np.array(pnl_series)
-        running_max = np.maximum.accumulate(pnl_array)
-        drawdowns = running_max - pnl_array
-
-        max_drawdown = float(np.max(drawdowns))
-        avg_drawdown = float(np.mean(drawdowns[drawdowns > 0])) if np.any(drawdowns > 0) else 0.0
-
-        # Calculate max drawdown duration
-        max_dd_duration_hours = 0.0
-        in_drawdown = False
-        dd_start_idx = 0
-
-        for i, dd in enumerate(drawdowns):
-            if dd > 0 and not in_drawdown:
-                in_drawdown = True
-                dd_start_idx = i
-            elif dd == 0 and in_drawdown:
-                in_drawdown = False
-                if len(timestamps) > i and len(timestamps) > dd_start_idx:
-                    duration_ns = timestamps[i] - timestamps[dd_start_idx]
-                    duration_hours = duration_ns / (1e9 * 3600)
-                    max_dd_duration_hours = max(max_dd_duration_hours, duration_hours)
+    def calculate_from_arrays(
+        self,
+        pnl: np.ndarray,
+        ts_opened: np.ndarray,
+        ts_closed: np.ndarray,
+    ) -> DrawdownResult:
+        """
+        Calculate drawdown metrics from closed-trade arrays.
 
-        return {
-            "max_drawdown": max_drawdown,
-            "avg_drawdown": avg_drawdown,
-            "max_drawdown_duration_hours": max_dd_duration_hours,
-        }
+        Parameters
+        ----------
+        pnl : np.ndarray
+            Realized PnL per closed position, in position order.
+        ts_opened : np.ndarray
+            Open timestamps (Unix nanoseconds) per closed position.
+        ts_closed : np.ndarray
+            Close timestamps (Unix nanoseconds) per closed position.
+
+        Returns
+        -------
+        DrawdownResult
+            Named result with max_drawdown, avg_drawdown, max_drawdown_duration_hours.
+        """
+        if pnl.size == 0:
+            return _ZERO_DRAWDOWN
+
+        # Cumulative PnL series, anchored at zero before the first trade,
+        # accumulated straight into its final buffer
+        timestamps = np.concatenate(([0], ts_closed))
+        pnl_array = np.empty(pnl.size + 1, dtype=np.float64)
+        pnl_array[0] = 0.0
+        np.cumsum(pnl, out=pnl_array[1:])
+
+        # Calculate drawdowns (the running-max buffer is reused for the result)
+        drawdowns = np.maximum.accumulate(pnl_array)
+        drawdowns -= pnl_array
+
+        # Points at the peak contribute zero, so the full sum is the in-drawdown sum
+        in_drawdown = drawdowns > 0
+        dd_count = int(np.count_nonzero(in_drawdown))
+        max_drawdown = float(drawdowns.max())
+        avg_drawdown = float(drawdowns.sum()) / dd_count if dd_count else 0.0
+
+        # Drawdown periods start where the series dips below its peak and end
+        # where it recovers; the series starts at its peak, so every end has a
+        # matching start. A drawdown still open at the end is not counted.
+        edges = np.diff(in_drawdown.astype(np.int8))
+        dd_starts = np.flatnonzero(edges == 1) + 1
+        dd_ends = np.flatnonzero(edges == -1) + 1
+        durations_ns = timestamps[dd_ends] - timestamps[dd_starts[: dd_ends.size]]
+        max_dd_duration_hours = float(durations_ns.max(initial=0)) / (1e9 * 3600)
+
+        return DrawdownResult(
+            max_drawdown=max_drawdown,
+            avg_drawdown=avg_drawdown,
+            max_drawdown_duration_hours=max_dd_duration_hours,
+        )
+
+
+class ProfitFactorResult(NamedTuple):
+    """
+    Profit factor metrics from ProfitFactorStatistic.
+
+    Attributes
+    ----------
+    profit_factor : float
+        Gross profit over gross loss.
+    gross_profit : float
+        Sum of winning trade PnL.
+    gross_loss : float
+        Sum of losing trade PnL, as a positive amount.
+    win_rate : float
+        Winning trades over winning plus losing trades.
+    total_trades : int
+        Winning plus losing trades (break-even excluded).
+    """
+
+    profit_factor: float
+    gross_profit: float
+    gross_loss: float
+    win_rate: float
+    total_trades: int
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the result as a plain dict (e.g. for serialization)."""
+        return self._asdict()
+
+
+# Shared result when there are no trades
+_ZERO_PROFIT_FACTOR = ProfitFactorResult(
+    profit_factor=0.0,
+    gross_profit=0.0,
+    gross_loss=0.0,
+    win_rate=0.0,
+    total_trades=0,
+)
 
 
-class ProfitFactorStatistic(PortfolioStatistic):
+class ProfitFactorStatistic(_ClosedTradeStatistic):
     """
     Calculate profit factor (gross profit / gross loss).
 
@@ -377,22 +702,42 @@ class ProfitFactorStatistic(PortfolioStatistic):
         dict[str, float]
             Dictionary with profit_factor, gross_profit, gross_loss, win_rate.
         """
-        gross_profit = 0.0
-        gross_loss = 0.0
-        wins = 0
-        losses = 0
+        if not any(position.is_closed for position in positions):
+            return _ZERO_PROFIT_FACTOR.to_dict()  # e.g. during warmup, skip array setup
 
-        for position in positions:
-            if not position.is_closed or position.realized_pnl is None:
-                continue
+        return self.calculate_from_arrays(*_extract_arrays(positions, self._trade_cache)).to_dict()
+
+    def calculate_from_arrays(
+        self,
+        pnl: np.ndarray,
+        ts_opened: np.ndarray,
+        ts_closed: np.ndarray,
+    ) -> ProfitFactorResult:
+        """
+        Calculate profit factor and related metrics from closed-trade arrays.
+
+        Parameters
+        ----------
+        pnl : np.ndarray
+            Realized PnL per closed position, in position order.
+        ts_opened : np.ndarray
+            Open timestamps (Unix nanoseconds) per closed position.
+        ts_closed : np.ndarray
+            Close timestamps (Unix nanoseconds) per closed position.
 
-            pnl = float(position.realized_pnl)
-            if pnl > 0:
-                gross_profit += pnl
-                wins += 1
-            elif pnl < 0:
-                gross_loss += abs(pnl)
-                losses += 1
+        Returns
+        -------
+        ProfitFactorResult
+            Named result with profit_factor, gross_profit, gross_loss, win_rate.
+        """
+        # Break-even trades fall in neither mask
+        win_mask = pnl > 0
+        loss_mask = pnl < 0
+        wins = int(np.count_nonzero(win_mask))
+        losses = int(np.count_nonzero(loss_mask))
+        gross_profit = float(pnl[win_mask].sum())
+        # abs() rather than negation, so no losses reports 0.0 and not -0.0
+        gross_loss = abs(float(pnl[loss_mask].sum()))
 
         total_trades = wins + losses
 
@@ -405,16 +750,46 @@ class ProfitFactorStatistic(PortfolioStatistic):
 
         win_rate = wins / total_trades if total_trades > 0 else 0.0
 
-        return {
-            "profit_factor": profit_factor,
-            "gross_profit": gross_profit,
-            "gross_loss": gross_loss,
-            "win_rate": win_rate,
-            "total_trades": total_trades,
-        }
+        return ProfitFactorResult(
+            profit_factor=profit_factor,
+            gross_profit=gross_profit,
+            gross_loss=gross_loss,
+            win_rate=win_rate,
+            total_trades=total_trades,
+        )
 
 
-class ExpectancyStatistic(PortfolioStatistic):
+class ExpectancyResult(NamedTuple):
+    """
+    Trade expectancy metrics from ExpectancyStatistic.
+
+    Attributes
+    ----------
+    expectancy : float
+        Expected PnL per trade.
+    avg_win : float
+        Mean winning trade PnL.
+    avg_loss : float
+        Mean losing trade PnL, as a positive amount.
+    win_rate : float
+        Winning trades over winning plus losing trades.
+    """
+
+    expectancy: float
+    avg_win: float
+    avg_loss: float
+    win_rate: float
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the result as a plain dict (e.g. for serialization)."""
+        return self._asdict()
+
+
+# Shared result when there are no trades
+_ZERO_EXPECTANCY = ExpectancyResult(expectancy=0.0, avg_win=0.0, avg_loss=0.0, win_rate=0.0)
+
+
+class ExpectancyStatistic(_ClosedTradeStatistic):
     """
     Calculate trade expectancy (average expected profit per trade).
 
@@ -438,43 +813,58 @@ class ExpectancyStatistic(PortfolioStatistic):
         dict[str, float]
             Dictionary with expectancy, avg_win, avg_loss, win_rate.
         """
-        wins = []
-        losses = []
+        if not any(position.is_closed for position in positions):
+            return _ZERO_EXPECTANCY.to_dict()  # e.g. during warmup, skip array setup
 
-        for position in positions:
-            if not position.is_closed or position.realized_pnl is None:
-                continue
+        return self.calculate_from_arrays(*_extract_arrays(positions, self._trade_cache)).to_dict()
 
-            pnl = float(position.realized_pnl)
-            if pnl > 0:
-                wins.append(pnl)
-            elif pnl < 0:
-                losses.append(abs(pnl))
+    def calculate_from_arrays(
+        self,
+        pnl: np.ndarray,
+        ts_opened: np.ndarray,
+        ts_closed: np.ndarray,
+    ) -> ExpectancyResult:
+        """
+        Calculate expectancy metrics from closed-trade arrays.
+
+        Parameters
+        ----------
+        pnl : np.ndarray
+            Realized PnL per closed position, in position order.
+        ts_opened : np.ndarray
+            Open timestamps (Unix nanoseconds) per closed position.
+        ts_closed : np.ndarray
+            Close timestamps (Unix nanoseconds) per closed position.
 
-        total_trades = len(wins) + len(losses)
+        Returns
+        -------
+        ExpectancyResult
+            Named result with expectancy, avg_win, avg_loss, win_rate.
+        """
+        # Break-even trades fall in neither mask
+        win_mask = pnl > 0
+        loss_mask = pnl < 0
+        wins = int(np.count_nonzero(win_mask))
+        losses = int(np.count_nonzero(loss_mask))
+        total_trades = wins + losses
 
         if total_trades == 0:
-            return {
-                "expectancy": 0.0,
-                "avg_win": 0.0,
-                "avg_loss": 0.0,
-                "win_rate": 0.0,
-            }
+            return _ZERO_EXPECTANCY
 
-        win_rate = len(wins) / total_trades
-        loss_rate = len(losses) / total_trades
+        win_rate = wins / total_trades
+        loss_rate = losses / total_trades
 
-        avg_win = np.mean(wins) if wins else 0.0
-        avg_loss = np.mean(losses) if losses else 0.0
+        avg_win = float(pnl[win_mask].sum()) / wins if wins else 0.0
+        avg_loss = float(-pnl[loss_mask].sum()) / losses if losses else 0.0
 
         expectancy = (win_rate * avg_win) - (loss_rate * avg_loss)
 
-        return {
-            "expectancy": float(expectancy),
-            "avg_win": float(avg_win),
-            "avg_loss": float(avg_loss),
-            "win_rate": win_rate,
-        }
+        return ExpectancyResult(
+            expectancy=expectancy,
+            avg_win=avg_win,
+            avg_loss=avg_loss,
+            win_rate=win_rate,
+        )
 
 
 class CAGRStatistic(PortfolioStatistic):
@@ -504,7 +894,12 @@ class CAGRStatistic(PortfolioStatistic):
         if duration_years <= 0:
             return 0.0
 
-        total_pnl = sum(float(p.realized_pnl) for p in positions if p.realized_pnl)
+        # realized_pnl builds a new Money on every access, so read it once
+        total_pnl = 0.0
+        for position in positions:
+            realized_pnl = position.realized_pnl
+            if realized_pnl:
+                total_pnl += float(realized_pnl)
         # Assuming initial capital of 1,000,000 if not specified
         initial_capital = 1_000_000.0
         ending_value = initial_capital + total_pnl
@@ -530,7 +925,7 @@ class CalmarRatioStatistic(PortfolioStatistic):
         """Calculate Calmar Ratio."""
         cagr = CAGRStatistic().calculate_from_positions(positions)
         drawdown = DrawdownStatistic().calculate_from_positions(positions)
-        max_dd = drawdown.get("max_drawdown", 0.0)
+        max_dd = drawdown["max_drawdown"]
 
         if max_dd <= 0:
             return float("inf") if cagr > 0 else 0.0
@@ -541,3 +936,52 @@ class CalmarRatioStatistic(PortfolioStatistic):
             return 0.0
 
         return float(cagr / max_dd_pct)
+
+
+class BatchedPortfolioStatistics(_ClosedTradeStatistic):
+    """
+    Run several position statistics over a single pass of the positions.
+
+    Each registered statistic walks the full position list on its own. This
+    composite extracts the closed-trade arrays once and hands them to every
+    wrapped statistic's ``calculate_from_arrays``, so register this single
+    instance in place of the individual statistics.
+
+    Parameters
+    ----------
+    statistics : dict[str, PortfolioStatistic], optional
+        Result key to statistic exposing ``calculate_from_arrays``. Defaults to
+        the six position statistics in this module.
+    """
+
+    def __init__(self, statistics: dict[str, PortfolioStatistic] | None = None) -> None:
+        super().__init__()
+        self._name = "Position Statistics"
+        self._statistics = statistics or {
+            "win_streaks": WinStreakStatistic(),
+            "risk_adjusted": RiskAdjustedReturnStatistic(),
+            "holding_period": HoldingPeriodStatistic(),
+            "drawdown": DrawdownStatistic(),
+            "profit_factor": ProfitFactorStatistic(),
+            "expectancy": ExpectancyStatistic(),
+        }
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    def calculate_from_positions(self, positions: list[Position]) -> dict[str, Any]:
+        """
+        Calculate every wrapped statistic from one extraction pass.
+
+        Returns
+        -------
+        dict[str, Any]
+            Each wrapped statistic's result dict under its key, e.g.
+            ``results["drawdown"]["max_drawdown"]``.
+        """
+        arrays = _extract_arrays(positions, self._trade_cache)
+        return {
+            key: statistic.calculate_from_arrays(*arrays).to_dict()
+            for key, statistic in self._statistics.items()
+        }
@@ -0,0 +1,84 @@
+"""
+Implement Skill Tests: Conftest
+
+Shared fixtures for the nt-implement template tests.
+"""
+
+import importlib.util
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+
+# Template modules are loaded from disk — they are not installed as a package
+_templates = Path(__file__).parent.parent / "templates"
+
+HOUR_NS = 3600 * 1_000_000_000
+
+
+def _load_module(name: str):
+    # Reuse a template another test file already loaded
+    if name in sys.modules:
+        return sys.modules[name]
+    # Dotted names reach into template subdirectories (e.g. "adapters.internal")
+    path = _templates.joinpath(*name.split(".")).with_suffix(".py")
+    spec = importlib.util.spec_from_file_location(name, path)
+    mod = importlib.util.module_from_spec(spec)
+    sys.modules[name] = mod
+    try:
+        spec.loader.exec_module(mod)
+    except BaseException:
+        del sys.modules[name]
+        raise
+    return mod
+
+
+# ─── TEMPLATE FIXTURES ─────────────────────────────────────────────────────────
+
+
+@pytest.fixture(scope="session")
+def portfolio_statistic():
+    """The portfolio statistic template module."""
+    return _load_module("portfolio_statistic")
+
+
+@pytest.fixture(scope="session")
+def exec_algorithm():
+    """The execution algorithm template module."""
+    return _load_module("exec_algorithm")
+
+
+@pytest.fixture(scope="session")
+def internal_adapter():
+    """The internal adapter template module."""
+    return _load_module("adapters.internal")
+
+
+# ─── POSITION FIXTURES ─────────────────────────────────────────────────────────
+
+
+@pytest.fixture
+def make_positions():
+    """
+    Factory for closed-position stubs, one per PnL value.
+
+    Position i opens at hour i + 1 and closes an hour later, exposing only
+    the fields the statistics read.
+    """
+
+    def _make(pnls: list[float]) -> list[SimpleNamespace]:
+        return [
+            SimpleNamespace(
+                id=f"P-{i}",
+                is_closed=True,
+                event_count=2,
+                realized_pnl=pnl,
+                ts_opened=(i + 1) * HOUR_NS,
+                ts_closed=(i + 2) * HOUR_NS,
+            )
+            for i, pnl in enumerate(pnls)
+        ]
+
+    return _make
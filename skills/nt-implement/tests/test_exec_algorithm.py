@@ -0,0 +1,143 @@
+"""
+Implement Skill Tests: Execution Algorithm
+
+Drives the slicing logic in templates/exec_algorithm.py on a stub host:
+- One recurring timer per parent order, advancing a slice cursor
+- The timer cancelled and state dropped after the last slice
+- Single-slice orders submitted straight away, with no timer
+- on_stop cancelling outstanding timers
+- Slice sizes summing to the parent quantity, remainder in the last slice
+"""
+
+from datetime import timedelta
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from nautilus_trader.model.objects import Quantity
+from nautilus_trader.test_kit.providers import TestInstrumentProvider
+
+
+@pytest.fixture(scope="session")
+def btcusdt():
+    return TestInstrumentProvider.btcusdt_binance()
+
+
+@pytest.fixture(scope="session")
+def stub_algorithm_cls(exec_algorithm):
+    """A plain class carrying MyExecAlgorithm's slicing methods."""
+    algorithm_cls = exec_algorithm.MyExecAlgorithm
+    names = (
+        "on_stop",
+        "on_order",
+        "_calculate_slice_sizes",
+        "_submit_child",
+        "_on_slice_timer",
+        "_on_scheduled_slice",
+    )
+    return type("StubExecAlgorithm", (), {name: vars(algorithm_cls)[name] for name in names})
+
+
+@pytest.fixture
+def algorithm(stub_algorithm_cls, btcusdt):
+    """A stub host whose clock, cache and order submission are mocks."""
+    algorithm = stub_algorithm_cls()
+    algorithm.log = MagicMock()
+    algorithm.clock = MagicMock()
+    algorithm.cache = SimpleNamespace(instrument=lambda instrument_id: btcusdt)
+    algorithm.submit_order = MagicMock()
+    algorithm.spawn_market = MagicMock(
+        side_effect=lambda primary, quantity, time_in_force: SimpleNamespace(quantity=quantity)
+    )
+    algorithm._scheduled_sizes = {}
+    algorithm._slice_cursors = {}
+    return algorithm
+
+
+def _parent(btcusdt, quantity: str, horizon_secs: int, interval_secs: int) -> SimpleNamespace:
+    return SimpleNamespace(
+        client_order_id=SimpleNamespace(value="O-1"),
+        instrument_id=btcusdt.id,
+        quantity=Quantity.from_str(quantity),
+        exec_algorithm_params={"horizon_secs": horizon_secs, "interval_secs": interval_secs},
+    )
+
+
+def _tick(algorithm, order_key: str = "O-1") -> None:
+    algorithm._on_slice_timer(SimpleNamespace(name=order_key))
+
+
+def _submitted(algorithm) -> list:
+    return [call.args[0] for call in algorithm.submit_order.call_args_list]
+
+
+class TestSliceTimer:
+    def test_first_slice_submitted_and_timer_set(self, algorithm, btcusdt):
+        parent = _parent(btcusdt, "0.300000", horizon_secs=30, interval_secs=10)
+        algorithm.on_order(parent)
+
+        assert len(_submitted(algorithm)) == 1
+        assert algorithm._slice_cursors == {"O-1": (parent, 1)}
+        timer = algorithm.clock.set_timer.call_args.kwargs
+        assert timer["name"] == "O-1"
+        assert timer["interval"] == timedelta(seconds=10)
+
+    def test_cursor_advances_until_last_slice_cancels_timer(self, algorithm, btcusdt):
+        parent = _parent(btcusdt, "0.300000", horizon_secs=30, interval_secs=10)
+        algorithm.on_order(parent)
+
+        _tick(algorithm)
+        assert algorithm._slice_cursors["O-1"] == (parent, 2)
+        algorithm.clock.cancel_timer.assert_not_called()
+
+        _tick(algorithm)  # Last slice: the parent itself goes out
+        assert _submitted(algorithm)[-1] is parent
+        assert len(_submitted(algorithm)) == 3
+        algorithm.clock.cancel_timer.assert_called_once_with("O-1")
+        assert algorithm._slice_cursors == {}
+        assert algorithm._scheduled_sizes == {}
+
+        _tick(algorithm)  # A stray tick after cancellation is ignored
+        assert len(_submitted(algorithm)) == 3
+
+    def test_single_slice_submits_parent_without_timer(self, algorithm, btcusdt):
+        parent = _parent(btcusdt, "0.300000", horizon_secs=10, interval_secs=10)
+        algorithm.on_order(parent)
+
+        assert _submitted(algorithm) == [parent]
+        algorithm.clock.set_timer.assert_not_called()
+        assert algorithm._slice_cursors == {}
+        assert algorithm._scheduled_sizes == {}
+
+    def test_on_stop_cancels_outstanding_timers(self, algorithm, btcusdt):
+        algorithm.on_order(_parent(btcusdt, "0.300000", horizon_secs=30, interval_secs=10))
+        algorithm.on_stop()
+
+        algorithm.clock.cancel_timer.assert_called_once_with("O-1")
+        assert algorithm._slice_cursors == {}
+        assert algorithm._scheduled_sizes == {}
+
+
+class TestSliceSizes:
+    @pytest.mark.parametrize(
+        "total,num_slices,expected_last",
+        [
+            pytest.param(1.0, 3, "0.333334", id="remainder-rounds-up"),
+            pytest.param(0.2, 4, "0.050000", id="even-split"),
+            pytest.param(0.000005, 2, "0.000002", id="remainder-rounds-down"),
+        ],
+    )
+    def test_sizes_sum_to_total_with_remainder_last(
+        self, algorithm, btcusdt, total, num_slices, expected_last
+    ):
+        sizes = algorithm._calculate_slice_sizes(btcusdt, total, num_slices)
+
+        assert len(sizes) == num_slices
+        assert sum(sizes[1:], sizes[0]) == btcusdt.make_qty(total)
+        assert sizes[-1] == Quantity.from_str(expected_last)
+
+    def test_leading_slices_share_one_quantity(self, algorithm, btcusdt):
+        sizes = algorithm._calculate_slice_sizes(btcusdt, 1.0, 4)
+
+        assert all(size is sizes[0] for size in sizes[:-1])
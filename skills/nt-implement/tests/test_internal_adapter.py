@@ -0,0 +1,90 @@
+"""
+Implement Skill Tests: Internal Adapter
+
+Drives the FeatureStoreAdapter cache in templates/adapters/internal.py on a
+stub host with a test clock:
+- Entries expire after cache_ttl_seconds of actor clock time
+- The cache holds at most cache_max_entries, evicting the oldest refresh
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from nautilus_trader.common.component import TestClock
+
+
+SECOND_NS = 1_000_000_000
+
+
+@pytest.fixture(scope="session")
+def stub_adapter_cls(internal_adapter):
+    """A plain class carrying FeatureStoreAdapter's cache methods."""
+    adapter_cls = internal_adapter.FeatureStoreAdapter
+    names = ("_refresh_features", "_cache_features", "get_cached_features")
+    return type("StubFeatureStoreAdapter", (), {name: vars(adapter_cls)[name] for name in names})
+
+
+@pytest.fixture
+def make_adapter(internal_adapter, stub_adapter_cls):
+    """Factory for a stub adapter on a test clock, publishing to a mock."""
+
+    def _make(**config_kwargs):
+        adapter = stub_adapter_cls()
+        adapter.config = internal_adapter.FeatureStoreAdapterConfig(
+            database_url="postgresql://features", **config_kwargs
+        )
+        adapter.clock = TestClock()
+        adapter.publish_data = MagicMock()
+        adapter._feature_cache = {}
+        adapter._features_data_type = None
+        return adapter
+
+    return _make
+
+
+class TestFeatureCache:
+    def test_entry_expires_after_ttl(self, make_adapter):
+        adapter = make_adapter(cache_ttl_seconds=60)
+        adapter._refresh_features("BTCUSDT")
+        features = adapter.get_cached_features("BTCUSDT")
+
+        assert features is not None
+        assert features.instrument == "BTCUSDT"
+
+        adapter.clock.set_time(60 * SECOND_NS - 1)
+        assert adapter.get_cached_features("BTCUSDT") is features
+
+        adapter.clock.set_time(60 * SECOND_NS)
+        assert adapter.get_cached_features("BTCUSDT") is None
+        assert "BTCUSDT" not in adapter._feature_cache
+
+    def test_cache_evicts_oldest_refresh_at_capacity(self, make_adapter):
+        adapter = make_adapter(cache_max_entries=2)
+        adapter._refresh_features("BTCUSDT")
+        adapter._refresh_features("ETHUSDT")
+        adapter._refresh_features("BTCUSDT")  # Refreshed — now the newest
+        adapter._refresh_features("SOLUSDT")
+
+        assert list(adapter._feature_cache) == ["BTCUSDT", "SOLUSDT"]
+        assert adapter.get_cached_features("ETHUSDT") is None
+
+    def test_refresh_builds_features_from_vector(self, make_adapter):
+        adapter = make_adapter()
+        adapter.clock.set_time(5 * SECOND_NS)
+        adapter._refresh_features("BTCUSDT")
+        features = adapter.get_cached_features("BTCUSDT")
+
+        assert features.features == (100.5, 55.3)
+        assert features.ts_event == features.ts_init == 5 * SECOND_NS
+        adapter.publish_data.assert_called_once_with(None, features)
+
+    def test_missing_instrument_returns_none(self, make_adapter):
+        assert make_adapter().get_cached_features("BTCUSDT") is None
+
+    def test_non_positive_max_entries_rejected(self, internal_adapter):
+        config = internal_adapter.FeatureStoreAdapterConfig(
+            database_url="postgresql://features", cache_max_entries=0
+        )
+        with pytest.raises(ValueError, match="cache_max_entries"):
+            internal_adapter.FeatureStoreAdapter(config)
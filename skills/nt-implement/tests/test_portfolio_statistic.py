@@ -0,0 +1,138 @@
+"""
+Implement Skill Tests: Portfolio Statistics
+
+Pins the position statistics in templates/portfolio_statistic.py against
+hand-computed values:
+- Sharpe (sample std) and Sortino (target downside deviation)
+- Win/loss streaks, with break-even trades resetting both
+- Drawdown depth and duration, counting only recovered drawdowns
+- BatchedPortfolioStatistics agreeing with the individual statistics
+"""
+
+import math
+from types import SimpleNamespace
+
+import pytest
+
+
+class TestRiskAdjustedReturn:
+    """PnL [10, -5, 15, -10]: mean 2.5, squared deviations sum to 425."""
+
+    PNLS = [10.0, -5.0, 15.0, -10.0]
+
+    def test_sharpe_uses_sample_std(self, portfolio_statistic, make_positions):
+        stat = portfolio_statistic.RiskAdjustedReturnStatistic()
+        result = stat.calculate_from_positions(make_positions(self.PNLS))
+
+        assert result["avg_return"] == pytest.approx(2.5)
+        assert result["std_return"] == pytest.approx(math.sqrt(425 / 3))
+        assert result["sharpe_ratio"] == pytest.approx(2.5 / math.sqrt(425 / 3))
+
+    def test_sortino_uses_target_downside_deviation(self, portfolio_statistic, make_positions):
+        stat = portfolio_statistic.RiskAdjustedReturnStatistic()
+        result = stat.calculate_from_positions(make_positions(self.PNLS))
+
+        # Shortfalls below 0: [0, -5, 0, -10] → sqrt((25 + 100) / 4)
+        assert result["sortino_ratio"] == pytest.approx(2.5 / math.sqrt(125 / 4))
+
+    def test_risk_free_rate_is_sortino_target(self, portfolio_statistic, make_positions):
+        stat = portfolio_statistic.RiskAdjustedReturnStatistic(risk_free_rate=1.0)
+        result = stat.calculate_from_positions(make_positions(self.PNLS))
+
+        # Shortfalls below 1: [0, -6, 0, -11] → sqrt((36 + 121) / 4)
+        assert result["sharpe_ratio"] == pytest.approx(1.5 / math.sqrt(425 / 3))
+        assert result["sortino_ratio"] == pytest.approx(1.5 / math.sqrt(157 / 4))
+
+
+class TestWinStreaks:
+    def test_break_even_trade_resets_streak(self, portfolio_statistic, make_positions):
+        # Without the reset the opening wins would form a run of 3
+        positions = make_positions([1.0, 2.0, 0.0, 3.0, -1.0, -2.0, -3.0, 4.0])
+        result = portfolio_statistic.WinStreakStatistic().calculate_from_positions(positions)
+
+        assert result == {"max_win_streak": 2, "max_loss_streak": 3, "current_streak": 1}
+
+    def test_current_streak_negative_when_losing(self, portfolio_statistic, make_positions):
+        positions = make_positions([1.0, -1.0, -2.0])
+        result = portfolio_statistic.WinStreakStatistic().calculate_from_positions(positions)
+
+        assert result["current_streak"] == -2
+
+
+class TestDrawdown:
+    def test_unrecovered_tail_not_counted_in_duration(self, portfolio_statistic, make_positions):
+        # Cumulative PnL 10, 5, 15, 12, 8, 6, 7: a 1h drawdown that recovers,
+        # then a 3h drawdown still open at the end
+        positions = make_positions([10.0, -5.0, 10.0, -3.0, -4.0, -2.0, 1.0])
+        result = portfolio_statistic.DrawdownStatistic().calculate_from_positions(positions)
+
+        assert result["max_drawdown"] == pytest.approx(9.0)
+        assert result["avg_drawdown"] == pytest.approx((5 + 3 + 7 + 9 + 8) / 5)
+        assert result["max_drawdown_duration_hours"] == pytest.approx(1.0)
+
+    def test_no_losses_no_drawdown(self, portfolio_statistic, make_positions):
+        positions = make_positions([1.0, 2.0])
+        result = portfolio_statistic.DrawdownStatistic().calculate_from_positions(positions)
+
+        assert result == {
+            "max_drawdown": 0.0,
+            "avg_drawdown": 0.0,
+            "max_drawdown_duration_hours": 0.0,
+        }
+
+
+class TestProfitFactor:
+    def test_no_losses_reports_positive_zero(self, portfolio_statistic, make_positions):
+        result = portfolio_statistic.ProfitFactorStatistic().calculate_from_positions(
+            make_positions([1.0, 2.0])
+        )
+
+        assert result["gross_loss"] == 0.0
+        assert math.copysign(1.0, result["gross_loss"]) == 1.0  # Not -0.0
+        assert result["profit_factor"] == float("inf")
+
+
+class TestBatchedPortfolioStatistics:
+    def test_matches_individual_statistics(self, portfolio_statistic, make_positions):
+        positions = make_positions([10.0, -5.0, 0.0, 15.0, -10.0, 4.0])
+        positions.append(SimpleNamespace(id="P-open", is_closed=False))  # Skipped
+
+        batched = portfolio_statistic.BatchedPortfolioStatistics().calculate_from_positions(
+            positions
+        )
+
+        individual = {
+            "win_streaks": portfolio_statistic.WinStreakStatistic(),
+            "risk_adjusted": portfolio_statistic.RiskAdjustedReturnStatistic(),
+            "holding_period": portfolio_statistic.HoldingPeriodStatistic(),
+            "drawdown": portfolio_statistic.DrawdownStatistic(),
+            "profit_factor": portfolio_statistic.ProfitFactorStatistic(),
+            "expectancy": portfolio_statistic.ExpectancyStatistic(),
+        }
+        assert batched.keys() == individual.keys()
+        for key, stat in individual.items():
+            assert batched[key] == pytest.approx(stat.calculate_from_positions(positions)), key
+
+    def test_trade_cache_is_per_instance_and_reset_clears_it(
+        self, portfolio_statistic, make_positions
+    ):
+        positions = make_positions([1.0, -1.0])
+        stat = portfolio_statistic.BatchedPortfolioStatistics()
+        stat.calculate_from_positions(positions)
+
+        assert len(stat._trade_cache) == 2
+        assert not portfolio_statistic.BatchedPortfolioStatistics()._trade_cache
+        stat.reset()
+        assert not stat._trade_cache
+
+    def test_rerun_with_same_position_ids_is_not_served_stale(
+        self, portfolio_statistic, make_positions
+    ):
+        # A re-run after engine.reset() reuses position ids, timestamps and event counts
+        stat = portfolio_statistic.ProfitFactorStatistic()
+        first = stat.calculate_from_positions(make_positions([10.0]))
+        second = stat.calculate_from_positions(make_positions([-7.0]))
+
+        assert first["gross_profit"] == 10.0
+        assert second["gross_profit"] == 0.0
+        assert second["gross_loss"] == 7.0
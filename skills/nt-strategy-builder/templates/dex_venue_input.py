@@ -17,22 +17,21 @@ Replace placeholder names with your actual adapter package.
 
 import asyncio
 import os
-from decimal import Decimal
-from pathlib import Path
+import pickle
 
 from nautilus_trader.backtest.engine import BacktestEngine
 from nautilus_trader.backtest.models import FillModel
-from nautilus_trader.config import (
-    BacktestDataConfig,
-    LiveExecEngineConfig,
-    TradingNodeConfig,
-)
+from nautilus_trader.config import LiveExecEngineConfig, TradingNodeConfig
+from nautilus_trader.core.datetime import time_object_to_dt
 from nautilus_trader.live.node import TradingNode
 from nautilus_trader.model.currencies import USDT
+from nautilus_trader.model.data import OrderBookDelta, TradeTick, capsule_to_list
 from nautilus_trader.model.enums import AccountType, OmsType
 from nautilus_trader.model.identifiers import TraderId, Venue
+from nautilus_trader.model.instruments import Instrument
 from nautilus_trader.model.objects import Money
 from nautilus_trader.persistence.catalog import ParquetDataCatalog
+from nautilus_trader.persistence.funcs import class_to_filename, urisafe_identifier
 
 # ─── DEX ADAPTER IMPORTS ───────────────────────────────────────────────────────
 # Built using nt-dex-adapter skill. Swap with your actual package:
@@ -47,11 +46,191 @@ from nautilus_trader.persistence.catalog import ParquetDataCatalog
 # from my_package.strategies import MyStrategy, MyStrategyConfig
 
 
+# =============================================================================
+# Catalog file index
+# =============================================================================
+
+def _filename_timestamps(path: str) -> tuple[int, int] | None:
+    """
+    Parse the ts_event interval from a catalog file name.
+
+    Catalog files are named ``<first>_<last>.parquet`` with timestamps written
+    as ``2023-10-26T07-30-50-123456789Z``. Returns None for any other name.
+    """
+    name = path.rsplit("/", 1)[-1].removesuffix(".parquet")
+    try:
+        bounds = []
+        for part in name.split("_"):
+            date, clock = part.split("T")
+            hours, minutes, seconds, nanos = clock.removesuffix("Z").split("-")
+            iso = f"{date}T{hours}:{minutes}:{seconds}.{nanos}Z"
+            bounds.append(time_object_to_dt(iso).value)
+    except ValueError:
+        return None
+    if len(bounds) != 2:
+        return None
+    return bounds[0], bounds[1]
+
+
+class CatalogFileIndex:
+    """
+    Lists a ParquetDataCatalog's parquet files once and serves queries from it.
+
+    Each ``catalog.trade_ticks()`` / ``order_book_deltas()`` / ``instruments()``
+    call globs the catalog again (``instruments()`` once per Instrument
+    subclass). For catalogs with thousands of per-day, per-instrument files
+    those walks dominate backtest startup. This index walks ``data/`` once,
+    splits each path into its data-class and identifier directories at build
+    time, and hands explicit file lists to the catalog.
+
+    Catalog file names encode the min/max ``ts_event`` they hold, so the
+    index also records that interval and drops files outside a requested
+    ``start``/``end`` window without opening them.
+
+    Parameters
+    ----------
+    catalog : ParquetDataCatalog
+        The catalog to index. Rebuild the index after writing new data.
+    scan_reverse : bool, default False
+        If True, files are read in reverse order. Alternating this between
+        repeated runs on a catalog larger than RAM starts each run on the
+        files the previous run read last, which are still in the OS page
+        cache. Order is per file, never per row, so parquet read-ahead is
+        unaffected; the engine sorts the data by timestamp either way.
+    """
+
+    def __init__(self, catalog: ParquetDataCatalog, scan_reverse: bool = False) -> None:
+        self.catalog = catalog
+        self.scan_reverse = scan_reverse
+
+        # data/<class dir>/<identifier dir>/<file>.parquet
+        #   → {class dir: [(identifier, min_ts, max_ts, path)]}
+        self._files: dict[str, list[tuple[str, int, int, str]]] = {}
+        root = f"{catalog.path.rstrip('/')}/data/"
+        for path in catalog.fs.glob(f"{root}**/*.parquet"):
+            parts = path[len(root):].split("/")
+            min_ts, max_ts = _filename_timestamps(path) or (0, 2**63 - 1)
+            self._files.setdefault(parts[0], []).append((parts[-2], min_ts, max_ts, path))
+
+    def files(
+        self,
+        data_cls: type,
+        instrument_ids: list[str] | None = None,
+        start: str | int | None = None,
+        end: str | int | None = None,
+    ) -> list[str]:
+        """Return the indexed files for ``data_cls`` overlapping the query."""
+        entries = self._files.get(class_to_filename(data_cls), [])
+        if instrument_ids is not None:
+            wanted = {urisafe_identifier(instrument_id) for instrument_id in instrument_ids}
+            entries = [entry for entry in entries if entry[0] in wanted]
+        start_ns = time_object_to_dt(start).value if start is not None else 0
+        end_ns = time_object_to_dt(end).value if end is not None else 2**63 - 1
+        files = [
+            path
+            for _, min_ts, max_ts, path in entries
+            if min_ts <= end_ns and start_ns <= max_ts
+        ]
+        if self.scan_reverse:
+            files.reverse()
+        return files
+
+    def instruments(self, instrument_ids: list[str] | None = None) -> list[Instrument]:
+        instruments: list[Instrument] = []
+        for cls in Instrument.__subclasses__():
+            files = self.files(cls, instrument_ids)
+            if files:
+                instruments.extend(self.catalog.query(cls, files=files))
+        return instruments
+
+    def trade_ticks(
+        self,
+        instrument_ids: list[str] | None = None,
+        start: str | int | None = None,
+        end: str | int | None = None,
+    ) -> list[TradeTick]:
+        return self._query_rust(TradeTick, instrument_ids, start, end)
+
+    def order_book_deltas(
+        self,
+        instrument_ids: list[str] | None = None,
+        start: str | int | None = None,
+        end: str | int | None = None,
+    ) -> list[OrderBookDelta]:
+        return self._query_rust(OrderBookDelta, instrument_ids, start, end)
+
+    def _query_rust(
+        self,
+        data_cls: type,
+        instrument_ids: list[str] | None,
+        start: str | int | None,
+        end: str | int | None,
+    ) -> list:
+        # catalog.query() drops to PyArrow when given files, the Rust session does not
+        files = self.files(data_cls, instrument_ids, start, end)
+        if not files:
+            return []
+        session = self.catalog.backend_session(data_cls, start=start, end=end, files=files)
+        data: list = []
+        for chunk in session.to_query_result():
+            data.extend(capsule_to_list(chunk))
+        return data
+
+
+def cached_instruments(index: CatalogFileIndex, cache_path: str | None = None) -> list[Instrument]:
+    """
+    Load the catalog's instruments, optionally reusing a pickled copy between runs.
+
+    Research loops re-run the same backtest many times while tuning
+    parameters; decoding every instrument from parquet on each run is pure
+    repeat work. With ``cache_path`` set, the instruments are pickled there,
+    keyed by the path, size and mtime of every instrument file, so writing or
+    replacing instruments invalidates the copy. Without it, nothing is cached.
+
+    ``cache_path`` must be a local file only you write to: it is unpickled on
+    load. Keep it outside the catalog, which may be shared or read-only. A
+    failed write is ignored; the instruments are still returned.
+    """
+    if cache_path is None:
+        return index.instruments()
+
+    catalog = index.catalog
+    key = []
+    for cls in Instrument.__subclasses__():
+        for path in index.files(cls):
+            info = catalog.fs.info(path)
+            key.append((path, info["size"], info.get("mtime")))
+    key.sort()
+
+    try:
+        with open(cache_path, "rb") as f:
+            cached_key, instruments = pickle.load(f)
+        if cached_key == key:
+            return instruments
+    except (OSError, EOFError, pickle.UnpicklingError):
+        pass  # Missing or unreadable cache → rebuild
+
+    instruments = index.instruments()
+    try:
+        with open(cache_path, "wb") as f:
+            pickle.dump((key, instruments), f)
+    except OSError:
+        pass  # Unwritable location → run uncached
+    return instruments
+
+
 # =============================================================================
 # Option A: BacktestEngine with DEX adapter venue
 # =============================================================================
 
-def run_dex_backtest(catalog_path: str = "/path/to/catalog") -> None:
+def run_dex_backtest(
+    catalog_path: str = "/path/to/catalog",
+    start: str | None = None,
+    end: str | None = None,
+    scan_reverse: bool = False,
+    instruments: list[str] | None = None,
+    instruments_cache: str | None = None,
+) -> None:
     """
     Run a backtest using DEX data stored in a catalog.
 
@@ -64,9 +243,20 @@ def run_dex_backtest(catalog_path: str = "/path/to/catalog") -> None:
             trades = await my_dex.fetch_trades(pool="0x...", days=30)
             catalog.write_data(trades)
 
-    Then run this function using the pre-filled catalog.
+    Then run this function using the pre-filled catalog. Pass ``start``/``end``
+    (e.g. "2024-01-01") to backtest a window; catalog files entirely outside
+    it are never opened. Likewise, pass ``instruments`` (e.g.
+    ["WETH-USDC.UNISWAP_V3"]) to load only the pools the strategy trades; the
+    catalog stores one directory per instrument, so other pools' files are
+    skipped without being read.
+
+    When re-running on a catalog larger than RAM (e.g. parameter sweeps),
+    flip ``scan_reverse`` between runs so each run starts on the files the
+    previous one left in the OS page cache. For such sweeps, also pass
+    ``instruments_cache`` (a local file path you own) to skip re-decoding the
+    instruments on every run.
     """
-    catalog = ParquetDataCatalog(catalog_path)
+    catalog = CatalogFileIndex(ParquetDataCatalog(catalog_path), scan_reverse=scan_reverse)
 
     # DEX-realistic fill model
     dex_fill_model = FillModel(
@@ -89,12 +279,13 @@ def run_dex_backtest(catalog_path: str = "/path/to/catalog") -> None:
     )
 
     # Load instruments from catalog (written by DEX adapter's instrument provider)
-    for instrument in catalog.instruments():
-        engine.add_instrument(instrument)
+    for instrument in cached_instruments(catalog, instruments_cache):
+        if instruments is None or instrument.id.value in instruments:
+            engine.add_instrument(instrument)
 
     # Load DEX data from catalog
-    engine.add_data(catalog.trade_ticks())          # On-chain swaps as TradeTick
-    engine.add_data(catalog.order_book_deltas())    # AMM pool state deltas
+    engine.add_data(catalog.trade_ticks(instruments, start, end))        # On-chain swaps as TradeTick
+    engine.add_data(catalog.order_book_deltas(instruments, start, end))  # AMM pool state deltas
 
     # Add strategy
     # engine.add_strategy(MyStrategy(MyStrategyConfig(
@@ -141,7 +332,8 @@ async def run_dex_live_node() -> None:
         #         ws_rpc_url=os.environ.get("ETH_WS_RPC_URL"),
         #         wallet_address=os.environ["WALLET_ADDRESS"],
         #         pools=["0xCBCdF9626bC03E24f779434178A73a0B4bad62eD"],  # WBTC/ETH 0.3%
-        #         poll_interval_secs=2.0,   # DEX: poll chain every 2s (no WS streaming)
+        #         poll_interval_secs=2.0,   # DEX: fallback poll every 2s while WS is down
+        #         batch_size=50,            # Pools read per Multicall3 eth_call
         #         sandbox_mode=False,
         #     ),
         # },
@@ -14,19 +14,19 @@ use the LiveNode path in nt-live.
 """
 
 import asyncio
-from collections import deque
-from decimal import Decimal
+
+import numpy as np
 
 from nautilus_trader.config import LiveExecEngineConfig, TradingNodeConfig
-from nautilus_trader.core.data import Data
 from nautilus_trader.live.node import TradingNode
-from nautilus_trader.model.data import Bar, BarType, QuoteTick
+from nautilus_trader.model.data import QuoteTick
 from nautilus_trader.model.enums import OrderSide
-from nautilus_trader.model.identifiers import InstrumentId, TraderId, Venue
-from nautilus_trader.model.objects import Quantity
+from nautilus_trader.model.identifiers import InstrumentId, TraderId
 from nautilus_trader.trading.config import StrategyConfig
 from nautilus_trader.trading.strategy import Strategy
 
+SPREAD_HISTORY_LEN = 100
+
 # ─── MULTI-VENUE STRATEGY CONFIG ───────────────────────────────────────────────
 
 
@@ -46,6 +46,10 @@ class MultiVenueStrategyConfig(StrategyConfig, frozen=True):
         Maximum position size per side.
     trade_primary : bool
         If True, trade on primary venue; if False, trade on secondary.
+    log_spreads : bool
+        If True, log every evaluated spread at DEBUG level. The logger cannot
+        report its level, so this keeps per-tick message formatting off the
+        hot path unless explicitly requested.
     """
 
     primary_instrument_id: str
@@ -53,6 +57,7 @@ class MultiVenueStrategyConfig(StrategyConfig, frozen=True):
     min_spread_bps: float = 10.0
     max_position_size: float = 1.0
     trade_primary: bool = True
+    log_spreads: bool = False
 
 
 # ─── MULTI-VENUE STRATEGY ──────────────────────────────────────────────────────
@@ -76,15 +81,50 @@ class MultiVenueStrategy(Strategy):
         self.primary_id = InstrumentId.from_str(config.primary_instrument_id)
         self.secondary_id = InstrumentId.from_str(config.secondary_instrument_id)
 
+        # Config is frozen — resolve per-tick settings once as plain attributes
+        self._min_spread_bps = float(config.min_spread_bps)
+        self._max_pos = float(config.max_position_size)
+        self._trade_primary = bool(config.trade_primary)
+        self._log_spreads = bool(config.log_spreads)
+
         self.primary_instrument = None
         self.secondary_instrument = None
 
-        # Latest quotes, keyed separately per venue
+        # Latest quotes, keyed separately per venue, with mids computed on arrival
         self._primary_quote: QuoteTick | None = None
         self._secondary_quote: QuoteTick | None = None
+        self._primary_mid = 0.0
+        self._secondary_mid = 0.0
+        # Set by position events so a spread blocked by _can_trade is re-checked
+        # on the next tick even when neither mid has moved
+        self._recheck_spread = False
+
+        # Tick routing: one hash probe per tick, stays O(1) as venues are added
+        self._venue_slot = {
+            self.primary_id: self._set_primary,
+            self.secondary_id: self._set_secondary,
+        }
+
+        # Net position sizes, refreshed only after a portfolio position event bumps
+        # the revision (any strategy's fills move portfolio.net_position)
+        self._positions_rev = 0
+        self._cached_positions_rev = -1
+        self._cached_primary_pos = 0.0
+        self._cached_secondary_pos = 0.0
+
+        # Spread history for monitoring: ring buffer so stats are numpy reductions
+        self._spread_buf = np.empty(SPREAD_HISTORY_LEN, dtype=np.float64)
+        self._spread_idx = 0  # Total spreads recorded; slot is idx % SPREAD_HISTORY_LEN
+
+    @property
+    def spread_view(self) -> np.ndarray:
+        """
+        The recorded spreads (bps), up to the last ``SPREAD_HISTORY_LEN``.
 
-        # Spread history for monitoring
-        self._spread_history: deque[float] = deque(maxlen=100)
+        Once the buffer has wrapped, the values are not in arrival order, which
+        is fine for order-free stats (mean, std, quantiles).
+        """
+        return self._spread_buf[: self._spread_idx]
 
     # ─── LIFECYCLE ─────────────────────────────────────────────────────────────
 
@@ -102,61 +142,105 @@ class MultiVenueStrategy(Strategy):
             self.stop()
             return
 
-        # Subscribe to both venues
-        self.subscribe_quote_ticks(self.primary_id)
-        self.subscribe_quote_ticks(self.secondary_id)
+        # Subscribe to every routed venue — adding a venue only touches _venue_slot
+        for instrument_id in self._venue_slot:
+            self.subscribe_quote_ticks(instrument_id)
+
+        # Net positions are portfolio-wide, so listen to every strategy's position events
+        self.msgbus.subscribe(
+            topic="events.position.*",
+            handler=self._on_portfolio_position_event,
+        )
 
         self.log.info(
             f"MultiVenueStrategy started: {self.primary_id} ↔ {self.secondary_id}"
         )
 
     def on_stop(self) -> None:
-        self.cancel_all_orders(self.primary_id)
-        self.cancel_all_orders(self.secondary_id)
-        self.unsubscribe_quote_ticks(self.primary_id)
-        self.unsubscribe_quote_ticks(self.secondary_id)
+        for instrument_id in self._venue_slot:
+            self.cancel_all_orders(instrument_id)
+        for instrument_id in self._venue_slot:
+            self.unsubscribe_quote_ticks(instrument_id)
+        self.msgbus.unsubscribe(
+            topic="events.position.*",
+            handler=self._on_portfolio_position_event,
+        )
 
     def on_reset(self) -> None:
         self.primary_instrument = None
         self.secondary_instrument = None
         self._primary_quote = None
         self._secondary_quote = None
-        self._spread_history.clear()
+        self._primary_mid = 0.0
+        self._secondary_mid = 0.0
+        self._recheck_spread = False
+        self._positions_rev = 0
+        self._cached_positions_rev = -1
+        self._spread_idx = 0
 
     # ─── DATA HANDLERS ─────────────────────────────────────────────────────────
 
     def on_quote_tick(self, tick: QuoteTick) -> None:
         """Route incoming ticks to the correct venue slot."""
-        if tick.instrument_id == self.primary_id:
-            self._primary_quote = tick
-        elif tick.instrument_id == self.secondary_id:
-            self._secondary_quote = tick
-        else:
+        set_quote = self._venue_slot.get(tick.instrument_id)
+        if set_quote is None:
             return  # Unknown instrument — ignore
 
-        # Only evaluate spread when BOTH quotes are fresh
-        if self._primary_quote and self._secondary_quote:
+        # Only evaluate spread when BOTH quotes are fresh and a mid has moved —
+        # size-only updates in a burst would reproduce the previous decision,
+        # unless a position event since then may have changed that decision
+        mid_changed = set_quote(tick)
+        both_quoted = self._primary_quote is not None and self._secondary_quote is not None
+        if (mid_changed or self._recheck_spread) and both_quoted:
+            self._recheck_spread = False
             self._evaluate_spread()
 
+    def _set_primary(self, tick: QuoteTick) -> bool:
+        """Store the primary quote; return True if its mid changed."""
+        self._primary_quote = tick
+        mid = (tick.ask_price.as_double() + tick.bid_price.as_double()) * 0.5
+        if mid == self._primary_mid:
+            return False
+        self._primary_mid = mid
+        return True
+
+    def _set_secondary(self, tick: QuoteTick) -> bool:
+        """Store the secondary quote; return True if its mid changed."""
+        self._secondary_quote = tick
+        mid = (tick.ask_price.as_double() + tick.bid_price.as_double()) * 0.5
+        if mid == self._secondary_mid:
+            return False
+        self._secondary_mid = mid
+        return True
+
+    # ─── POSITION EVENTS ───────────────────────────────────────────────────────
+
+    def _on_portfolio_position_event(self, event) -> None:
+        """Invalidate the cached net positions on any open/change/close in the portfolio."""
+        self._positions_rev += 1
+        self._recheck_spread = True
+
     # ─── SPREAD LOGIC ──────────────────────────────────────────────────────────
 
     def _evaluate_spread(self) -> None:
         """Calculate and act on the spread between the two venues."""
-        p_mid = (float(self._primary_quote.ask_price) + float(self._primary_quote.bid_price)) / 2
-        s_mid = (float(self._secondary_quote.ask_price) + float(self._secondary_quote.bid_price)) / 2
+        p_mid = self._primary_mid
+        s_mid = self._secondary_mid
 
         if p_mid <= 0 or s_mid <= 0:
             return
 
         spread_bps = abs(p_mid - s_mid) / min(p_mid, s_mid) * 10_000
-        self._spread_history.append(spread_bps)
+        self._spread_buf[self._spread_idx % SPREAD_HISTORY_LEN] = spread_bps
+        self._spread_idx += 1
 
-        self.log.debug(
-            f"Spread: {spread_bps:.2f} bps | "
-            f"Primary: {p_mid:.4f} | Secondary: {s_mid:.4f}"
-        )
+        if self._log_spreads:
+            self.log.debug(
+                f"Spread: {spread_bps:.2f} bps | "
+                f"Primary: {p_mid:.4f} | Secondary: {s_mid:.4f}"
+            )
 
-        if spread_bps >= self.config.min_spread_bps:
+        if spread_bps >= self._min_spread_bps:
             self._handle_spread_opportunity(p_mid, s_mid, spread_bps)
 
     def _handle_spread_opportunity(
@@ -188,14 +272,14 @@ class MultiVenueStrategy(Strategy):
         )
 
         # Determine trading venue from config
-        if self.config.trade_primary:
+        if self._trade_primary:
             instrument = self.primary_instrument
             side = OrderSide.BUY if direction == "BUY_PRIMARY" else OrderSide.SELL
         else:
             instrument = self.secondary_instrument
             side = OrderSide.SELL if direction == "BUY_PRIMARY" else OrderSide.BUY
 
-        qty = instrument.make_qty(self.config.max_position_size * 0.1)  # 10% of max
+        qty = instrument.make_qty(self._max_pos * 0.1)  # 10% of max
         order = self.order_factory.market(
             instrument_id=instrument.id,
             order_side=side,
@@ -205,13 +289,18 @@ class MultiVenueStrategy(Strategy):
 
     def _can_trade(self) -> bool:
         """Check position limits across both venues."""
-        primary_pos = abs(float(self.portfolio.net_position(self.primary_id) or 0))
-        secondary_pos = abs(float(self.portfolio.net_position(self.secondary_id) or 0))
-
-        if primary_pos >= self.config.max_position_size:
+        if self._cached_positions_rev != self._positions_rev:
+            net_position = self.portfolio.net_position
+            self._cached_primary_pos = abs(float(net_position(self.primary_id) or 0))
+            self._cached_secondary_pos = abs(float(net_position(self.secondary_id) or 0))
+            self._cached_positions_rev = self._positions_rev
+        primary_pos = self._cached_primary_pos
+        secondary_pos = self._cached_secondary_pos
+
+        if primary_pos >= self._max_pos:
             self.log.warning("Primary position limit reached")
             return False
-        if secondary_pos >= self.config.max_position_size:
+        if secondary_pos >= self._max_pos:
             self.log.warning("Secondary position limit reached")
             return False
         return True
@@ -4,11 +4,14 @@ Strategy Builder Tests: Conftest
 Shared fixtures for unit and integration tests.
 """
 
+import importlib.util
+import sys
+from pathlib import Path
+
 import pytest
 from decimal import Decimal
 from unittest.mock import MagicMock, AsyncMock
 
-from nautilus_trader.backtest.engine import BacktestEngine
 from nautilus_trader.backtest.models import FillModel
 from nautilus_trader.model.currencies import USDT, BTC, ETH
 from nautilus_trader.model.enums import AccountType, AssetClass, OmsType
@@ -19,12 +22,54 @@ from nautilus_trader.test_kit.providers import TestInstrumentProvider
 from nautilus_trader.test_kit.stubs.identifiers import TestIdStubs
 
 
+# Templates are loaded from disk — they are not installed as a package
+_templates = Path(__file__).parent.parent / "templates"
+
+
+def _load_module(name: str):
+    # Reuse a template another test file already loaded
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.spec_from_file_location(name, _templates / f"{name}.py")
+    mod = importlib.util.module_from_spec(spec)
+    sys.modules[name] = mod
+    try:
+        spec.loader.exec_module(mod)
+    except BaseException:
+        del sys.modules[name]
+        raise
+    return mod
+
+
+# Money is immutable, so one starting balance can seed every venue
+TEN_K_USDT = Money(10_000, USDT)
+
+# Fill model parameters, shared so every fixture builds the same models
+CEFI_FILL_PARAMS = dict(prob_fill_on_limit=0.5, prob_slippage=0.2, random_seed=42)
+DEX_FILL_PARAMS = dict(prob_fill_on_limit=0.25, prob_slippage=0.70, random_seed=42)
+
+
+# ─── TEMPLATE FIXTURES ─────────────────────────────────────────────────────────
+
+
+@pytest.fixture(scope="session")
+def multi_venue():
+    """The multi-venue strategy template module."""
+    return _load_module("multi_venue_strategy")
+
+
+@pytest.fixture(scope="session")
+def dex_venue_input():
+    """The DEX-as-venue input template module."""
+    return _load_module("dex_venue_input")
+
+
 # ─── INSTRUMENT FIXTURES ───────────────────────────────────────────────────────
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def btcusdt_binance():
-    """Standard BTC/USDT instrument on Binance."""
+    """Standard BTC/USDT instrument on Binance, built once (instruments are immutable)."""
     return TestInstrumentProvider.btcusdt_binance()
 
 
@@ -59,42 +104,66 @@ def eth_usdc_uniswap():
     )
 
 
-# ─── FILL MODEL FIXTURES ───────────────────────────────────────────────────────
+# ─── BALANCE AND FILL MODEL FIXTURES ──────────────────────────────────────────
+
+
+@pytest.fixture(scope="session")
+def ten_k_usdt():
+    """Standard 10,000 USDT starting balance."""
+    return TEN_K_USDT
+
+
+@pytest.fixture(scope="session")
+def cefi_fill_params():
+    """Keyword arguments for the CeFi fill model, for engines wider than one test."""
+    return dict(CEFI_FILL_PARAMS)
+
+
+@pytest.fixture(scope="session")
+def dex_fill_params():
+    """Keyword arguments for the DEX fill model, for engines wider than one test."""
+    return dict(DEX_FILL_PARAMS)
 
 
 @pytest.fixture
-def cefi_fill_model():
-    """Realistic CeFi fill model."""
-    return FillModel(
-        prob_fill_on_limit=0.5,
-        prob_slippage=0.2,
-        random_seed=42,
-    )
+def cefi_fill_model(cefi_fill_params):
+    """Realistic CeFi fill model, fresh per test since its RNG is stateful."""
+    return FillModel(**cefi_fill_params)
 
 
 @pytest.fixture
-def dex_fill_model():
-    """Realistic DEX fill model with higher slippage."""
-    return FillModel(
-        prob_fill_on_limit=0.25,
-        prob_slippage=0.70,
-        random_seed=42,
-    )
+def dex_fill_model(dex_fill_params):
+    """Realistic DEX fill model with higher slippage, fresh per test."""
+    return FillModel(**dex_fill_params)
 
 
 # ─── BACKTEST ENGINE FIXTURES ──────────────────────────────────────────────────
+# BacktestEngine is imported inside each fixture so config-only test files
+# never pull in the backtest subsystem.
+
+
+@pytest.fixture
+def engine():
+    """A bare BacktestEngine, disposed after the test even if it fails."""
+    from nautilus_trader.backtest.engine import BacktestEngine
+
+    engine = BacktestEngine()
+    yield engine
+    engine.dispose()
 
 
 @pytest.fixture
 def cefi_engine(btcusdt_binance, cefi_fill_model):
     """BacktestEngine pre-configured with a standard CeFi venue."""
+    from nautilus_trader.backtest.engine import BacktestEngine
+
     engine = BacktestEngine()
     engine.add_venue(
         venue=Venue("BINANCE"),
         oms_type=OmsType.NETTING,
         account_type=AccountType.CASH,
         base_currency=USDT,
-        starting_balances=[Money(10_000, USDT)],
+        starting_balances=[TEN_K_USDT],
         fill_model=cefi_fill_model,
     )
     engine.add_instrument(btcusdt_binance)
@@ -105,13 +174,15 @@ def cefi_engine(btcusdt_binance, cefi_fill_model):
 @pytest.fixture
 def dex_engine(eth_usdc_uniswap, dex_fill_model):
     """BacktestEngine pre-configured with a DEX venue."""
+    from nautilus_trader.backtest.engine import BacktestEngine
+
     engine = BacktestEngine()
     engine.add_venue(
         venue=Venue("UNISWAP_V3"),
         oms_type=OmsType.NETTING,
         account_type=AccountType.CASH,
         base_currency=USDT,
-        starting_balances=[Money(10_000, USDT)],
+        starting_balances=[TEN_K_USDT],
         fill_model=dex_fill_model,
     )
     engine.add_instrument(eth_usdc_uniswap)
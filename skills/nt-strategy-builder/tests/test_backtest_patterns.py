@@ -8,91 +8,83 @@ construct, run, and dispose correctly using NautilusTrader's test kit.
 import pytest
 from decimal import Decimal
 
-from nautilus_trader.backtest.engine import BacktestEngine
 from nautilus_trader.backtest.models import FillModel
 from nautilus_trader.model.currencies import USDT, BTC
 from nautilus_trader.model.enums import AccountType, OmsType
 from nautilus_trader.model.identifiers import Venue
 from nautilus_trader.model.objects import Money
-from nautilus_trader.test_kit.providers import TestInstrumentProvider
 
 
-class TestBacktestVenueConfig:
-    """Verify venue configuration patterns build without error."""
-
-    def test_cash_venue_builds(self):
-        """A CASH account venue builds and accepts starting balances."""
-        engine = BacktestEngine()
-        engine.add_venue(
+# Each case is (venue kwargs, balances on top of the standard 10k USDT)
+VENUE_CASES = [
+    # A CASH account venue builds and accepts starting balances
+    pytest.param(
+        dict(
             venue=Venue("SIM"),
             oms_type=OmsType.NETTING,
             account_type=AccountType.CASH,
             base_currency=USDT,
-            starting_balances=[Money(10_000, USDT)],
-        )
-        assert engine is not None
-        engine.dispose()
-
-    def test_margin_venue_with_leverage(self):
-        """A MARGIN account venue accepts default_leverage."""
-        engine = BacktestEngine()
-        engine.add_venue(
+        ),
+        [],
+        id="cash",
+    ),
+    # A MARGIN account venue accepts default_leverage
+    pytest.param(
+        dict(
             venue=Venue("SIM"),
             oms_type=OmsType.NETTING,
             account_type=AccountType.MARGIN,
             base_currency=USDT,
-            starting_balances=[Money(10_000, USDT)],
             default_leverage=Decimal("10"),
-        )
-        assert engine is not None
-        engine.dispose()
-
-    def test_dex_cash_venue_builds(self):
-        """A DEX venue (no margin) builds the same way as CeFi CASH."""
-        engine = BacktestEngine()
-        engine.add_venue(
+        ),
+        [],
+        id="margin",
+    ),
+    # A DEX venue (no margin) builds the same way as CeFi CASH
+    pytest.param(
+        dict(
             venue=Venue("UNISWAP_V3"),
             oms_type=OmsType.NETTING,
             account_type=AccountType.CASH,
             base_currency=USDT,
-            starting_balances=[Money(10_000, USDT)],
-        )
-        assert engine is not None
-        engine.dispose()
-
-    def test_multi_currency_starting_balances(self):
-        """Multiple starting currencies are accepted."""
-        engine = BacktestEngine()
-        engine.add_venue(
+        ),
+        [],
+        id="dex-cash",
+    ),
+    # Multiple starting currencies are accepted
+    pytest.param(
+        dict(
             venue=Venue("SIM"),
             oms_type=OmsType.NETTING,
             account_type=AccountType.CASH,
-            base_currency=USDT,
-            starting_balances=[Money(10_000, USDT)],
-        )
-        assert engine is not None
-        engine.dispose()
+            base_currency=None,
+        ),
+        [Money(1, BTC)],
+        id="multi-currency",
+    ),
+]
+
+
+class TestBacktestVenueConfig:
+    """Verify venue configuration patterns build without error."""
+
+    @pytest.mark.parametrize("venue_kwargs,extra_balances", VENUE_CASES)
+    def test_venue_builds(self, engine, ten_k_usdt, venue_kwargs, extra_balances):
+        engine.add_venue(starting_balances=[ten_k_usdt, *extra_balances], **venue_kwargs)
+        assert engine.list_venues() == [venue_kwargs["venue"]]
 
 
 class TestFillModelPatterns:
     """Verify fill model construction and parameter bounds."""
 
-    def test_cefi_fill_model_builds(self):
-        model = FillModel(
-            prob_fill_on_limit=0.5,
-            prob_slippage=0.2,
-            random_seed=42,
-        )
-        assert model is not None
+    def test_cefi_fill_model_builds(self, cefi_fill_model):
+        assert cefi_fill_model.prob_fill_on_limit == 0.5
+        assert cefi_fill_model.prob_slippage == 0.2
 
-    def test_dex_fill_model_builds(self):
+    def test_dex_fill_model_builds(self, dex_fill_model):
         """DEX-realistic fill model with higher slippage probability."""
-        model = FillModel(
-            prob_fill_on_limit=0.25,
-            prob_slippage=0.70,
-            random_seed=42,
-        )
-        assert model is not None
+        assert dex_fill_model.prob_fill_on_limit == 0.25
+        assert dex_fill_model.prob_slippage == 0.70
 
     def test_fill_model_is_reproducible(self):
         model_a = FillModel(prob_fill_on_limit=0.5, prob_slippage=0.2, random_seed=1)
@@ -114,36 +106,30 @@ class TestFillModelPatterns:
 
 
 class TestBacktestEngineWithInstrument:
-    """Verify engine accepts instruments and runs without data."""
+    """Verify engine accepts instruments; only the report test runs it (without data)."""
 
-    def test_engine_add_instrument(self):
-        instrument = TestInstrumentProvider.btcusdt_binance()
-        engine = BacktestEngine()
+    def test_engine_add_instrument(self, engine, btcusdt_binance, ten_k_usdt):
         engine.add_venue(
             venue=Venue("BINANCE"),
             oms_type=OmsType.NETTING,
             account_type=AccountType.CASH,
             base_currency=None,
-            starting_balances=[Money(10_000, USDT), Money(1, BTC)],
+            starting_balances=[ten_k_usdt, Money(1, BTC)],
         )
-        engine.add_instrument(instrument)
-        engine.run()  # No data → runs immediately
-        engine.dispose()
+        engine.add_instrument(btcusdt_binance)
+        assert engine.cache.instrument(btcusdt_binance.id) is btcusdt_binance
 
-    def test_engine_generates_account_report(self):
-        instrument = TestInstrumentProvider.btcusdt_binance()
-        engine = BacktestEngine()
+    def test_engine_generates_account_report(self, engine, btcusdt_binance, ten_k_usdt):
         venue = Venue("BINANCE")
         engine.add_venue(
             venue=venue,
             oms_type=OmsType.NETTING,
             account_type=AccountType.CASH,
             base_currency=None,
-            starting_balances=[Money(10_000, USDT), Money(1, BTC)],
+            starting_balances=[ten_k_usdt, Money(1, BTC)],
         )
-        engine.add_instrument(instrument)
+        engine.add_instrument(btcusdt_binance)
         engine.run()
 
         report = engine.trader.generate_account_report(venue)
         assert report is not None
-        engine.dispose()
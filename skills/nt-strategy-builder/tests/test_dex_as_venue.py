@@ -8,17 +8,20 @@ This test does NOT require a live chain connection.
 All data is constructed in-memory using Nautilus test kit helpers.
 """
 
+from pathlib import Path
+
 import pytest
 from decimal import Decimal
 
-from nautilus_trader.backtest.engine import BacktestEngine
 from nautilus_trader.backtest.models import FillModel
 from nautilus_trader.model.currencies import USDT, ETH, BTC
-from nautilus_trader.model.data import QuoteTick
+from nautilus_trader.model.data import QuoteTick, TradeTick
 from nautilus_trader.model.enums import AccountType, OmsType
 from nautilus_trader.model.identifiers import InstrumentId, Symbol, Venue
 from nautilus_trader.model.instruments import CurrencyPair
 from nautilus_trader.model.objects import Money, Price, Quantity
+from nautilus_trader.persistence.catalog import ParquetDataCatalog
+from nautilus_trader.test_kit.stubs.data import TestDataStubs
 
 
 # ─── DEX INSTRUMENT BUILDER ────────────────────────────────────────────────────
@@ -54,87 +57,132 @@ def build_dex_instrument(pool_name: str, venue_name: str) -> CurrencyPair:
     )
 
 
-class TestDEXasBacktestVenue:
-    """Verify a DEX adapter output integrates with BacktestEngine."""
+@pytest.fixture(scope="class")
+def shared_engine(btcusdt_binance, ten_k_usdt, dex_fill_params):
+    """
+    One engine per test class with a DEX and a CeFi venue plus their instruments.
 
-    def test_dex_instrument_adds_to_engine(self):
-        """BacktestEngine accepts a DEX pool as an instrument."""
-        instrument = build_dex_instrument("WETH-USDC", "UNISWAP_V3")
-        engine = BacktestEngine()
+    Venues and instruments survive reset(), so tests reset() and re-run
+    instead of building their own engine.
+    """
+    from nautilus_trader.backtest.engine import BacktestEngine
+
+    engine = BacktestEngine()
+    for name, balances, fill_model in (
+        ("UNISWAP_V3", [ten_k_usdt, Money(10, ETH)], FillModel(**dex_fill_params)),
+        ("BINANCE", [ten_k_usdt, Money(1, BTC)], None),
+    ):
         engine.add_venue(
-            venue=Venue("UNISWAP_V3"),
+            venue=Venue(name),
             oms_type=OmsType.NETTING,
             account_type=AccountType.CASH,
             base_currency=None,
-            starting_balances=[Money(10_000, USDT), Money(10, ETH)],
+            starting_balances=balances,
+            fill_model=fill_model,
         )
-        engine.add_instrument(instrument)
-        engine.run()
-        engine.dispose()
+    engine.add_instrument(build_dex_instrument("WETH-USDC", "UNISWAP_V3"))
+    engine.add_instrument(btcusdt_binance)
+    yield engine
+    engine.dispose()
+
 
-    def test_dex_fill_model_parameters(self):
+class TestDEXasBacktestVenue:
+    """Verify a DEX adapter output integrates with BacktestEngine."""
+
+    def test_dex_instrument_adds_to_engine(self, shared_engine):
+        """BacktestEngine accepts a DEX pool as an instrument."""
+        instrument_id = InstrumentId.from_str("WETH-USDC.UNISWAP_V3")
+        assert shared_engine.cache.instrument(instrument_id) is not None
+
+    def test_dex_fill_model_parameters(self, cefi_fill_model, dex_fill_model):
         """DEX fill model has higher slippage than CeFi model."""
-        dex_model = FillModel(
-            prob_fill_on_limit=0.25,
-            prob_slippage=0.70,
-            random_seed=42,
-        )
-        cefi_model = FillModel(
-            prob_fill_on_limit=0.5,
-            prob_slippage=0.2,
-            random_seed=42,
-        )
         # DEX should have higher slippage ratio
-        assert dex_model.prob_slippage > cefi_model.prob_slippage
-        assert dex_model.prob_fill_on_limit < cefi_model.prob_fill_on_limit
+        assert dex_fill_model.prob_slippage > cefi_fill_model.prob_slippage
+        assert dex_fill_model.prob_fill_on_limit < cefi_fill_model.prob_fill_on_limit
 
-    def test_engine_with_dex_venue_runs_empty(self):
+    def test_engine_with_dex_venue_runs_empty(self, shared_engine):
         """Engine with a DEX venue runs to completion with no data (empty run)."""
-        instrument = build_dex_instrument("WETH-USDC", "UNISWAP_V3")
-        engine = BacktestEngine()
-        engine.add_venue(
-            venue=Venue("UNISWAP_V3"),
-            oms_type=OmsType.NETTING,
-            account_type=AccountType.CASH,
-            base_currency=None,
-            starting_balances=[Money(10_000, USDT), Money(10, ETH)],
-            fill_model=FillModel(
-                prob_fill_on_limit=0.25,
-                prob_slippage=0.70,
-                random_seed=42,
-            ),
-        )
-        engine.add_instrument(instrument)
-        engine.run()  # No data → runs immediately
+        shared_engine.reset()
+        shared_engine.run()  # No data → runs immediately
 
-        report = engine.trader.generate_positions_report()
+        report = shared_engine.trader.generate_positions_report()
         assert report is not None  # Report should exist even with no trades
-        engine.dispose()
 
-    def test_dex_and_cefi_venues_coexist(self):
+    def test_dex_and_cefi_venues_coexist(self, shared_engine):
         """Engine accepts both a DEX venue and a CeFi venue simultaneously."""
-        from nautilus_trader.test_kit.providers import TestInstrumentProvider
-
-        dex_instrument = build_dex_instrument("WETH-USDC", "UNISWAP_V3")
-        cefi_instrument = TestInstrumentProvider.btcusdt_binance()
-
-        engine = BacktestEngine()
-
-        engine.add_venue(
-            venue=Venue("UNISWAP_V3"),
-            oms_type=OmsType.NETTING,
-            account_type=AccountType.CASH,
-            base_currency=None,
-            starting_balances=[Money(10_000, USDT), Money(10, ETH)],
-        )
-        engine.add_venue(
-            venue=Venue("BINANCE"),
-            oms_type=OmsType.NETTING,
-            account_type=AccountType.CASH,
-            base_currency=None,
-            starting_balances=[Money(10_000, USDT), Money(1, BTC)],
+        assert shared_engine.list_venues() == [Venue("UNISWAP_V3"), Venue("BINANCE")]
+        assert len(shared_engine.cache.instruments()) == 2
+
+
+class TestCatalogFileIndex:
+    """Verify the cached file listing serves the same data as the catalog."""
+
+    @pytest.fixture
+    def catalog(self, tmp_path):
+        """Catalog with two DEX pools and a few swaps on each."""
+        catalog = ParquetDataCatalog(tmp_path)
+        weth = build_dex_instrument("WETH-USDC", "UNISWAP_V3")
+        wbtc = build_dex_instrument("WBTC-USDC", "UNISWAP_V3")
+        catalog.write_data([weth, wbtc])
+        for instrument, count in ((weth, 5), (wbtc, 3)):
+            catalog.write_data(
+                [
+                    TestDataStubs.trade_tick(instrument=instrument, ts_event=i, ts_init=i)
+                    for i in range(count)
+                ]
+            )
+        return catalog
+
+    def test_matches_catalog_queries(self, dex_venue_input, catalog):
+        index = dex_venue_input.CatalogFileIndex(catalog)
+        assert [i.id for i in index.instruments()] == [i.id for i in catalog.instruments()]
+        assert sorted(map(str, index.trade_ticks())) == sorted(map(str, catalog.trade_ticks()))
+        assert index.order_book_deltas() == []
+
+    def test_filters_by_instrument(self, dex_venue_input, catalog):
+        index = dex_venue_input.CatalogFileIndex(catalog)
+        ticks = index.trade_ticks(["WETH-USDC.UNISWAP_V3"])
+        assert len(ticks) == 5
+        assert {str(t.instrument_id) for t in ticks} == {"WETH-USDC.UNISWAP_V3"}
+
+    def test_prunes_files_outside_time_window(self, dex_venue_input, catalog):
+        index = dex_venue_input.CatalogFileIndex(catalog)
+        assert index.files(TradeTick, start=100) == []
+        assert len(index.trade_ticks(end=2)) == 6  # ts 0..2 from both pools
+
+    def test_file_names_parse_to_ts_event_interval(self, dex_venue_input, catalog):
+        files = dex_venue_input.CatalogFileIndex(catalog).files(TradeTick)
+        intervals = sorted(dex_venue_input._filename_timestamps(path) for path in files)
+        assert intervals == [(0, 2), (0, 4)]  # WBTC ts 0..2, WETH ts 0..4
+        assert dex_venue_input._filename_timestamps("data/trade_tick/X/part-0.parquet") is None
+
+    def test_cached_instruments_reused_until_catalog_changes(
+        self, dex_venue_input, catalog, tmp_path_factory
+    ):
+        cache_path = str(tmp_path_factory.mktemp("cache") / "instruments.pkl")
+        index = dex_venue_input.CatalogFileIndex(catalog)
+        first = dex_venue_input.cached_instruments(index, cache_path)
+        assert Path(cache_path).exists()
+        assert dex_venue_input.cached_instruments(index, cache_path) == first
+
+        catalog.write_data([build_dex_instrument("WETH-USDT", "UNISWAP_V3")])
+        refreshed = dex_venue_input.cached_instruments(
+            dex_venue_input.CatalogFileIndex(catalog), cache_path
         )
-        engine.add_instrument(dex_instrument)
-        engine.add_instrument(cefi_instrument)
-        engine.run()
-        engine.dispose()
+        assert len(refreshed) == len(first) + 1
+
+    def test_cached_instruments_off_by_default(self, dex_venue_input, catalog):
+        index = dex_venue_input.CatalogFileIndex(catalog)
+        assert dex_venue_input.cached_instruments(index) == index.instruments()
+        assert sorted(p.name for p in Path(catalog.path).iterdir()) == ["data"]
+
+    def test_unwritable_cache_path_still_loads(self, dex_venue_input, catalog, tmp_path_factory):
+        cache_path = str(tmp_path_factory.mktemp("cache") / "missing-dir" / "instruments.pkl")
+        index = dex_venue_input.CatalogFileIndex(catalog)
+        assert dex_venue_input.cached_instruments(index, cache_path) == index.instruments()
+
+    def test_scan_reverse_reverses_file_order(self, dex_venue_input, catalog):
+        forward = dex_venue_input.CatalogFileIndex(catalog).files(TradeTick)
+        reverse = dex_venue_input.CatalogFileIndex(catalog, scan_reverse=True).files(TradeTick)
+        assert len(forward) == 2
+        assert reverse == forward[::-1]
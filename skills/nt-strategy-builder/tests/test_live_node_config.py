@@ -5,8 +5,6 @@ Verifies that TradingNodeConfig and LiveExecEngineConfig patterns from
 templates parse and build correctly. No network connections are made.
 """
 
-import pytest
-
 from nautilus_trader.config import (
     LiveDataEngineConfig,
     LiveExecEngineConfig,
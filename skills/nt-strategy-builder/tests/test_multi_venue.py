@@ -11,14 +11,14 @@ Tests confirm:
 - on_stop cancels orders on both venues
 """
 
+import functools
+
+import numpy as np
 import pytest
-from collections import deque
 from decimal import Decimal
 from typing import Optional
 from unittest.mock import MagicMock
-from types import MethodType
 
-from nautilus_trader.backtest.engine import BacktestEngine
 from nautilus_trader.model.currencies import USDT
 from nautilus_trader.model.data import QuoteTick
 from nautilus_trader.model.enums import AccountType, OmsType
@@ -26,26 +26,96 @@ from nautilus_trader.model.identifiers import InstrumentId, Symbol, Venue
 from nautilus_trader.model.objects import Money, Price, Quantity
 from nautilus_trader.test_kit.providers import TestInstrumentProvider
 
-# Import the template class under test
-import sys
-import importlib.util
-from pathlib import Path
 
-# Dynamically load template to test it without installing as a package
-_template_path = Path(__file__).parent.parent / "templates" / "multi_venue_strategy.py"
-_spec = importlib.util.spec_from_file_location("multi_venue_strategy", _template_path)
-_module = importlib.util.module_from_spec(_spec)
-_spec.loader.exec_module(_module)
+@functools.lru_cache(maxsize=64)
+def _iid(value: str) -> InstrumentId:
+    """Parse an InstrumentId once per distinct string."""
+    return InstrumentId.from_str(value)
+
 
-MultiVenueStrategy = _module.MultiVenueStrategy
-MultiVenueStrategyConfig = _module.MultiVenueStrategyConfig
+@pytest.fixture(scope="session")
+def stub_strategy_cls(multi_venue):
+    """
+    A plain class sharing MultiVenueStrategy's spread-path methods.
+
+    Built once per session so each stub instance binds methods through the
+    class instead of allocating per-instance MethodType objects.
+    """
+    cls = multi_venue.MultiVenueStrategy
+    return type(
+        "MockMultiVenue",
+        (),
+        {
+            name: getattr(cls, name)
+            for name in (
+                "on_quote_tick",
+                "_on_portfolio_position_event",
+                "_set_primary",
+                "_set_secondary",
+                "_evaluate_spread",
+                "_handle_spread_opportunity",
+                "_can_trade",
+                "spread_view",
+            )
+        },
+    )
+
+
+# Plain stubs for framework collaborators no test asserts on; MagicMock is
+# kept only where call counts or return values are inspected.
+class _StubLog:
+    def debug(self, *args, **kwargs):
+        pass
+
+    info = warning = error = debug
+
+
+class _StubPortfolio:
+    net_position = staticmethod(lambda instrument_id: 0.0)
+
+
+class _StubInstrument:
+    make_qty = staticmethod(lambda value: Quantity.from_str("0.01"))
+
+    def __init__(self, instrument_id: InstrumentId):
+        self.id = instrument_id
+
+
+class _StubOrderFactory:
+    market = staticmethod(lambda **kwargs: None)
+
+
+# Quotes shared by most spread tests: ~10 bps apart, primary cheaper
+PRIMARY_Q = QuoteTick(
+    instrument_id=_iid("BTCUSDT-PERP.BINANCE"),
+    bid_price=Price.from_str("50000.0"),
+    ask_price=Price.from_str("50001.0"),
+    bid_size=Quantity.from_str("1.0"),
+    ask_size=Quantity.from_str("1.0"),
+    ts_event=0,
+    ts_init=0,
+)
+SECONDARY_Q = QuoteTick(
+    instrument_id=_iid("BTCUSDT-PERP.BYBIT"),
+    bid_price=Price.from_str("50050.0"),
+    ask_price=Price.from_str("50051.0"),
+    bid_size=Quantity.from_str("1.0"),
+    ask_size=Quantity.from_str("1.0"),
+    ts_event=0,
+    ts_init=0,
+)
+
+
+def _vector_spreads_bps(primary_mids: np.ndarray, secondary_mids: np.ndarray) -> np.ndarray:
+    """Reference spread series (bps) for a replay, computed in one vectorized pass."""
+    return np.abs(primary_mids - secondary_mids) / np.minimum(primary_mids, secondary_mids) * 10_000
 
 
 class TestMultiVenueStrategyConfig:
     """Verify config object creation and default values."""
 
-    def test_config_builds_with_required_fields(self):
-        config = MultiVenueStrategyConfig(
+    def test_config_builds_with_required_fields(self, multi_venue):
+        config = multi_venue.MultiVenueStrategyConfig(
             strategy_id="MultiVenueStrategy-TEST",
             primary_instrument_id="BTCUSDT-PERP.BINANCE",
             secondary_instrument_id="BTCUSDT-PERP.BYBIT",
@@ -53,16 +123,24 @@ class TestMultiVenueStrategyConfig:
         assert config.primary_instrument_id == "BTCUSDT-PERP.BINANCE"
         assert config.secondary_instrument_id == "BTCUSDT-PERP.BYBIT"
 
-    def test_default_spread_threshold(self):
-        config = MultiVenueStrategyConfig(
+    def test_default_spread_threshold(self, multi_venue):
+        config = multi_venue.MultiVenueStrategyConfig(
             strategy_id="MultiVenueStrategy-TEST",
             primary_instrument_id="BTCUSDT-PERP.BINANCE",
             secondary_instrument_id="BTCUSDT-PERP.BYBIT",
         )
         assert config.min_spread_bps == 10.0
 
-    def test_custom_spread_threshold(self):
-        config = MultiVenueStrategyConfig(
+    def test_spread_logging_off_by_default(self, multi_venue):
+        config = multi_venue.MultiVenueStrategyConfig(
+            strategy_id="MultiVenueStrategy-TEST",
+            primary_instrument_id="BTCUSDT-PERP.BINANCE",
+            secondary_instrument_id="BTCUSDT-PERP.BYBIT",
+        )
+        assert config.log_spreads is False
+
+    def test_custom_spread_threshold(self, multi_venue):
+        config = multi_venue.MultiVenueStrategyConfig(
             strategy_id="MultiVenueStrategy-TEST",
             primary_instrument_id="A.BINANCE",
             secondary_instrument_id="A.BYBIT",
@@ -79,47 +157,56 @@ class TestSpreadCalculation:
     by constructing a minimal mock strategy object.
     """
 
-    def _make_mock_strategy(self, min_spread_bps: float = 10.0) -> MultiVenueStrategy:
-        """Create a strategy with all framework dependencies mocked."""
-        config = MultiVenueStrategyConfig(
-            strategy_id="MultiVenueStrategy-UNIT",
-            primary_instrument_id="BTCUSDT-PERP.BINANCE",
-            secondary_instrument_id="BTCUSDT-PERP.BYBIT",
-            min_spread_bps=min_spread_bps,
-            max_position_size=1.0,
-        )
-
-        strategy = type("MockMultiVenue", (), {})()
-        strategy.config = config
-        strategy.primary_id = InstrumentId.from_str(config.primary_instrument_id)
-        strategy.secondary_id = InstrumentId.from_str(config.secondary_instrument_id)
-        strategy.primary_instrument = MagicMock()
-        strategy.secondary_instrument = MagicMock()
-        strategy._primary_quote = None
-        strategy._secondary_quote = None
-        strategy._spread_history = deque(maxlen=100)
-        strategy.log = MagicMock()
-        strategy.portfolio = MagicMock()
-        strategy.portfolio.net_position = MagicMock(return_value=0.0)
-        strategy.order_factory = MagicMock()
-        strategy.submit_order = MagicMock()
-        strategy.primary_instrument.make_qty = MagicMock(
-            return_value=Quantity.from_str("0.01")
-        )
-        strategy.on_quote_tick = MethodType(MultiVenueStrategy.on_quote_tick, strategy)
-        strategy._evaluate_spread = MethodType(
-            MultiVenueStrategy._evaluate_spread, strategy
-        )
-        strategy._handle_spread_opportunity = MethodType(
-            MultiVenueStrategy._handle_spread_opportunity, strategy
-        )
-        strategy._can_trade = MethodType(MultiVenueStrategy._can_trade, strategy)
-        return strategy
+    @pytest.fixture
+    def make_strategy(self, multi_venue, stub_strategy_cls):
+        """Factory for a strategy stub with all framework dependencies mocked."""
+
+        def _make(min_spread_bps: float = 10.0):
+            config = multi_venue.MultiVenueStrategyConfig(
+                strategy_id="MultiVenueStrategy-UNIT",
+                primary_instrument_id="BTCUSDT-PERP.BINANCE",
+                secondary_instrument_id="BTCUSDT-PERP.BYBIT",
+                min_spread_bps=min_spread_bps,
+                max_position_size=1.0,
+            )
+
+            strategy = stub_strategy_cls()
+            strategy.config = config
+            strategy.primary_id = _iid(config.primary_instrument_id)
+            strategy.secondary_id = _iid(config.secondary_instrument_id)
+            strategy._min_spread_bps = config.min_spread_bps
+            strategy._max_pos = config.max_position_size
+            strategy._trade_primary = config.trade_primary
+            strategy._log_spreads = config.log_spreads
+            strategy.primary_instrument = _StubInstrument(strategy.primary_id)
+            strategy.secondary_instrument = _StubInstrument(strategy.secondary_id)
+            strategy._primary_quote = None
+            strategy._secondary_quote = None
+            strategy._primary_mid = 0.0
+            strategy._secondary_mid = 0.0
+            strategy._recheck_spread = False
+            strategy._positions_rev = 0
+            strategy._cached_positions_rev = -1
+            strategy._cached_primary_pos = 0.0
+            strategy._cached_secondary_pos = 0.0
+            strategy._spread_buf = np.empty(multi_venue.SPREAD_HISTORY_LEN, dtype=np.float64)
+            strategy._spread_idx = 0
+            strategy.log = _StubLog()
+            strategy.portfolio = _StubPortfolio()
+            strategy.order_factory = _StubOrderFactory()
+            strategy.submit_order = lambda order: None
+            strategy._venue_slot = {
+                strategy.primary_id: strategy._set_primary,
+                strategy.secondary_id: strategy._set_secondary,
+            }
+            return strategy
+
+        return _make
 
     def _make_quote(self, instrument_id_str: str, bid: float, ask: float) -> QuoteTick:
         """Build a minimal QuoteTick for testing."""
         return QuoteTick(
-            instrument_id=InstrumentId.from_str(instrument_id_str),
+            instrument_id=_iid(instrument_id_str),
             bid_price=Price.from_str(str(bid)),
             ask_price=Price.from_str(str(ask)),
             bid_size=Quantity.from_str("1.0"),
@@ -128,53 +215,131 @@ class TestSpreadCalculation:
             ts_init=0,
         )
 
-    def test_spread_not_evaluated_until_both_quotes_received(self):
-        strategy = self._make_mock_strategy()
+    def test_spread_not_evaluated_until_both_quotes_received(self, make_strategy):
+        strategy = make_strategy()
         strategy._handle_spread_opportunity = MagicMock()
 
         # Send only primary quote
-        primary_q = self._make_quote("BTCUSDT-PERP.BINANCE", 50_000.0, 50_001.0)
-        strategy.on_quote_tick(primary_q)
+        strategy.on_quote_tick(PRIMARY_Q)
 
         # No spread evaluation yet
         strategy._handle_spread_opportunity.assert_not_called()
 
-    def test_spread_evaluated_after_both_quotes(self):
-        strategy = self._make_mock_strategy(min_spread_bps=1.0)  # Very low threshold
+    @pytest.mark.parametrize(
+        "threshold,secondary_prices,expect_called",
+        [
+            pytest.param(1.0, (50_050.0, 50_051.0), True, id="above-threshold"),  # ~10 bps
+            pytest.param(100.0, (50_002.0, 50_003.0), False, id="below-threshold"),  # ~0.4 bps
+        ],
+    )
+    def test_opportunity_only_above_threshold(
+        self, make_strategy, threshold, secondary_prices, expect_called
+    ):
+        strategy = make_strategy(min_spread_bps=threshold)
         strategy._handle_spread_opportunity = MagicMock()
 
-        primary_q = self._make_quote("BTCUSDT-PERP.BINANCE", 50_000.0, 50_001.0)
-        secondary_q = self._make_quote("BTCUSDT-PERP.BYBIT", 50_050.0, 50_051.0)
+        strategy.on_quote_tick(PRIMARY_Q)
+        strategy.on_quote_tick(self._make_quote("BTCUSDT-PERP.BYBIT", *secondary_prices))
 
-        strategy.on_quote_tick(primary_q)
-        strategy.on_quote_tick(secondary_q)
+        assert strategy._handle_spread_opportunity.called == expect_called
 
-        # Spread is ~10 bps; min is 1 bps → opportunity detected
-        strategy._handle_spread_opportunity.assert_called_once()
+    def test_spread_history_accumulates(self, make_strategy):
+        strategy = make_strategy(min_spread_bps=1.0)
+        strategy._handle_spread_opportunity = MagicMock()
 
-    def test_no_opportunity_when_spread_below_threshold(self):
-        strategy = self._make_mock_strategy(min_spread_bps=100.0)  # Very high threshold
+        secondary_q2 = self._make_quote("BTCUSDT-PERP.BYBIT", 50_060.0, 50_061.0)
+
+        strategy.on_quote_tick(PRIMARY_Q)
+        strategy.on_quote_tick(SECONDARY_Q)
+        strategy.on_quote_tick(secondary_q2)  # Second update
+
+        assert strategy._spread_idx == 2
+        spreads = strategy.spread_view
+        assert spreads[0] < spreads[1]
+
+    def test_replay_matches_vectorized_spreads(self, make_strategy):
+        """A tick-by-tick replay records the spreads and signals a vectorized pass predicts."""
+        threshold = 3.0
+        strategy = make_strategy(min_spread_bps=threshold)
         strategy._handle_spread_opportunity = MagicMock()
 
-        primary_q = self._make_quote("BTCUSDT-PERP.BINANCE", 50_000.0, 50_001.0)
-        secondary_q = self._make_quote(
-            "BTCUSDT-PERP.BYBIT", 50_002.0, 50_003.0
-        )  # Only ~0.4 bps
+        # Secondary drifts through the primary mid (50_000.5), one distinct mid per tick
+        secondary_bids = 49_975.0 + np.arange(50, dtype=np.float64)
+        secondary_asks = secondary_bids + 1.0
+        primary_mid = (PRIMARY_Q.bid_price.as_double() + PRIMARY_Q.ask_price.as_double()) * 0.5
+        expected = _vector_spreads_bps(
+            np.full(len(secondary_bids), primary_mid), (secondary_bids + secondary_asks) * 0.5
+        )
 
-        strategy.on_quote_tick(primary_q)
-        strategy.on_quote_tick(secondary_q)
+        strategy.on_quote_tick(PRIMARY_Q)
+        for bid, ask in zip(secondary_bids, secondary_asks):
+            strategy.on_quote_tick(self._make_quote("BTCUSDT-PERP.BYBIT", float(bid), float(ask)))
 
-        strategy._handle_spread_opportunity.assert_not_called()
+        np.testing.assert_allclose(strategy.spread_view, expected)
+        assert strategy._handle_spread_opportunity.call_count == np.count_nonzero(
+            expected >= threshold
+        )
 
-    def test_spread_history_accumulates(self):
-        strategy = self._make_mock_strategy(min_spread_bps=1.0)
+    def test_unchanged_mid_does_not_reevaluate(self, make_strategy):
+        strategy = make_strategy(min_spread_bps=1.0)
         strategy._handle_spread_opportunity = MagicMock()
 
-        primary_q = self._make_quote("BTCUSDT-PERP.BINANCE", 50_000.0, 50_001.0)
-        secondary_q = self._make_quote("BTCUSDT-PERP.BYBIT", 50_050.0, 50_051.0)
+        strategy.on_quote_tick(PRIMARY_Q)
+        for _ in range(5):
+            strategy.on_quote_tick(SECONDARY_Q)
+
+        strategy._handle_spread_opportunity.assert_called_once()
+
+    def test_blocked_opportunity_rechecked_after_position_event(self, make_strategy):
+        strategy = make_strategy(min_spread_bps=1.0)
+        strategy.portfolio = MagicMock(spec_set=["net_position"])
+        strategy.portfolio.net_position.return_value = 5.0  # At the limit
+        strategy.submit_order = MagicMock()
+
+        strategy.on_quote_tick(PRIMARY_Q)
+        strategy.on_quote_tick(SECONDARY_Q)
+        strategy.submit_order.assert_not_called()
+
+        # Position closes; the next tick re-evaluates even though no mid moved
+        strategy.portfolio.net_position.return_value = 0.0
+        strategy._on_portfolio_position_event(MagicMock(spec_set=[]))
+        strategy.on_quote_tick(SECONDARY_Q)
+        strategy.submit_order.assert_called_once()
+
+        # Re-armed once only: a further unchanged tick is skipped again
+        strategy.on_quote_tick(SECONDARY_Q)
+        strategy.submit_order.assert_called_once()
+
+    def test_net_positions_cached_until_position_event(self, make_strategy):
+        strategy = make_strategy()
+        strategy.portfolio = MagicMock(spec_set=["net_position"])
+        strategy.portfolio.net_position.return_value = 0.0
+
+        assert strategy._can_trade()
+        assert strategy._can_trade()
+        assert strategy.portfolio.net_position.call_count == 2  # One lookup per venue
+
+        strategy.portfolio.net_position.return_value = 5.0
+        assert strategy._can_trade()  # Stale until a position event arrives
+        strategy._on_portfolio_position_event(MagicMock(spec_set=[]))
+        assert not strategy._can_trade()
+
+    def test_spread_history_wraps_at_capacity(self, multi_venue, make_strategy):
+        strategy = make_strategy(min_spread_bps=1_000.0)
+
+        strategy.on_quote_tick(PRIMARY_Q)
+        for i in range(multi_venue.SPREAD_HISTORY_LEN + 5):
+            strategy.on_quote_tick(
+                self._make_quote("BTCUSDT-PERP.BYBIT", 50_050.0 + i, 50_051.0 + i)
+            )
+
+        assert strategy._spread_idx == multi_venue.SPREAD_HISTORY_LEN + 5
+        assert len(strategy.spread_view) == multi_venue.SPREAD_HISTORY_LEN
+
+    def test_unknown_instrument_ignored(self, make_strategy):
+        strategy = make_strategy()
 
-        strategy.on_quote_tick(primary_q)
-        strategy.on_quote_tick(secondary_q)
-        strategy.on_quote_tick(secondary_q)  # Second update
+        strategy.on_quote_tick(self._make_quote("ETHUSDT-PERP.BINANCE", 3_000.0, 3_001.0))
 
-        assert len(strategy._spread_history) == 2
+        assert strategy._primary_quote is None
+        assert strategy._secondary_quote is None